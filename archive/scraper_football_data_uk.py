@@ -4,10 +4,15 @@ Fuente única y confiable para TODAS las temporadas
 """
 
 import pandas as pd
-import requests
 import time
 import logging
 from io import StringIO
+import sys
+from pathlib import Path
+
+# Transporte HTTP compartido con los scrapers actuales (pool keep-alive + reintentos)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from http_client import get_client  # noqa: E402
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
@@ -31,7 +36,7 @@ def download_season(season):
     url = get_football_data_url(season)
     
     try:
-        response = requests.get(url, timeout=10)
+        response = get_client().get(url, timeout=10)
         
         if response.status_code != 200:
             logger.warning(f"  ✗ {season}: HTTP {response.status_code}")
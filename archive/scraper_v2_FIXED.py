@@ -3,13 +3,18 @@ Premier League Scraper v2.0 - FIX para tablas EN
 Corrige el problema de columnas shifted en Wikipedia inglés
 """
 
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import time
 from typing import Optional
 import logging
+import sys
+from pathlib import Path
+
+# Transporte HTTP compartido con los scrapers actuales (pool keep-alive + reintentos)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from http_client import get_client  # noqa: E402
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -232,7 +237,7 @@ class PremierLeagueScraper:
     def _scrape_wikipedia_page(self, url: str, season: str, lang: str) -> Optional[pd.DataFrame]:
         """Extrae datos de una página de Wikipedia"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = get_client().get(url, headers=self.headers, timeout=10)
             response.encoding = 'utf-8'
             soup = BeautifulSoup(response.text, 'html.parser')
             
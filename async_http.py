@@ -0,0 +1,157 @@
+"""
+Cliente HTTP asíncrono (asyncio) para descargar muchas URLs a la vez
+
+Con las cinco divisiones la descarga ya se hace en paralelo con hilos, pero al
+añadir los códigos de liga de la Fase 5 del ROADMAP el tiempo lo domina la
+latencia de red. AsyncHTTPClient lanza todas las peticiones desde un único
+bucle de eventos, limitadas por un semáforo compartido (cortesía con el
+servidor) y por el TokenBucket de cada host.
+
+- Con aiohttp instalado, las peticiones son asíncronas de verdad
+- Sin aiohttp, cada petición se delega a un hilo (run_in_executor) sobre el
+  HTTPClient compartido, con su pool keep-alive
+
+En los dos casos se aplican los mismos reintentos, backoff y métricas que en
+http_client (RETRY_STATUS, HTTPClient.backoff_delay, RequestMetrics).
+requests y aiohttp se importan al hacer la primera petición.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from http_client import DEFAULT_TIMEOUT, RETRY_STATUS, get_client
+
+logger = logging.getLogger(__name__)
+
+# Peticiones simultáneas por defecto (entre todas las divisiones)
+DEFAULT_CONCURRENCY = 8
+
+_aiohttp_available = None
+
+
+def aiohttp_available():
+    """True si aiohttp está instalado (se comprueba una sola vez)"""
+    global _aiohttp_available
+    if _aiohttp_available is None:
+        try:
+            import aiohttp  # noqa: F401
+            _aiohttp_available = True
+        except ImportError:
+            _aiohttp_available = False
+    return _aiohttp_available
+
+
+def _as_requests_response(url, status, headers, content):
+    """requests.Response equivalente a una respuesta de aiohttp (mismo encoding que requests)"""
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+class AsyncHTTPClient:
+    """
+    GET asíncrono con semáforo compartido, límite por host y reintentos
+
+    Uso:
+        async with AsyncHTTPClient() as http:
+            responses = await asyncio.gather(*(http.get(url) for url in urls))
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, client=None, use_aiohttp=None):
+        """
+        Args:
+            concurrency (int): Peticiones simultáneas como máximo
+            client (HTTPClient): Política de reintentos y métricas (y transporte sin
+                aiohttp). None = cliente compartido de get_client()
+            use_aiohttp (bool): Forzar o desactivar aiohttp (None = si está instalado)
+        """
+        self.concurrency = max(1, concurrency)
+        self.client = client or get_client()
+        self.use_aiohttp = aiohttp_available() if use_aiohttp is None else use_aiohttp
+        self.semaphore = None
+        self.session = None
+        self.executor = None
+
+    async def __aenter__(self):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        if self.use_aiohttp:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            self.session = aiohttp.ClientSession(connector=connector, headers=dict(self.client.session.headers))
+        else:
+            # Executor propio: el de asyncio por defecto tiene pocos hilos en máquinas pequeñas
+            self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='async-http')
+        return self
+
+    async def __aexit__(self, *exc):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def get(self, url, timeout=DEFAULT_TIMEOUT, headers=None, limiter=None):
+        """
+        GET con reintentos (corrutina compatible con requests.get)
+
+        Args:
+            url (str): URL a descargar
+            timeout (float): Timeout de cada intento
+            headers (dict): Cabeceras de la petición (e.g., If-None-Match)
+            limiter (TokenBucket): Límite de tasa del host, aplicado a cada intento
+
+        Returns:
+            requests.Response
+        """
+        if not self.use_aiohttp:
+            throttle = limiter.acquire if limiter is not None else None
+            fetch = partial(self.client.get, url, timeout=timeout, headers=headers, throttle=throttle)
+            async with self.semaphore:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, fetch)
+        return await self._get_aiohttp(url, timeout, headers, limiter)
+
+    async def _get_aiohttp(self, url, timeout, headers, limiter):
+        """Mismo bucle de reintentos que HTTPClient.get, sobre aiohttp"""
+        import aiohttp
+        import requests
+
+        client = self.client
+        elapsed = 0.0
+        for attempt in range(client.retries + 1):
+            if limiter is not None:
+                await limiter.acquire_async()
+            async with self.semaphore:
+                start = time.perf_counter()
+                try:
+                    async with self.session.get(url, headers=headers,
+                                                timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                        content = await resp.read()
+                        response = _as_requests_response(url, resp.status, resp.headers, content)
+                except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    elapsed += time.perf_counter() - start
+                    if attempt == client.retries:
+                        client.metrics.record(url, None, attempt + 1, elapsed, error=type(e).__name__)
+                        raise requests.ConnectionError(f"{type(e).__name__}: {e}") from e
+                    reason = type(e).__name__
+                else:
+                    elapsed += time.perf_counter() - start
+                    if response.status_code not in RETRY_STATUS or attempt == client.retries:
+                        client.metrics.record(url, response.status_code, attempt + 1, elapsed, len(content))
+                        return response
+                    reason = f"HTTP {response.status_code}"
+
+            delay = client.backoff_delay(attempt)
+            logger.info(f"  ↻ {url}: {reason}, reintento {attempt + 1}/{client.retries} en {delay:.1f}s")
+            await asyncio.sleep(delay)
@@ -0,0 +1,136 @@
+"""
+Benchmark y paridad del backend asyncio de descarga (fetch_pyramid_async)
+
+Levanta un servidor HTTP local que añade una latencia fija a cada respuesta
+(como la de football-data.co.uk desde fuera de Reino Unido) y descarga todas
+las temporadas de una pirámide ampliada: las cinco divisiones inglesas más
+los códigos de la Fase 5 del ROADMAP (SP1, SP2, I1, I2, D1, D2, F1, F2).
+Sin caché y sin límite de tasa, para medir solo el transporte.
+
+Paridad:
+    - Los bytes descargados por (división, temporada) son idénticos con hilos y
+      con asyncio, y las clasificaciones resultantes también
+
+Rendimiento:
+    - Hilos, una división tras otra (max_workers por división, como el pipeline)
+    - Hilos con tantos workers por división como concurrencia asíncrona
+    - asyncio: toda la pirámide a la vez con un semáforo compartido
+
+Uso:
+    python benchmarks/bench_async.py [--latency 80] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from common import Timer, synthetic_raw_csv
+
+import scraper_english_leagues as sel
+from async_http import aiohttp_available
+
+# Códigos de la pirámide inglesa y de la Fase 5 (ligas europeas)
+LEAGUE_CODES = ['E0', 'E1', 'E2', 'E3', 'EC', 'SP1', 'SP2', 'I1', 'I2', 'D1', 'D2', 'F1', 'F2']
+
+
+class LatencyServer(ThreadingHTTPServer):
+    """Servidor local que responde el mismo CSV tras `latency` segundos"""
+
+    daemon_threads = True
+
+    def __init__(self, payload, latency):
+        super().__init__(('127.0.0.1', 0), LatencyHandler)
+        self.payload = payload
+        self.latency = latency
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        body = self.server.payload
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SyntheticLeagueScraper(sel.EnglishLeagueScraper):
+    """Scraper de un código de liga cualquiera contra el servidor local (sin caché ni límite)"""
+
+    def __init__(self, code, base_url):
+        super().__init__(division_name=code, division_code=code, expected_teams=24)
+        self.base_url = base_url
+        self.cache = None
+        self.requests_per_second = 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=80, help='Latencia por respuesta (ms)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Peticiones simultáneas (asyncio)')
+    parser.add_argument('--workers', type=int, default=sel.DEFAULT_MAX_WORKERS, help='Hilos por división')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    server = LatencyServer(synthetic_raw_csv(rng), args.latency / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    scrapers = [SyntheticLeagueScraper(code, server.url) for code in LEAGUE_CODES]
+    n_requests = sum(len(scraper.get_seasons()) for scraper in scrapers)
+
+    variants = {
+        f'Hilos ({args.workers}/división)':
+            lambda: [scraper.fetch_all_seasons(args.workers) for scraper in scrapers],
+        f'Hilos ({args.concurrency}/división)':
+            lambda: [scraper.fetch_all_seasons(args.concurrency) for scraper in scrapers],
+        f'asyncio ({args.concurrency} en total)':
+            lambda: asyncio.run(sel.fetch_pyramid_async(scrapers, args.concurrency)),
+    }
+
+    print("="*70)
+    print(f"BENCHMARK - {len(scrapers)} ligas, {n_requests} peticiones, latencia {args.latency:.0f}ms")
+    print(f"Transporte asyncio: {'aiohttp' if aiohttp_available() else 'hilos (aiohttp no instalado)'}")
+    print("="*70)
+    print(f"{'Variante':<28} {'Total':>8} {'Peticiones/s':>13}")
+    results = {}
+    for name, fetch in variants.items():
+        timer = Timer()
+        with timer.measure():
+            results[name] = fetch()
+        print(f"{name:<28} {timer.elapsed:>7.2f}s {n_requests / timer.elapsed:>13.1f}")
+
+    print("\n" + "="*70)
+    print("PARIDAD")
+    print("="*70)
+    reference, *others = results.values()
+    same_bytes = all(other == reference for other in others)
+    complete = all(raw is not None for raw_seasons in reference for _, raw in raw_seasons)
+    threads_tables, _ = scrapers[0].process_seasons(reference[0])
+    async_tables, _ = scrapers[0].process_seasons(results[list(results)[-1]][0])
+    same_tables = threads_tables.equals(async_tables)
+    failures = 0
+    for name, ok in (('bytes por temporada', same_bytes and complete), ('clasificaciones', same_tables)):
+        failures += not ok
+        print(f"  {name:<28} {'✓' if ok else '✗'}")
+
+    server.shutdown()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
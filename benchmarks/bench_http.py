@@ -0,0 +1,202 @@
+"""
+Benchmark y paridad del transporte HTTP compartido (http_client.HTTPClient)
+
+Levanta un servidor HTTP local "inestable" que imita los fallos transitorios
+de football-data.co.uk:
+    - /flaky/...: responde 503 las dos primeras veces
+    - /slow/...: la primera vez tarda más que el timeout del cliente
+    - /drop/...: la primera vez cierra la conexión sin responder
+    - /missing.csv: 404 (no se debe reintentar)
+
+Paridad:
+    - HTTPClient obtiene el mismo contenido que el servidor en todos los casos
+      transitorios; requests.get suelto falla en cada uno
+    - Los 404 no se reintentan y las métricas cuentan los reintentos
+    - HTTPCache.get con el cliente como http_get guarda el contenido correcto
+
+Rendimiento:
+    - Peticiones secuenciales y con hilos: requests.get suelto (conexión nueva
+      cada vez) frente a la sesión con pool keep-alive; conexiones TCP abiertas
+
+Uso:
+    python benchmarks/bench_http.py [--requests 200] [--workers 4]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import requests
+
+from common import Timer, synthetic_raw_csv
+
+from http_cache import HTTPCache
+from http_client import HTTPClient
+
+# Timeout del cliente en la prueba de /slow (el servidor tarda SLOW_DELAY la primera vez)
+CLIENT_TIMEOUT = 0.2
+SLOW_DELAY = 0.5
+
+FAILURES = {'flaky': 2, 'slow': 1, 'drop': 1}
+
+
+class FlakyServer(ThreadingHTTPServer):
+    """Servidor local con fallos transitorios por ruta y contador de conexiones"""
+
+    daemon_threads = True
+
+    def __init__(self, payload):
+        super().__init__(('127.0.0.1', 0), FlakyHandler)
+        self.payload = payload
+        self.hits = Counter()
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 para que las conexiones se mantengan abiertas (keep-alive)
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def send_payload(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits[self.path] += 1
+            hit = self.server.hits[self.path]
+        kind = self.path.split('/')[1]
+
+        if self.path == '/missing.csv':
+            self.send_payload(404, b'not found')
+        elif kind in FAILURES and hit <= FAILURES[kind]:
+            if kind == 'flaky':
+                self.send_payload(503, b'busy')
+            elif kind == 'slow':
+                time.sleep(SLOW_DELAY)
+                try:
+                    self.send_payload(200, self.server.payload)
+                except OSError:
+                    pass
+            else:
+                self.close_connection = True
+        else:
+            self.send_payload(200, self.server.payload)
+
+
+def bare_get(url):
+    """Descarga original: requests.get suelto; None si falla"""
+    try:
+        response = requests.get(url, timeout=CLIENT_TIMEOUT)
+    except requests.RequestException:
+        return None
+    return response.content if response.status_code == 200 else None
+
+
+def check_parity(server):
+    """Casos de fallo transitorio: (nombre, ok) por caso"""
+    client = HTTPClient(backoff=0.01)
+    results = []
+    for i, kind in enumerate(FAILURES):
+        # Rutas distintas: cada una falla sus primeras peticiones
+        bare_ok = bare_get(f"{server.url}/{kind}/bare-{i}.csv") is None
+        content = client.get(f"{server.url}/{kind}/{i}.csv", timeout=CLIENT_TIMEOUT).content
+        results.append((f"{kind} (falla {FAILURES[kind]}x)", bare_ok and content == server.payload))
+
+    response = client.get(f"{server.url}/missing.csv", timeout=CLIENT_TIMEOUT)
+    metrics = client.metrics.to_frame()
+    not_retried = response.status_code == 404 and metrics['Intentos'].iloc[-1] == 1
+    results.append(('404 sin reintentos', not_retried))
+    results.append(('métricas: reintentos', client.metrics.summary()['Reintentos'] == sum(FAILURES.values())))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = HTTPCache(cache_dir)
+        url = f"{server.url}/flaky/cache.csv"
+        first = cache.get(url, http_get=client.get)
+        again = cache.get(url, immutable=True, http_get=client.get)
+        results.append(('HTTPCache + cliente', first.content == server.payload and again.from_cache))
+
+    client.close()
+    return results
+
+
+def run(server, fetch, urls, workers):
+    """Descarga las URLs (secuencial o con hilos); devuelve (segundos, conexiones abiertas)"""
+    before = server.connections
+    timer = Timer()
+    with timer.measure():
+        if workers == 1:
+            for url in urls:
+                fetch(url)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(fetch, urls))
+    return timer.elapsed, server.connections - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    server = FlakyServer(synthetic_raw_csv(rng))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print("="*70)
+    print("PARIDAD")
+    print("="*70)
+    failures = 0
+    for name, ok in check_parity(server):
+        failures += not ok
+        print(f"  {name:<28} {'✓' if ok else '✗'}")
+
+    print("\n" + "="*70)
+    print(f"BENCHMARK - {args.requests} peticiones, CSV de {len(server.payload) / 1e3:.0f} KB")
+    print("="*70)
+    urls = [f"{server.url}/ok/{i}.csv" for i in range(args.requests)]
+    print(f"{'Variante':<30} {'Total':>8} {'ms/petición':>12} {'Conexiones':>11}")
+    for workers in (1, args.workers):
+        label = 'secuencial' if workers == 1 else f'{workers} hilos'
+        client = HTTPClient()
+        variants = {
+            f'requests.get ({label})': lambda url: requests.get(url, timeout=10),
+            f'HTTPClient ({label})': lambda url: client.get(url, timeout=10),
+        }
+        for name, fetch in variants.items():
+            elapsed, connections = run(server, fetch, urls, workers)
+            print(f"{name:<30} {elapsed:>7.2f}s {elapsed / len(urls) * 1000:>11.2f} {connections:>11}")
+        summary = client.metrics.summary()
+        print(f"{'  latencia HTTPClient':<30} p50 {summary['p50_ms']:.2f}ms  p95 {summary['p95_ms']:.2f}ms  "
+              f"máx {summary['max_ms']:.2f}ms")
+        client.close()
+
+    server.shutdown()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Benchmark del coste de arranque: importar los módulos del proyecto
+
+Cada módulo se importa en un intérprete nuevo con `python -X importtime`,
+desde un directorio vacío, y se desglosa el tiempo de las dependencias
+pesadas (pandas, requests, asyncio, multiprocessing...). Se repite --repeat
+veces y se muestra la mediana.
+
+Paridad (importar no tiene efectos secundarios):
+    - No se crea ningún fichero ni directorio (logs/, cache/...)
+    - El logger raíz sigue sin handlers y no se escribe nada por consola
+    - Los scrapers no cargan requests ni multiprocessing hasta que se usan
+
+Uso:
+    python benchmarks/bench_importtime.py [--repeat 5] [--modules standings scraper_english_leagues]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import REPO_ROOT
+
+MODULES = ['standings', 'cli', 'scraper_english_leagues', 'scraper_premier_league',
+           'verificar_datos', 'verificar_english_leagues']
+
+# Dependencias cuyo tiempo de importación se desglosa (acumulado, ms)
+DEPENDENCIES = ['numpy', 'pandas', 'pyarrow', 'requests', 'asyncio', 'multiprocessing', 'sqlite3']
+
+# Dependencias que solo se cargan al descargar o al usar el pool de procesos
+LAZY_DEPENDENCIES = ['requests', 'multiprocessing']
+
+# Tras importar: handlers del logger raíz y dependencias perezosas ya cargadas
+PROBE = """
+import logging, sys
+import {module}
+print(len(logging.getLogger().handlers))
+print(' '.join(name for name in {lazy!r} if name in sys.modules))
+"""
+
+
+def python_env():
+    return dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+
+
+def parse_importtime(stderr):
+    """
+    Tiempos de `python -X importtime` por módulo (primera aparición)
+
+    Returns:
+        dict: {módulo: (propio_ms, acumulado_ms)}
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times.setdefault(name.strip(), (int(self_us) / 1000, int(cumulative_us) / 1000))
+    return times
+
+
+def profile_import(module, workdir):
+    """
+    Importa `module` en un intérprete nuevo
+
+    Returns:
+        tuple: (tiempo de pared en s, {módulo: (propio_ms, acumulado_ms)})
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=workdir, env=python_env(), capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, parse_importtime(result.stderr)
+
+
+def probe_side_effects(module):
+    """
+    Importa `module` en un directorio vacío y devuelve lo que ha dejado
+
+    Returns:
+        dict: ficheros creados, handlers del logger raíz, salida por consola y
+        dependencias perezosas cargadas
+    """
+    with tempfile.TemporaryDirectory(prefix='bench_importtime_') as workdir:
+        result = subprocess.run([sys.executable, '-c', PROBE.format(module=module, lazy=LAZY_DEPENDENCIES)],
+                                cwd=workdir, env=python_env(), capture_output=True, text=True, check=True)
+        created = sorted(path.name for path in Path(workdir).iterdir())
+    *output, handlers, lazy = result.stdout.split('\n')[:-1]
+    return {
+        'files': created,
+        'handlers': int(handlers),
+        'output': output + result.stderr.splitlines(),
+        'lazy': lazy.split(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--modules', nargs='+', default=MODULES)
+    args = parser.parse_args()
+
+    print("="*70)
+    print(f"BENCHMARK - importación en un intérprete nuevo (mediana de {args.repeat})")
+    print("="*70)
+    header = f"{'Módulo':<28} {'Proceso':>8} {'Import':>8} {'Propio':>7}"
+    print(header + ''.join(f" {name[:9]:>9}" for name in DEPENDENCIES))
+
+    with tempfile.TemporaryDirectory(prefix='bench_importtime_') as workdir:
+        # Una importación previa para que las siguientes no midan la compilación a .pyc
+        for module in args.modules:
+            profile_import(module, workdir)
+        for module in args.modules:
+            runs = [profile_import(module, workdir) for _ in range(args.repeat)]
+            wall = statistics.median(elapsed for elapsed, _ in runs) * 1000
+
+            def median(name, field):
+                values = [times[name][field] for _, times in runs if name in times]
+                return statistics.median(values) if values else None
+
+            row = (f"{module:<28} {wall:>6.0f}ms {median(module, 1):>6.0f}ms "
+                   f"{median(module, 0):>5.0f}ms")
+            for name in DEPENDENCIES:
+                value = median(name, 1)
+                row += f" {value:>7.0f}ms" if value is not None else f" {'-':>9}"
+            print(row)
+
+    print("\n" + "="*70)
+    print("PARIDAD (importar sin efectos secundarios)")
+    print("="*70)
+    failures = 0
+    for module in args.modules:
+        effects = probe_side_effects(module)
+        checks = {
+            'sin ficheros': not effects['files'],
+            'sin handlers': effects['handlers'] == 0,
+            'sin salida': not effects['output'],
+            'sin requests/multiprocessing': not effects['lazy'],
+        }
+        failures += not all(checks.values())
+        marks = '  '.join(f"{name} {'✓' if ok else '✗'}" for name, ok in checks.items())
+        print(f"  {module:<26} {marks}")
+        for name in effects['files'] + effects['lazy']:
+            print(f"      ✗ {name}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
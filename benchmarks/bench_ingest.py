@@ -0,0 +1,184 @@
+"""
+Benchmark y paridad de la lectura de CSV en una pasada (csv_ingest.read_matches_csv)
+
+Paridad:
+    - CSV sintéticos con filas mal formadas, comillas, latin-1 y BOM: los partidos
+      limpios (HomeTeam, AwayTeam, FTHG, FTAG, FTR) son idénticos a los de la lectura
+      original con reintentos, y las filas descartadas coinciden
+    - Los CSV crudos guardados en la caché local, si existen
+    - coerce_goals da el mismo entero que safe_int_conversion celda a celda
+      (columnas enteras, decimales y texto sucio)
+
+Rendimiento (tiempo y pico de memoria con tracemalloc):
+    - Original: response.text + hasta cuatro pd.read_csv sobre StringIO
+    - Una pasada sobre los bytes, solo columnas de clasificación (usecols)
+    - Una pasada sobre los bytes, todas las columnas (almacén de partidos)
+    - Goles: .apply(safe_int_conversion) frente a coerce_goals por columna
+
+Uso:
+    python benchmarks/bench_ingest.py [--files 100] [--bad-lines 3]
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from common import REPO_ROOT, Timer, legacy_parse_csv, synthetic_raw_csv
+
+import scraper_english_leagues as sel
+from csv_ingest import STANDINGS_INPUT_COLUMNS, coerce_goals, read_matches_csv, safe_int_conversion
+
+# Encoding con el que requests decodifica text/csv sin charset (y el que guarda la caché)
+LEGACY_TEXT_ENCODING = 'ISO-8859-1'
+
+CASES = {
+    'limpio': {},
+    'filas mal formadas': {'bad_lines': 5},
+    'comillas + mal formadas': {'quoted': True, 'bad_lines': 3},
+    'latin-1': {'latin1': True},
+    'BOM UTF-8': {'bom': True},
+}
+
+# Celdas de goles que aparecen (o podrían aparecer) en CSV con errores
+MESSY_GOALS = [' 2', '2 ', '2.0', '1.5', '', 'abc', '3a', '1.2.3', '.', '-1', '1e2', '٣', '²', None, np.nan]
+
+
+def goal_columns(rng, n_rows):
+    """Columnas de goles: enteras, con nulos (float) y texto con celdas sucias"""
+    goals = rng.poisson(1.4, n_rows)
+    with_nan = pd.Series(goals, dtype='float64')
+    with_nan[rng.choice(n_rows, n_rows // 50, replace=False)] = np.nan
+    text = pd.Series(goals.astype(str), dtype=object)
+    messy_rows = rng.choice(n_rows, n_rows // 20, replace=False)
+    text[messy_rows] = rng.choice(np.array(MESSY_GOALS, dtype=object), len(messy_rows))
+    return {
+        'enteros': pd.Series(goals),
+        'con nulos': with_nan,
+        'texto sucio': text,
+        'casos límite': pd.Series(MESSY_GOALS + ['0', '10', '.5', '7.9'], dtype=object),
+    }
+
+
+def clean_matches(df, scraper):
+    """Misma limpieza que parse_matches tras la lectura"""
+    df = df.dropna(subset=['HomeTeam', 'AwayTeam'], how='any')
+    df = df.assign(
+        HomeTeam=df['HomeTeam'].apply(scraper.clean_team_name),
+        AwayTeam=df['AwayTeam'].apply(scraper.clean_team_name),
+    ).dropna(subset=['HomeTeam', 'AwayTeam'])
+    df = df.assign(
+        FTHG=df['FTHG'].apply(scraper.safe_int_conversion),
+        FTAG=df['FTAG'].apply(scraper.safe_int_conversion),
+    )
+    df = df[df['FTR'].isin(['H', 'D', 'A'])]
+    return df[STANDINGS_INPUT_COLUMNS].astype(object).reset_index(drop=True)
+
+
+def check_parity(raw, scraper, expected_skipped=None):
+    legacy = legacy_parse_csv(raw.decode(LEGACY_TEXT_ENCODING))
+    current, skipped, _ = read_matches_csv(raw, STANDINGS_INPUT_COLUMNS)
+    same = clean_matches(legacy, scraper).equals(clean_matches(current, scraper))
+    if expected_skipped is not None:
+        same = same and skipped == expected_skipped
+    return same, skipped
+
+
+def cached_raw_files(limit):
+    """CSV crudos de la caché local (si se ha ejecutado algún scraper)"""
+    objects = REPO_ROOT / 'cache' / 'football_data' / 'objects'
+    if not objects.exists():
+        return []
+    return [path.read_bytes() for path in sorted(objects.glob('*/*'))[:limit]]
+
+
+def measure(func, files):
+    """Tiempo total y pico de memoria medio por archivo"""
+    timer = Timer()
+    with timer.measure():
+        for raw in files:
+            func(raw)
+
+    peaks = []
+    for raw in files[:10]:
+        tracemalloc.start()
+        func(raw)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return timer.elapsed, float(np.mean(peaks))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=100, help='Archivos sintéticos en el benchmark')
+    parser.add_argument('--bad-lines', type=int, default=3,
+                        help='Filas mal formadas por archivo (fuerzan los reintentos del original)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    scraper = sel.ChampionshipScraper()
+
+    print("="*70)
+    print("PARIDAD")
+    print("="*70)
+    failures = 0
+    for name, options in CASES.items():
+        ok, skipped = check_parity(synthetic_raw_csv(rng, **options), scraper, options.get('bad_lines', 0))
+        failures += not ok
+        print(f"  {name:<26} descartadas: {skipped:>2}  {'✓' if ok else '✗'}")
+
+    cached = cached_raw_files(limit=200)
+    if cached:
+        cached_ok = sum(check_parity(raw, scraper)[0] for raw in cached)
+        failures += len(cached) - cached_ok
+        print(f"  {'caché local':<26} {cached_ok}/{len(cached)} idénticos")
+
+    for name, values in goal_columns(rng, 10_000).items():
+        goals, coerced = coerce_goals(values)
+        ok = goals.tolist() == values.apply(safe_int_conversion).tolist()
+        failures += not ok
+        print(f"  goles: {name:<19} corregidas: {int(coerced.sum()):>4}  {'✓' if ok else '✗'}")
+
+    print("\n" + "="*70)
+    print(f"BENCHMARK - {args.files} archivos sintéticos ({args.bad_lines} filas mal formadas c/u)")
+    print("="*70)
+    files = [synthetic_raw_csv(rng, bad_lines=args.bad_lines) for _ in range(args.files)]
+    size_mb = sum(len(raw) for raw in files) / 1e6
+
+    variants = {
+        'Original (reintentos)': lambda raw: legacy_parse_csv(raw.decode(LEGACY_TEXT_ENCODING)),
+        'Una pasada, usecols': lambda raw: read_matches_csv(raw, STANDINGS_INPUT_COLUMNS),
+        'Una pasada, todas': lambda raw: read_matches_csv(raw),
+    }
+    print(f"{'Variante':<24} {'Total':>8} {'ms/archivo':>11} {'MB/s':>7} {'Pico memoria':>13}")
+    for name, func in variants.items():
+        elapsed, peak = measure(func, files)
+        print(f"{name:<24} {elapsed:>7.2f}s {elapsed / len(files) * 1000:>10.2f} "
+              f"{size_mb / elapsed:>7.1f} {peak / 1e6:>10.2f} MB")
+
+
+    print("\n" + "="*70)
+    print(f"BENCHMARK GOLES - {args.files} columnas de 552 partidos (por temporada y concatenadas)")
+    print("="*70)
+    print(f"{'Columna':<24} {'apply':>10} {'coerce_goals':>13} {'Mejora':>8}")
+    columns = [goal_columns(rng, 552) for _ in range(args.files)]
+    for name in ('enteros', 'con nulos', 'texto sucio'):
+        per_season = [column[name] for column in columns]
+        for label, batch in ((name, per_season), (f'{name} (concat.)', [pd.concat(per_season, ignore_index=True)])):
+            apply_timer, vector_timer = Timer(), Timer()
+            for values in batch:
+                with apply_timer.measure():
+                    values.apply(safe_int_conversion)
+                with vector_timer.measure():
+                    coerce_goals(values)
+            print(f"{label:<24} {apply_timer.elapsed * 1000:>8.1f}ms {vector_timer.elapsed * 1000:>11.1f}ms "
+                  f"{apply_timer.elapsed / vector_timer.elapsed:>7.1f}x")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
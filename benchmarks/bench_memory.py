@@ -0,0 +1,100 @@
+"""
+Benchmark y paridad de los tipos compactos (standings.compact_standings)
+
+Paridad:
+    - El CSV exportado desde la clasificación compacta (category + int16, Dif
+      numérico formateado en export_standings) es idéntico, byte a byte, al de
+      la clasificación con los tipos originales (object + int64 + Dif texto)
+    - El tracking largo construido desde una u otra da el mismo CSV
+
+Memoria por etapa (memory_report, deep=True):
+    - Partidos: HomeTeam/AwayTeam como texto frente a Categorical del registro
+    - Dataset combinado: tipos originales frente a compactos
+    - Tracking largo construido desde cada uno
+
+Uso:
+    python benchmarks/bench_memory.py [--leagues 5] [--seasons 32]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import synthetic_pyramid, synthetic_season
+
+from memory_report import MemoryReport
+from standings import compact_standings, export_standings, format_dif
+from team_registry import normalize_team_columns
+from tracking_store import build_tracking_long
+
+
+def legacy_standings(rng, n_leagues, n_seasons):
+    """Dataset combinado con los tipos originales (Dif como texto '+42')"""
+    standings, divisions = synthetic_pyramid(rng, n_leagues=n_leagues, n_seasons=n_seasons)
+    standings['GF'] = rng.integers(30, 100, len(standings))
+    standings['GC'] = rng.integers(30, 100, len(standings))
+    standings['Dif'] = format_dif(standings['GF'] - standings['GC'])
+    return standings, divisions
+
+
+def synthetic_matches(rng, n_leagues, n_seasons):
+    """Partidos de la pirámide con nombres de equipo como texto"""
+    frames = [
+        synthetic_season(rng, prefix=f'Club {l:02d}').assign(Division=f'League {l + 1:02d}', Temporada=str(s))
+        for s in range(n_seasons) for l in range(n_leagues)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--leagues', type=int, default=5)
+    parser.add_argument('--seasons', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    legacy, divisions = legacy_standings(rng, args.leagues, args.seasons)
+    compact = compact_standings(legacy.assign(
+        Dif=pd.to_numeric(legacy['Dif'].str.replace('+', '', regex=False))
+    ))
+    legacy_long = build_tracking_long(legacy, divisions)
+    compact_long = build_tracking_long(compact, divisions)
+
+    print("="*70)
+    print("PARIDAD")
+    print("="*70)
+    failures = 0
+    checks = {
+        'CSV clasificaciones': legacy.to_csv(index=False) == export_standings(compact).to_csv(index=False),
+        'CSV tracking largo': legacy_long.to_csv(index=False) == compact_long.to_csv(index=False),
+    }
+    for name, ok in checks.items():
+        failures += not ok
+        print(f"  {name:<28} {'✓' if ok else '✗'}")
+
+    matches = synthetic_matches(rng, args.leagues, args.seasons)
+    stages = {
+        'Partidos': (matches, normalize_team_columns(matches)),
+        'Dataset combinado': (legacy, compact),
+        'Tracking largo': (legacy_long, compact_long),
+    }
+    before, after = MemoryReport(), MemoryReport()
+    for stage, (original, compacted) in stages.items():
+        before.record(stage, original)
+        after.record(stage, compacted)
+
+    print("\n" + "="*70)
+    print(f"MEMORIA - {args.leagues} ligas × {args.seasons} temporadas, {len(legacy):,} filas")
+    print("="*70)
+    print(f"{'Etapa':<24} {'Original':>10} {'Compacto':>10} {'Reducción':>10}")
+    for old, new in zip(before.to_frame().itertuples(), after.to_frame().itertuples()):
+        print(f"{old.Etapa:<24} {old.MB:>8.2f}MB {new.MB:>8.2f}MB {old.MB / new.MB:>9.1f}x")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Benchmark de escalado del parseo + clasificaciones en un pool de procesos
+
+Corpus sintético de muchas ligas y temporadas ya descargadas (CSV crudos con
+~100 columnas, como football-data.co.uk). Cada variante procesa todas las
+(liga, temporada) con process_seasons:
+    - En este proceso (como hasta ahora, un solo núcleo)
+    - Pool de 1..N procesos, CSV crudos por memoria compartida (SharedBlobs)
+    - Pool de N procesos enviando los bytes por pickle (referencia del coste
+      de serializar)
+
+Paridad:
+    - Las clasificaciones de todas las variantes son idénticas
+
+Uso:
+    python benchmarks/bench_processes.py [--leagues 50] [--seasons 60] [--processes 1 2 4]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+
+from common import Timer, synthetic_raw_csv
+
+import scraper_english_leagues as sel
+from parallel import process_pool
+
+
+class SyntheticLeagueScraper(sel.EnglishLeagueScraper):
+    """Liga sintética de 24 equipos sin caché ni almacén de partidos"""
+
+    def __init__(self, index, n_seasons):
+        super().__init__(division_name=f'League {index:02d}', division_code=f'L{index:02d}',
+                         expected_teams=24, start_year=2025 - n_seasons, end_year=2025)
+        self.cache = None
+
+
+def parse_pickled(scraper, season, raw):
+    """Trabajo equivalente a _parse_season_job con los bytes enviados por pickle"""
+    return scraper.parse_season(raw, season)
+
+
+def run_pickled(executor, corpus):
+    """process_seasons con los CSV crudos serializados en cada trabajo"""
+    results = []
+    for scraper, raw_seasons in corpus:
+        futures = [executor.submit(parse_pickled, scraper, season, raw) for season, raw in raw_seasons]
+        seasons = [season for season, _ in raw_seasons]
+        results.append(scraper.combine_seasons(seasons, [future.result() for future in futures]))
+    return results
+
+
+def default_process_counts():
+    """1, 2, 4... hasta el número de núcleos (al menos 1 y 2)"""
+    counts, n = [], 1
+    while n <= max(os.cpu_count() or 1, 2):
+        counts.append(n)
+        n *= 2
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--leagues', type=int, default=50)
+    parser.add_argument('--seasons', type=int, default=60)
+    parser.add_argument('--processes', type=int, nargs='+', default=default_process_counts())
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    # Sin una línea de log por temporada
+    sel.logger.setLevel(logging.WARNING)
+
+    rng = np.random.default_rng(args.seed)
+    corpus = []
+    for index in range(args.leagues):
+        scraper = SyntheticLeagueScraper(index, args.seasons)
+        raw = synthetic_raw_csv(rng)
+        corpus.append((scraper, [(season, raw) for season in scraper.get_seasons()]))
+    n_jobs = args.leagues * args.seasons
+    size_mb = sum(len(raw) for _, raw_seasons in corpus for _, raw in raw_seasons) / 1e6
+
+    print("="*70)
+    print(f"BENCHMARK - {args.leagues} ligas × {args.seasons} temporadas ({n_jobs} trabajos, "
+          f"{size_mb:.0f} MB de CSV), {os.cpu_count()} núcleos")
+    print("="*70)
+    print(f"{'Variante':<34} {'Total':>8} {'ms/temporada':>13} {'Aceleración':>12}")
+
+    results = {}
+    timer = Timer()
+    with timer.measure():
+        results['En este proceso'] = [scraper.process_seasons(raw_seasons) for scraper, raw_seasons in corpus]
+    baseline = timer.elapsed
+    print(f"{'En este proceso':<34} {baseline:>7.2f}s {baseline / n_jobs * 1000:>13.2f} {1:>11.2f}x")
+
+    for processes in args.processes:
+        executor = process_pool(processes)
+        variants = {f'Pool {processes} (memoria compartida)': lambda: [
+            scraper.process_seasons(raw_seasons, executor) for scraper, raw_seasons in corpus
+        ]}
+        if processes == max(args.processes):
+            variants[f'Pool {processes} (bytes por pickle)'] = lambda: run_pickled(executor, corpus)
+        for name, run in variants.items():
+            timer = Timer()
+            with timer.measure():
+                results[name] = run()
+            print(f"{name:<34} {timer.elapsed:>7.2f}s {timer.elapsed / n_jobs * 1000:>13.2f} "
+                  f"{baseline / timer.elapsed:>11.2f}x")
+        executor.shutdown()
+
+    print("\n" + "="*70)
+    print("PARIDAD")
+    print("="*70)
+    reference = results.pop('En este proceso')
+    failures = 0
+    for name, result in results.items():
+        ok = all(
+            (data is None and other is None) or data.equals(other)
+            for (data, _), (other, _) in zip(reference, result)
+        )
+        failures += not ok
+        print(f"  {name:<34} {'✓' if ok else '✗'}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark y paridad de la capa de consultas SQLite (league_db.LeagueDB)
+
+Paridad (sobre english_leagues_completo.csv):
+    - season_table, team_history, champions y records devuelven las mismas filas
+      que el filtro equivalente en pandas
+
+Rendimiento:
+    - pandas: pd.read_csv del dataset completo + filtro, por consulta (como hoy)
+    - pandas en memoria: solo el filtro, con el DataFrame ya cargado
+    - SQLite: consulta indexada sobre la base de datos
+
+Uso:
+    python benchmarks/bench_queries.py [--repeat 200]
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from common import REPO_ROOT, Timer
+
+import scraper_english_leagues as sel
+from league_db import LeagueDB, build_database
+from tracking_store import TrackingStore
+
+COMPARE_COLUMNS = ['Temporada', 'Division', 'Pos', 'Equipo', 'Pts', 'GF', 'GC']
+
+
+def pandas_queries(division, season, team):
+    """Las mismas preguntas con filtros de pandas (como verificar_english_leagues.py)"""
+    return {
+        'season_table': lambda df: df[(df['Division'] == division) & (df['Temporada'] == season)].sort_values('Pos'),
+        'team_history': lambda df: df[df['Equipo'] == team].sort_values('Temporada', kind='stable'),
+        'champions': lambda df: df[(df['Pos'] == 1) & (df['Division'] == division)].sort_values('Temporada'),
+        'records': lambda df: df[df['Division'] == division].nlargest(1, 'Pts'),
+    }
+
+
+def db_queries(division, season, team):
+    return {
+        'season_table': lambda db: db.season_table(division, season),
+        'team_history': lambda db: db.team_history(team),
+        'champions': lambda db: db.champions(division),
+        'records': lambda db: db.records(division),
+    }
+
+
+def same_rows(expected, actual):
+    left = expected[COMPARE_COLUMNS].reset_index(drop=True)
+    right = actual[COMPARE_COLUMNS].reset_index(drop=True)
+    return left.astype(str).equals(right.astype(str))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=200, help='Repeticiones de cada consulta')
+    parser.add_argument('--team', default='Leicester')
+    args = parser.parse_args()
+
+    data_path = REPO_ROOT / sel.OUTPUT_FILE
+    if not data_path.exists():
+        print(f"Sin datos: {data_path}")
+        return 0
+    df = pd.read_csv(data_path, encoding='utf-8-sig', dtype={'Dif': str})
+    division = 'Championship'
+    season = sorted(df['Temporada'].unique())[-1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'bench.sqlite'
+        build_timer = Timer()
+        with build_timer.measure():
+            store = TrackingStore.from_dataset(df, sel.DIVISION_ORDER)
+            build_database(df, store.data, division_order=sel.DIVISION_ORDER, path=db_path)
+
+        with LeagueDB(db_path) as db:
+            print("="*70)
+            print("PARIDAD")
+            print("="*70)
+            pandas_funcs = pandas_queries(division, season, args.team)
+            db_funcs = db_queries(division, season, args.team)
+            failures = 0
+            for name in pandas_funcs:
+                expected, actual = pandas_funcs[name](df), db_funcs[name](db)
+                ok = same_rows(expected, actual)
+                failures += not ok
+                print(f"  {name:<14} {len(actual):>4} filas  {'✓' if ok else '✗'}")
+
+            print("\n" + "="*70)
+            print(f"BENCHMARK - {args.repeat} repeticiones (base de datos creada en {build_timer.elapsed:.2f}s)")
+            print("="*70)
+            print(f"{'Consulta':<14} {'read_csv+filtro':>16} {'filtro (RAM)':>13} {'SQLite':>10}")
+
+            for name in pandas_funcs:
+                csv_timer, ram_timer, db_timer = Timer(), Timer(), Timer()
+                for _ in range(args.repeat):
+                    with csv_timer.measure():
+                        pandas_funcs[name](pd.read_csv(data_path, encoding='utf-8-sig', dtype={'Dif': str}))
+                    with ram_timer.measure():
+                        pandas_funcs[name](df)
+                    with db_timer.measure():
+                        db_funcs[name](db)
+                per_query = [t.elapsed / args.repeat * 1000 for t in (csv_timer, ram_timer, db_timer)]
+                print(f"{name:<14} {per_query[0]:>14.2f}ms {per_query[1]:>11.2f}ms {per_query[2]:>8.2f}ms")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
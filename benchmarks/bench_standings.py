@@ -0,0 +1,129 @@
+"""
+Benchmark y paridad del motor vectorizado de clasificaciones
+
+Paridad:
+    - Cada temporada guardada en english_leagues_completo.csv cuyo CSV crudo esté
+      en la caché local se recalcula y se compara fila a fila con el CSV (con el
+      mismo formato de exportación: Dif con signo, "+5"). Si no se puede comparar
+      ninguna (sin caché: ejecutar antes scraper_english_leagues.py) el benchmark
+      falla, salvo con --skip-stored
+    - Todas las temporadas sintéticas muestreadas se comparan con el bucle original
+
+Rendimiento:
+    - Motor vectorizado sobre N temporadas sintéticas (por defecto 10,000)
+    - Bucle original sobre una muestra, extrapolado a N
+
+Uso:
+    python benchmarks/bench_standings.py [--seasons 10000] [--legacy-sample 200] [--data-dir .] [--skip-stored]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from common import REPO_ROOT, Timer, legacy_calculate_standings, synthetic_season
+
+from http_cache import DEFAULT_CACHE_DIR, HTTPCache
+from standings import compute_standings, export_standings, format_dif
+
+
+def check_stored_outputs(data_dir=REPO_ROOT):
+    """
+    Compara el motor actual con english_leagues_completo.csv usando la caché local
+
+    Args:
+        data_dir (Path): Directorio con el dataset y la caché (cache/football_data)
+
+    Returns:
+        tuple: (temporadas comparadas, temporadas con diferencias)
+    """
+    import scraper_english_leagues as sel
+
+    stored_path = data_dir / sel.OUTPUT_FILE
+    if not stored_path.exists():
+        return 0, 0
+    stored = pd.read_csv(stored_path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+    checked = mismatches = 0
+    for scraper in sel.build_scrapers():
+        scraper.cache = HTTPCache(data_dir / DEFAULT_CACHE_DIR)
+        for season in scraper.get_seasons():
+            expected = stored[(stored['Division'] == scraper.division_name) & (stored['Temporada'] == season)]
+            meta = scraper.cache.lookup(scraper.get_url(season))
+            if meta is None or len(expected) == 0:
+                continue
+            result = scraper.parse_season(scraper.cache.load(meta), season)
+            checked += 1
+            # Dif es int16 hasta exportar: se compara con el formato del CSV ("+5")
+            if result is None or not export_standings(result).astype(str).reset_index(drop=True).equals(
+                    expected.reset_index(drop=True)):
+                mismatches += 1
+                print(f"  ✗ Diferencia: {scraper.division_name} {season}")
+    return checked, mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seasons', type=int, default=10000, help='Temporadas sintéticas (motor vectorizado)')
+    parser.add_argument('--legacy-sample', type=int, default=200, help='Temporadas para el bucle original')
+    parser.add_argument('--teams', type=int, default=24)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', type=Path, default=REPO_ROOT,
+                        help='Directorio con english_leagues_completo.csv y cache/ (por defecto, el repositorio)')
+    parser.add_argument('--skip-stored', action='store_true',
+                        help='No fallar si no hay temporadas guardadas con CSV crudo en caché')
+    args = parser.parse_args()
+
+    print("="*70)
+    print("PARIDAD - temporadas guardadas")
+    print("="*70)
+    checked, mismatches = check_stored_outputs(args.data_dir.resolve())
+    print(f"Temporadas comparadas: {checked} (con CSV crudo en caché)")
+    print(f"Diferencias: {mismatches}")
+    missing_stored = checked == 0 and not args.skip_stored
+    if missing_stored:
+        print("✗ Ninguna temporada comparada: falta la caché de CSV crudos "
+              "(ejecutar scraper_english_leagues.py o usar --data-dir / --skip-stored)")
+
+    rng = np.random.default_rng(args.seed)
+    legacy_timer = Timer()
+    vector_timer = Timer()
+    synthetic_mismatches = 0
+
+    print("\n" + "="*70)
+    print(f"BENCHMARK - {args.seasons:,} temporadas sintéticas de {args.teams} equipos")
+    print("="*70)
+
+    for i in range(args.seasons):
+        season = synthetic_season(rng, args.teams)
+
+        with vector_timer.measure():
+            result = compute_standings(season)
+            result['Dif'] = format_dif(result['Dif'])
+
+        if i < args.legacy_sample:
+            with legacy_timer.measure():
+                expected = legacy_calculate_standings(season)
+                expected['Dif'] = expected['Dif'].apply(lambda x: f"+{x}" if x > 0 else str(x))
+            if not result[expected.columns].astype(str).equals(expected.astype(str)):
+                synthetic_mismatches += 1
+
+    sample = min(args.legacy_sample, args.seasons)
+    legacy_per_season = legacy_timer.elapsed / sample if sample else float('nan')
+    vector_per_season = vector_timer.elapsed / args.seasons
+
+    print(f"Paridad sintética: {sample - synthetic_mismatches}/{sample} temporadas idénticas")
+    print(f"Bucle original:   {legacy_per_season * 1000:8.2f} ms/temporada "
+          f"(~{legacy_per_season * args.seasons:,.1f} s extrapolado)")
+    print(f"Vectorizado:      {vector_per_season * 1000:8.2f} ms/temporada "
+          f"({vector_timer.elapsed:,.1f} s total)")
+    print(f"Aceleración:      {legacy_per_season / vector_per_season:8.1f}x")
+
+    return 1 if (mismatches or synthetic_mismatches or missing_stored) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
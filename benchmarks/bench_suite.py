@@ -0,0 +1,431 @@
+"""
+Suite de benchmarks reproducible del pipeline (sin red) con resultados en JSON
+
+Todo se ejecuta en un directorio temporal contra un servidor HTTP local que
+sirve CSVs de prueba con el formato de football-data.co.uk (sintéticos y
+deterministas por semilla, o los de un directorio con --fixtures). Casos:
+
+    Descarga        download_season de una división (EnglishLeagueScraper y
+                    scraper_premier_league), sin caché ni límite de tasa
+    Clasificaciones calculate_standings sobre corpus sintéticos ×escala
+    Tracking        create_tracking de la pirámide (largo y ancho) y de
+                    scraper_premier_league, sobre corpus sintéticos ×escala
+    Pipeline        scrape_all_divisions completo, en frío (caché vacía) y en
+                    caliente (todas las temporadas cerradas desde caché), y
+                    los archivos de la Premier derivados de la pirámide
+    Verificación    verificar_english_leagues.py y verificar_datos.py sobre
+                    las salidas del pipeline (proceso nuevo, como en uso real)
+    Arranque        importar cada scraper en un intérprete nuevo (desglose
+                    por dependencia en bench_importtime.py)
+
+Cada caso se repite --repeat veces; se guardan todas las mediciones, el mínimo
+y la mediana en benchmarks/results/<fecha>_<commit>.json, junto con el commit,
+las versiones y la configuración, para comparar commits entre sí:
+
+    python benchmarks/bench_suite.py --compare results/ANTES.json            # ejecuta y compara
+    python benchmarks/bench_suite.py --compare results/A.json results/B.json # solo compara
+
+Paridad:
+    - Todas las temporadas del servidor local se descargan y parsean
+    - scrape_all_divisions produce el mismo CSV en frío y en caliente
+    - El informe de ejecución (run_report) cubre todas las temporadas y sus
+      contadores de filas cuadran
+    - derive_from_pyramid produce los mismos archivos que scraper_premier_league
+    - Los scripts de verificación terminan sin error
+
+Uso:
+    python benchmarks/bench_suite.py [--scales 1 4] [--repeat 3] [--fixtures DIR]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from common import REPO_ROOT, synthetic_pyramid, synthetic_raw_csv, synthetic_season
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# Diferencia relativa de tiempo (mínimo) a partir de la cual se marca una regresión
+DEFAULT_THRESHOLD = 0.10
+
+# Temporadas de los corpus sintéticos en escala 1 (las de la pirámide real)
+BASE_SEASONS = 32
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Servidor local que sirve CSVs desde memoria ({'/9394/E0.csv': bytes}); 404 el resto"""
+
+    daemon_threads = True
+
+    def __init__(self, files):
+        super().__init__(('127.0.0.1', 0), FixtureHandler)
+        self.files = files
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def season_path(scraper, season):
+    """Ruta de la temporada en el servidor (la parte de get_url tras base_url)"""
+    return scraper.get_url(season)[len(scraper.base_url):]
+
+
+def synthetic_fixtures(scrapers, seed):
+    """
+    CSVs crudos deterministas para todas las (división, temporada) de `scrapers`
+
+    Cada división tiene sus propios equipos y el número de equipos esperado.
+    """
+    rng = np.random.default_rng(seed)
+    files = {}
+    for scraper in scrapers:
+        expected = scraper.expected_teams
+        n_teams = expected[0] if isinstance(expected, tuple) else expected
+        for season in scraper.get_seasons():
+            files[season_path(scraper, season)] = synthetic_raw_csv(
+                rng, n_teams, prefix=f'{scraper.division_code} Team')
+    return files
+
+
+def directory_fixtures(root):
+    """CSVs de un directorio con la estructura del servidor (<código temporada>/<división>.csv)"""
+    root = Path(root)
+    return {f"/{path.relative_to(root).as_posix()}": path.read_bytes() for path in root.glob('*/*.csv')}
+
+
+def git_revision():
+    """(commit abreviado, True si hay cambios sin commitear); (None, None) fuera de git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+
+def measure(run, repeat, setup=None):
+    """
+    Ejecuta `run` `repeat` veces (con `setup` antes de cada una, sin medir)
+
+    Returns:
+        tuple: (tiempos en segundos, resultado de la última ejecución)
+    """
+    times, result = [], None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        # Sin tablas ni resúmenes por consola dentro de la medición
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+class Suite:
+    """Casos medidos y resultados en el formato del JSON"""
+
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.cases = []
+
+    def run(self, group, name, run, units, unit, setup=None, scale=None):
+        """
+        Mide un caso y lo imprime
+
+        Args:
+            group (str): Grupo del caso (Descarga, Tracking...)
+            name (str): Nombre único del caso (clave para comparar entre commits)
+            run (callable): Trabajo medido
+            units (int): Unidades de trabajo (temporadas, equipo-temporadas...)
+            unit (str): Nombre de la unidad
+            setup (callable): Preparación antes de cada repetición (no se mide)
+            scale (int): Factor de escala del corpus sintético
+
+        Returns:
+            Resultado de la última repetición
+        """
+        times, result = measure(run, self.repeat, setup)
+        best, median = min(times), statistics.median(times)
+        self.cases.append({
+            'group': group, 'name': name, 'scale': scale, 'units': units, 'unit': unit,
+            'runs_s': [round(t, 6) for t in times], 'min_s': round(best, 6), 'median_s': round(median, 6),
+        })
+        print(f"{name:<46} {best:>8.3f}s {median:>8.3f}s {best / units * 1000:>10.3f} ms/{unit}")
+        return result
+
+
+def standings_corpus(rng, n_seasons):
+    """Partidos sintéticos de n_seasons temporadas de 24 equipos: [(temporada, DataFrame)]"""
+    return [(f"{1993 + s}-{str(1994 + s)[-2:]}", synthetic_season(rng)) for s in range(n_seasons)]
+
+
+def pyramid_corpus(rng, n_seasons, division_order):
+    """synthetic_pyramid con los nombres de división reales (para el TrackingStore)"""
+    df, divisions = synthetic_pyramid(rng, n_leagues=len(division_order), n_seasons=n_seasons)
+    df['Division'] = df['Division'].map(dict(zip(divisions, division_order)))
+    return df
+
+
+def run_python(*args):
+    """Ejecuta un intérprete nuevo en el directorio actual (código de salida)"""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    return subprocess.run([sys.executable, *args], env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+
+
+def report_consistent(n_seasons):
+    """
+    El último informe de ejecución (logs/*.json) cubre todas las temporadas, sin
+    caché, y sus filas cuadran: leídas - descartadas = partidos
+    """
+    report = json.loads(max(Path('logs').glob('*.json'), key=lambda path: path.stat().st_mtime).read_text())
+    totals = report['totals']
+    dropped = totals['rows_dropped_teams'] + totals['rows_dropped_ftr']
+    return (totals['seasons'] == n_seasons and totals['http_requests'] == n_seasons
+            and totals['cache_hits'] == 0 and totals['rows_read'] - dropped == totals['matches'])
+
+
+def run_suite(args, workdir):
+    """Ejecuta todos los casos dentro de workdir; devuelve (Suite, checks de paridad)"""
+    # Importar desde el directorio temporal: logs/, cache/ y data/ se crean ahí
+    os.chdir(workdir)
+    import scraper_english_leagues as sel
+    import scraper_premier_league as spl
+
+    # Solo errores: el log por temporada distorsiona las medidas
+    logging.disable(logging.WARNING)
+
+    scrapers = sel.build_scrapers()
+    files = directory_fixtures(args.fixtures) if args.fixtures else synthetic_fixtures(scrapers, args.seed)
+    server = FixtureServer(files)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Todo contra el servidor local y sin límite de tasa (se mide el pipeline, no la espera)
+    sel.EnglishLeagueScraper.base_url = server.url
+    spl.FOOTBALL_DATA_BASE_URL = server.url
+    sel.DEFAULT_REQUESTS_PER_SECOND = 1e6
+
+    suite = Suite(args.repeat)
+    checks = {}
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'Caso':<46} {'Mínimo':>9} {'Mediana':>9} {'Por unidad':>13}")
+
+    # Descarga + parseo de una división completa (sin caché)
+    scraper = sel.PremierLeagueScraper()
+    scraper.cache = None
+    scraper.requests_per_second = 1e6
+    seasons = scraper.get_seasons()
+    tables = suite.run('Descarga', 'download_season (EnglishLeagueScraper)',
+                       lambda: [scraper.download_season(s) for s in seasons], len(seasons), 'temporada')
+    premier_cache, spl.http_cache = spl.http_cache, None
+    premier_tables = suite.run('Descarga', 'download_season (scraper_premier_league)',
+                               lambda: [spl.download_season(s) for s in seasons], len(seasons), 'temporada')
+    spl.http_cache = premier_cache
+    checks['descarga: todas las temporadas'] = (
+        all(t is not None for t in tables) and all(t is not None for t in premier_tables))
+
+    # Motor de clasificaciones y tracking sobre corpus sintéticos ampliados
+    for scale in args.scales:
+        n_seasons = BASE_SEASONS * scale
+        corpus = standings_corpus(rng, n_seasons)
+        suite.run('Clasificaciones', f'calculate_standings ×{scale}',
+                  lambda: [scraper.calculate_standings(df, season) for season, df in corpus],
+                  n_seasons, 'temporada', scale=scale)
+
+        pyramid = pyramid_corpus(rng, n_seasons, sel.DIVISION_ORDER)
+        suite.run('Tracking', f'create_tracking pirámide (largo) ×{scale}',
+                  lambda: sel.create_tracking(pyramid), len(pyramid), 'fila', scale=scale)
+        suite.run('Tracking', f'create_tracking pirámide (ancho) ×{scale}',
+                  lambda: sel.create_tracking(pyramid, wide=True), len(pyramid), 'fila', scale=scale)
+        premier = pyramid[pyramid['Division'] == sel.DIVISION_ORDER[0]].drop(columns='Division')
+        suite.run('Tracking', f'create_tracking premier ×{scale}',
+                  lambda: spl.create_tracking(premier), len(premier), 'fila', scale=scale)
+
+    # Pipeline completo: en frío (sin caché ni almacén) y en caliente (caché llena)
+    def clean_outputs():
+        for path in ('cache', 'data'):
+            shutil.rmtree(path, ignore_errors=True)
+        Path(sel.DB_FILE).unlink(missing_ok=True)
+
+    n_requests = sum(len(s.get_seasons()) for s in scrapers)
+    suite.run('Pipeline', 'scrape_all_divisions (en frío)', sel.scrape_all_divisions,
+              n_requests, 'temporada', setup=clean_outputs)
+    cold = Path(sel.OUTPUT_FILE).read_bytes()
+    checks['informe: una fila por temporada descargada'] = report_consistent(n_requests)
+    suite.run('Pipeline', 'scrape_all_divisions (en caliente)', sel.scrape_all_divisions,
+              n_requests, 'temporada')
+    checks['pipeline: mismo CSV en frío y en caliente'] = Path(sel.OUTPUT_FILE).read_bytes() == cold
+
+    # Entradas de verificar_datos.py: dataset y tracking de la Premier ya descargados
+    premier_df = spl.compact_standings(pd.concat(premier_tables, ignore_index=True))
+    spl.export_standings(premier_df).to_csv('premier_league_COMPLETO_football_data.csv',
+                                            index=False, encoding='utf-8-sig')
+    spl.write_columnar(premier_df, 'premier_league_COMPLETO_football_data.csv')
+    with contextlib.redirect_stdout(io.StringIO()):
+        spl.create_tracking(premier_df)
+    premier_files = {path: Path(path).read_bytes() for path in (spl.OUTPUT_FILE, spl.TRACKING_FILE)}
+
+    # Los mismos archivos como proyección del dataset de la pirámide (sin red)
+    def derive_premier():
+        with contextlib.redirect_stdout(io.StringIO()):
+            spl.derive_from_pyramid()
+
+    suite.run('Pipeline', 'derive_from_pyramid (Premier sin descargas)', derive_premier,
+              len(seasons), 'temporada')
+    checks['premier derivada: mismos archivos'] = all(
+        Path(path).read_bytes() == content for path, content in premier_files.items())
+
+    for script in ('verificar_english_leagues.py', 'verificar_datos.py'):
+        code = suite.run('Verificación', script, lambda: run_python(str(REPO_ROOT / script)), 1, 'ejecución')
+        checks[f'verificación: {script}'] = code == 0
+
+    for module in ('scraper_english_leagues', 'scraper_premier_league'):
+        suite.run('Arranque', f'import {module}', lambda: run_python('-c', f'import {module}'), 1, 'proceso')
+
+    server.shutdown()
+    return suite, checks
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(base, new, threshold):
+    """
+    Imprime la comparación caso a caso (por tiempo mínimo) entre dos resultados
+
+    Returns:
+        int: Número de casos más lentos que base en más de `threshold`
+    """
+    print("\n" + "="*70)
+    print(f"COMPARACIÓN {base.get('commit') or '?'} → {new.get('commit') or '?'} (mínimo de cada caso)")
+    print("="*70)
+    print(f"{'Caso':<46} {'Antes':>9} {'Ahora':>9} {'Cambio':>8}")
+    base_cases = {case['name']: case for case in base['cases']}
+    regressions = 0
+    for case in new['cases']:
+        before = base_cases.get(case['name'])
+        if before is None:
+            print(f"{case['name']:<46} {'-':>9} {case['min_s']:>8.3f}s {'nuevo':>8}")
+            continue
+        change = case['min_s'] / before['min_s'] - 1 if before['min_s'] else 0.0
+        slower = change > threshold
+        regressions += slower
+        print(f"{case['name']:<46} {before['min_s']:>8.3f}s {case['min_s']:>8.3f}s "
+              f"{change:>+7.0%}{' ✗' if slower else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 4],
+                        help=f'Factores de escala de los corpus sintéticos ({BASE_SEASONS} temporadas ×N)')
+    parser.add_argument('--repeat', type=int, default=3, help='Repeticiones de cada caso')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--fixtures', help='Directorio con CSVs reales (<código temporada>/<división>.csv)')
+    parser.add_argument('--output', help='Fichero JSON de resultados (por defecto en benchmarks/results/)')
+    parser.add_argument('--compare', nargs='+', metavar='JSON',
+                        help='Resultado base con el que comparar (con dos ficheros, solo compara)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Empeoramiento relativo que cuenta como regresión')
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) == 2:
+        regressions = compare(load_results(args.compare[0]), load_results(args.compare[1]), args.threshold)
+        return 1 if regressions else 0
+    if args.fixtures:
+        args.fixtures = str(Path(args.fixtures).resolve())
+
+    commit, dirty = git_revision()
+    print("="*70)
+    print(f"SUITE DE BENCHMARKS - commit {commit or '?'}{' (con cambios)' if dirty else ''}, "
+          f"escalas {args.scales}, {args.repeat} repeticiones")
+    print("="*70)
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='bench_suite_')
+    try:
+        suite, checks = run_suite(args, workdir)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {
+        'commit': commit,
+        'dirty': dirty,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': {'scales': args.scales, 'repeat': args.repeat, 'seed': args.seed, 'fixtures': args.fixtures},
+        'cases': suite.cases,
+        'checks': checks,
+    }
+    if args.output:
+        output = Path(args.output)
+    else:
+        output = RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit or 'sin-git'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResultados: {output}")
+
+    print("\n" + "="*70)
+    print("PARIDAD")
+    print("="*70)
+    failures = 0
+    for name, ok in checks.items():
+        failures += not ok
+        print(f"  {name:<46} {'✓' if ok else '✗'}")
+
+    if args.compare:
+        failures += compare(load_results(args.compare[0]), results, args.threshold)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
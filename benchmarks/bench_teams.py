@@ -0,0 +1,164 @@
+"""
+Benchmark y paridad del registro de equipos (team_registry)
+
+Paridad:
+    - normalize_team_columns da los mismos nombres que clean_team_name (strip)
+      celda a celda, y resuelve los alias de TEAM_ALIASES si se activan
+      (MERGE_ALIASES)
+    - Por defecto no renombra ningún equipo del dataset guardado
+      (english_leagues_completo.csv): las salidas conservan su grafía
+    - Aun así, buscar un equipo por cualquier grafía de TEAM_ALIASES encuentra
+      todas las temporadas guardadas del club (TrackingStore.team_history)
+    - compute_all_standings con equipos como Categorical del registro (IDs enteros)
+      da las mismas tablas que con nombres de texto
+
+Rendimiento:
+    - Limpieza de nombres: .apply(clean_team_name) × 2 frente a normalize_team_columns
+    - Clasificaciones por lotes con nombres de texto frente a IDs del registro
+    - Memoria de las columnas HomeTeam/AwayTeam (object frente a Categorical)
+
+Uso:
+    python benchmarks/bench_teams.py [--leagues 5] [--seasons 32]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import REPO_ROOT, Timer, synthetic_season
+
+import scraper_english_leagues as sel
+import team_registry
+from standings import compute_all_standings
+from team_registry import TEAM_ALIASES, TeamRegistry, normalize_team_columns, normalize_team_names
+from tracking_store import TrackingStore
+
+STORED_DATASET = REPO_ROOT / 'english_leagues_completo.csv'
+
+
+def legacy_clean_team_name(name):
+    """clean_team_name original (solo strip)"""
+    if pd.isna(name):
+        return None
+    return str(name).strip()
+
+
+def synthetic_matches(rng, n_leagues, n_seasons):
+    """Partidos de una pirámide sintética con Division y Temporada"""
+    frames = []
+    for s in range(n_seasons):
+        season = f"{1993 + s}-{str(1994 + s)[-2:]}"
+        for l in range(n_leagues):
+            season_df = synthetic_season(rng, prefix=f'Club {l:02d}')
+            frames.append(season_df.assign(Division=f'League {l + 1:02d}', Temporada=season))
+    matches = pd.concat(frames, ignore_index=True)
+    matches['Division'] = pd.Categorical(matches['Division'])
+    return matches
+
+
+def dirty_names(rng, values):
+    """Añade espacios sobrantes a una parte de los nombres (como en algunos CSV)"""
+    values = values.to_numpy(dtype=object).copy()
+    rows = rng.choice(len(values), len(values) // 10, replace=False)
+    values[rows] = [f' {name} ' for name in values[rows]]
+    return pd.Series(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--leagues', type=int, default=5)
+    parser.add_argument('--seasons', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    matches = synthetic_matches(rng, args.leagues, args.seasons)
+    seasons = [season_df for _, season_df in matches.groupby(['Division', 'Temporada'], observed=True)]
+    dirty = [season_df.assign(HomeTeam=dirty_names(rng, season_df['HomeTeam']).to_numpy(),
+                              AwayTeam=dirty_names(rng, season_df['AwayTeam']).to_numpy())
+             for season_df in seasons]
+
+    print("="*70)
+    print("PARIDAD")
+    print("="*70)
+    failures = 0
+
+    same_names = all(
+        normalize_team_columns(season_df)[col].tolist() == season_df[col].map(legacy_clean_team_name).tolist()
+        for season_df in dirty for col in ('HomeTeam', 'AwayTeam')
+    )
+    failures += not same_names
+    print(f"  {'nombres (strip)':<28} {'✓' if same_names else '✗'}")
+
+    aliases = pd.DataFrame({'HomeTeam': list(TEAM_ALIASES), 'AwayTeam': list(TEAM_ALIASES.values())})
+    team_registry.MERGE_ALIASES = True
+    try:
+        resolved = normalize_team_columns(aliases)
+    finally:
+        team_registry.MERGE_ALIASES = False
+    same_aliases = resolved['HomeTeam'].astype(object).equals(resolved['AwayTeam'].astype(object))
+    failures += not same_aliases
+    print(f"  {'alias (MERGE_ALIASES)':<28} {'✓' if same_aliases else '✗'}")
+
+    stored = pd.read_csv(STORED_DATASET, usecols=['Equipo'], encoding='utf-8-sig')['Equipo']
+    renamed = stored[normalize_team_names(stored).astype(object) != stored]
+    failures += not renamed.empty
+    print(f"  {'dataset guardado sin cambios':<28} {'✓' if renamed.empty else '✗'}")
+    for name in renamed.unique():
+        print(f"      ✗ {name}")
+
+    # Cada grafía de un club con alias encuentra todas sus temporadas guardadas
+    dataset = pd.read_csv(STORED_DATASET, encoding='utf-8-sig')
+    store = TrackingStore.from_dataset(dataset, sel.DIVISION_ORDER)
+    for alias, canonical in TEAM_ALIASES.items():
+        expected = set(dataset.loc[dataset['Equipo'].isin([alias, canonical]), 'Temporada'])
+        lookup_ok = all(set(store.team_history(name)['Temporada']) == expected for name in (alias, canonical))
+        failures += not lookup_ok
+        print(f"  {'búsqueda por alias':<28} {'✓' if lookup_ok else '✗'}  "
+              f"({alias} / {canonical}: {len(expected)} temporadas)")
+
+    encoded = matches.copy()
+    registry = TeamRegistry.from_matches(matches)
+    for col in ('HomeTeam', 'AwayTeam'):
+        encoded[col] = registry.categorical(matches[col])
+    same_tables = compute_all_standings(matches).equals(compute_all_standings(encoded))
+    failures += not same_tables
+    print(f"  {'clasificaciones por lotes':<28} {'✓' if same_tables else '✗'}")
+
+    print("\n" + "="*70)
+    print(f"BENCHMARK - {len(seasons)} temporadas, {len(matches):,} partidos, {len(registry)} equipos")
+    print("="*70)
+
+    apply_timer, vector_timer = Timer(), Timer()
+    for season_df in dirty:
+        with apply_timer.measure():
+            season_df['HomeTeam'].apply(legacy_clean_team_name)
+            season_df['AwayTeam'].apply(legacy_clean_team_name)
+        with vector_timer.measure():
+            normalize_team_columns(season_df)
+    print(f"{'Limpieza de nombres':<28} apply: {apply_timer.elapsed * 1000:>8.1f}ms   "
+          f"registro: {vector_timer.elapsed * 1000:>8.1f}ms   "
+          f"{apply_timer.elapsed / vector_timer.elapsed:>5.1f}x")
+
+    text_timer, ids_timer = Timer(), Timer()
+    for _ in range(5):
+        with text_timer.measure():
+            compute_all_standings(matches)
+        with ids_timer.measure():
+            compute_all_standings(encoded)
+    print(f"{'Clasificaciones por lotes':<28} texto: {text_timer.elapsed / 5 * 1000:>8.1f}ms   "
+          f"IDs:      {ids_timer.elapsed / 5 * 1000:>8.1f}ms   "
+          f"{text_timer.elapsed / ids_timer.elapsed:>5.1f}x")
+
+    text_mb = matches[['HomeTeam', 'AwayTeam']].memory_usage(deep=True, index=False).sum() / 1e6
+    ids_mb = encoded[['HomeTeam', 'AwayTeam']].memory_usage(deep=True, index=False).sum() / 1e6
+    print(f"{'Memoria HomeTeam/AwayTeam':<28} texto: {text_mb:>8.2f}MB   IDs:      {ids_mb:>8.2f}MB   "
+          f"{text_mb / ids_mb:>5.1f}x")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark y paridad del tracking longitudinal (scraper_english_leagues.build_tracking)
+
+Paridad:
+    - english_leagues_tracking.csv reconstruido desde english_leagues_completo.csv
+      debe ser idéntico byte a byte al archivo guardado
+    - En pirámides sintéticas pequeñas, igual al bucle original (sus filas en el
+      orden estable de build_tracking: Total_Temporadas desc., Equipo)
+
+Rendimiento:
+    - Pirámides sintéticas crecientes (hasta 20+ ligas y 60 temporadas)
+    - El bucle original solo se mide hasta --legacy-max-rows filas
+
+Uso:
+    python benchmarks/bench_tracking.py [--legacy-max-rows 5000]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import REPO_ROOT, Timer, legacy_build_tracking, stable_order, synthetic_pyramid
+
+import scraper_english_leagues as sel
+
+SCALES = [(5, 32), (10, 40), (20, 60), (30, 60)]
+
+
+def to_csv_text(df):
+    return df.to_csv(index=False)
+
+
+def check_stored_outputs():
+    """
+    Reconstruye el tracking a partir del dataset guardado
+
+    Se compara byte a byte con el archivo guardado y con el bucle original sobre
+    los mismos datos (en el orden estable de build_tracking).
+    """
+    data_path = REPO_ROOT / sel.OUTPUT_FILE
+    tracking_path = REPO_ROOT / sel.TRACKING_FILE
+    if not data_path.exists() or not tracking_path.exists():
+        return None
+    df = pd.read_csv(data_path, encoding='utf-8-sig', dtype={'Dif': str})
+    rebuilt = to_csv_text(sel.build_tracking(df))
+    expected = to_csv_text(stable_order(legacy_build_tracking(df, sel.DIVISION_ORDER)))
+    # Mismos bytes que escribe create_tracking (to_csv con utf-8-sig)
+    return rebuilt == expected and rebuilt.encode('utf-8-sig') == tracking_path.read_bytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--legacy-max-rows', type=int, default=5000,
+                        help='Tamaño máximo (filas) en el que se ejecuta el bucle original')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("="*70)
+    print("PARIDAD - tracking guardado (byte a byte)")
+    print("="*70)
+    stored_ok = check_stored_outputs()
+    print("Sin archivos guardados" if stored_ok is None else
+          f"Tracking reconstruido idéntico: {'sí' if stored_ok else 'NO'}")
+
+    print("\n" + "="*70)
+    print("BENCHMARK - pirámides sintéticas")
+    print("="*70)
+    print(f"{'Ligas':>6} {'Temps':>6} {'Filas':>8} {'Equipos':>8} {'Vectorizado':>12} {'Original':>10} {'µs/fila':>8}")
+
+    failures = 0 if stored_ok in (None, True) else 1
+    for n_leagues, n_seasons in SCALES:
+        rng = np.random.default_rng(args.seed)
+        df, divisions = synthetic_pyramid(rng, n_leagues, n_seasons)
+
+        vector_timer = Timer()
+        with vector_timer.measure():
+            result = sel.build_tracking(df, divisions)
+
+        legacy = '-'
+        if len(df) <= args.legacy_max_rows:
+            legacy_timer = Timer()
+            with legacy_timer.measure():
+                expected = stable_order(legacy_build_tracking(df, divisions))
+            legacy = f"{legacy_timer.elapsed:9.2f}s"
+            if to_csv_text(result) != to_csv_text(expected):
+                failures += 1
+                legacy += ' ✗'
+
+        print(f"{n_leagues:>6} {n_seasons:>6} {len(df):>8,} {len(result):>8,} "
+              f"{vector_timer.elapsed:>11.3f}s {legacy:>10} {vector_timer.elapsed / len(df) * 1e6:>8.1f}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Regresión y benchmark del tracking de Premier League (scraper_premier_league.build_tracking)
+
+Paridad:
+    - premier_league_tracking_COMPLETO.csv reconstruido desde
+      premier_league_COMPLETO_football_data.csv frente al archivo guardado y
+      frente al bucle original (byte a byte)
+    - Ligas sintéticas con ascensos/descensos frente al bucle original
+
+El bucle original ordenaba por Total_Temporadas con quicksort, así que el orden
+de los empates dependía de la versión de NumPy; se compara con sus filas en el
+orden estable de build_tracking (Total_Temporadas desc., Equipo).
+
+Uso:
+    python benchmarks/bench_tracking_premier.py [--legacy-max-rows 5000]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import REPO_ROOT, Timer, legacy_premier_tracking, stable_order, synthetic_pyramid
+
+import scraper_premier_league as spl
+
+DATA_FILE = 'premier_league_COMPLETO_football_data.csv'
+TRACKING_FILE = 'premier_league_tracking_COMPLETO.csv'
+SEASONS = [32, 60, 200, 1000]
+
+
+def to_csv_text(df):
+    return df.to_csv(index=False)
+
+
+def check_stored_outputs():
+    """Compara el tracking reconstruido con el bucle original y con el archivo guardado"""
+    data_path = REPO_ROOT / DATA_FILE
+    tracking_path = REPO_ROOT / TRACKING_FILE
+    if not data_path.exists() or not tracking_path.exists():
+        return None
+    df = pd.read_csv(data_path, encoding='utf-8-sig', dtype={'Dif': str})
+    rebuilt = to_csv_text(spl.build_tracking(df))
+    expected = to_csv_text(stable_order(legacy_premier_tracking(df)))
+    # Mismos bytes que escribe create_tracking (to_csv con utf-8-sig)
+    return rebuilt == expected and rebuilt.encode('utf-8-sig') == tracking_path.read_bytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--legacy-max-rows', type=int, default=2000,
+                        help='Tamaño máximo (filas) en el que se ejecuta el bucle original')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("="*70)
+    print("REGRESIÓN - tracking Premier League guardado (byte a byte)")
+    print("="*70)
+    stored_ok = check_stored_outputs()
+    print("Sin archivos guardados" if stored_ok is None else
+          f"Tracking reconstruido idéntico: {'sí' if stored_ok else 'NO'}")
+
+    print("\n" + "="*70)
+    print("BENCHMARK - liga sintética (20 equipos, 3 descensos por temporada)")
+    print("="*70)
+    print(f"{'Temps':>6} {'Filas':>8} {'Equipos':>8} {'Vectorizado':>12} {'Original':>10}")
+
+    failures = 0 if stored_ok in (None, True) else 1
+    for n_seasons in SEASONS:
+        rng = np.random.default_rng(args.seed)
+        df, _ = synthetic_pyramid(rng, n_leagues=1, n_seasons=n_seasons, n_teams=20)
+        df = df.drop(columns='Division')
+
+        vector_timer = Timer()
+        with vector_timer.measure():
+            result = spl.build_tracking(df)
+
+        legacy = '-'
+        if len(df) <= args.legacy_max_rows:
+            legacy_timer = Timer()
+            with legacy_timer.measure():
+                expected = stable_order(legacy_premier_tracking(df))
+            legacy = f"{legacy_timer.elapsed:9.2f}s"
+            if to_csv_text(result) != to_csv_text(expected):
+                failures += 1
+                legacy += ' ✗'
+
+        print(f"{n_seasons:>6} {len(df):>8,} {len(result):>8,} {vector_timer.elapsed:>11.3f}s {legacy:>10}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
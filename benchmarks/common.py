@@ -0,0 +1,292 @@
+"""
+Utilidades compartidas por los benchmarks
+
+- Añade la raíz del repositorio al sys.path para importar los scrapers
+- Genera temporadas sintéticas (liga a doble vuelta) de forma reproducible
+- Conserva la implementación original por bucle de calculate_standings como referencia
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def synthetic_season(rng, n_teams=24, prefix='Team'):
+    """
+    Temporada sintética a doble vuelta (todos contra todos, local y visitante)
+
+    Args:
+        rng (np.random.Generator): Generador aleatorio (reproducible)
+        n_teams (int): Número de equipos
+        prefix (str): Prefijo de los nombres de equipo
+
+    Returns:
+        DataFrame: HomeTeam, AwayTeam, FTHG, FTAG, FTR
+    """
+    teams = np.array([f'{prefix} {i:03d}' for i in range(n_teams)], dtype=object)
+    home_idx, away_idx = np.meshgrid(np.arange(n_teams), np.arange(n_teams), indexing='ij')
+    mask = home_idx != away_idx
+    home_idx, away_idx = home_idx[mask], away_idx[mask]
+
+    fthg = rng.poisson(1.5, len(home_idx))
+    ftag = rng.poisson(1.1, len(home_idx))
+    ftr = np.where(fthg > ftag, 'H', np.where(fthg < ftag, 'A', 'D'))
+
+    return pd.DataFrame({
+        'HomeTeam': teams[home_idx],
+        'AwayTeam': teams[away_idx],
+        'FTHG': fthg.astype('int64'),
+        'FTAG': ftag.astype('int64'),
+        'FTR': ftr,
+    })
+
+
+def legacy_calculate_standings(df):
+    """Cálculo original por equipo (referencia para paridad y comparación de tiempos)"""
+    teams = sorted(set(df['HomeTeam'].tolist() + df['AwayTeam'].tolist()))
+
+    standings = []
+    for team in teams:
+        home = df[df['HomeTeam'] == team]
+        away = df[df['AwayTeam'] == team]
+
+        pj = len(home) + len(away)
+        if pj == 0:
+            continue
+
+        w = len(home[home['FTR'] == 'H']) + len(away[away['FTR'] == 'A'])
+        d = len(home[home['FTR'] == 'D']) + len(away[away['FTR'] == 'D'])
+        l = pj - w - d
+
+        gf = int(home['FTHG'].sum() + away['FTAG'].sum())
+        gc = int(home['FTAG'].sum() + away['FTHG'].sum())
+
+        standings.append({
+            'Equipo': team, 'PJ': pj, 'G': w, 'E': d, 'P': l,
+            'GF': gf, 'GC': gc, 'Dif': gf - gc, 'Pts': 3 * w + d
+        })
+
+    standings_df = pd.DataFrame(standings)
+    standings_df = standings_df.sort_values(
+        ['Pts', 'Dif', 'GF'],
+        ascending=[False, False, False]
+    ).reset_index(drop=True)
+    standings_df['Pos'] = range(1, len(standings_df) + 1)
+    return standings_df
+
+
+class Timer:
+    """Acumulador de tiempo de pared"""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    @contextmanager
+    def measure(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+
+def legacy_build_tracking(df, division_order):
+    """Tracking original por bucle equipo × temporada (referencia para paridad)"""
+    all_teams = sorted(df['Equipo'].unique())
+    all_seasons = sorted(df['Temporada'].unique())
+    division_map = {d: i + 1 for i, d in enumerate(division_order)}
+    inv_map = {v: k for k, v in division_map.items()}
+
+    df = df.copy()
+    df['Division_Num'] = df['Division'].map(division_map)
+
+    tracking = []
+    for team in all_teams:
+        row = {'Equipo': team}
+        for season in all_seasons:
+            data = df[(df['Equipo'] == team) & (df['Temporada'] == season)]
+            if len(data) > 0:
+                row[f'{season}_Division'] = data.iloc[0]['Division']
+                row[f'{season}_Division_Num'] = data.iloc[0]['Division_Num']
+                row[f'{season}_Pos'] = data.iloc[0]['Pos']
+                row[f'{season}_Pts'] = data.iloc[0]['Pts']
+            else:
+                row[f'{season}_Division'] = None
+                row[f'{season}_Division_Num'] = None
+                row[f'{season}_Pos'] = None
+                row[f'{season}_Pts'] = None
+
+        team_data = df[df['Equipo'] == team]
+        row['Total_Temporadas'] = len(team_data)
+        row['Divisiones_Jugadas'] = team_data['Division'].nunique()
+        row['Mejor_Division_Num'] = team_data['Division_Num'].min()
+        row['Mejor_Division'] = inv_map.get(row['Mejor_Division_Num'], None)
+        row['Mejor_Posicion_Global'] = (team_data['Division_Num'] * 100 + team_data['Pos']).min()
+        tracking.append(row)
+
+    tracking_df = pd.DataFrame(tracking)
+    return tracking_df.sort_values('Total_Temporadas', ascending=False)
+
+
+def stable_order(tracking_df):
+    """
+    Filas de un tracking original (construidas por Equipo) en el orden estable actual
+
+    Los bucles originales ordenaban por Total_Temporadas con quicksort, así que el
+    orden de los empates dependía de la versión de NumPy; build_tracking los deja
+    por Equipo.
+    """
+    return tracking_df.sort_index().sort_values('Total_Temporadas', ascending=False, kind='stable')
+
+
+def synthetic_pyramid(rng, n_leagues=5, n_seasons=32, n_teams=24, start_year=1993):
+    """
+    Dataset de clasificaciones sintético con ascensos y descensos
+
+    Cada temporada los 3 primeros de cada liga suben y los 3 últimos bajan; los
+    descendidos de la última liga se sustituyen por equipos nuevos.
+
+    Returns:
+        tuple: (DataFrame con el formato de english_leagues_completo.csv, orden de divisiones)
+    """
+    divisions = [f'League {i + 1:02d}' for i in range(n_leagues)]
+    leagues = [[f'Club {l:02d}-{t:02d}' for t in range(n_teams)] for l in range(n_leagues)]
+    next_id = 0
+    rows = []
+
+    for s in range(n_seasons):
+        year = start_year + s
+        season = f"{year}-{str(year + 1)[-2:]}"
+        tables = []
+        for l, teams in enumerate(leagues):
+            order = rng.permutation(len(teams))
+            table = [teams[i] for i in order]
+            tables.append(table)
+            pts = np.sort(rng.integers(20, 100, len(table)))[::-1]
+            for pos, (team, p) in enumerate(zip(table, pts), 1):
+                g = int(p) // 3
+                e = int(p) - 3 * g
+                rows.append((season, divisions[l], pos, team, 46, g, e, 46 - g - e,
+                             int(p), 60, 50, '+10'))
+        new_leagues = [[] for _ in range(n_leagues)]
+        for l, table in enumerate(tables):
+            for pos, team in enumerate(table):
+                if pos < 3 and l > 0:
+                    new_leagues[l - 1].append(team)
+                elif pos >= len(table) - 3 and l < n_leagues - 1:
+                    new_leagues[l + 1].append(team)
+                elif pos >= len(table) - 3:
+                    new_leagues[l].append(f'New Club {next_id:04d}')
+                    next_id += 1
+                else:
+                    new_leagues[l].append(team)
+        leagues = new_leagues
+
+    columns = ['Temporada', 'Division', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P', 'Pts', 'GF', 'GC', 'Dif']
+    return pd.DataFrame(rows, columns=columns), divisions
+
+
+def legacy_premier_tracking(df):
+    """Tracking original de scraper_premier_league (bucle + filter(regex='_Pos') × 3)"""
+    all_teams = sorted(df['Equipo'].unique())
+    all_seasons = sorted(df['Temporada'].unique())
+
+    tracking = []
+    for team in all_teams:
+        row = {'Equipo': team}
+        for season in all_seasons:
+            data = df[(df['Equipo'] == team) & (df['Temporada'] == season)]
+            if len(data) > 0:
+                row[f'{season}_Pos'] = data.iloc[0]['Pos']
+                row[f'{season}_Pts'] = data.iloc[0]['Pts']
+            else:
+                row[f'{season}_Pos'] = None
+                row[f'{season}_Pts'] = None
+        tracking.append(row)
+
+    tracking_df = pd.DataFrame(tracking)
+    tracking_df['Total_Temporadas'] = tracking_df.filter(regex='_Pos').notna().sum(axis=1)
+    tracking_df['Mejor_Posicion'] = tracking_df.filter(regex='_Pos').min(axis=1)
+    tracking_df['Peor_Posicion'] = tracking_df.filter(regex='_Pos').max(axis=1)
+    return tracking_df.sort_values('Total_Temporadas', ascending=False)
+
+
+ODDS_PROVIDERS = ['B365', 'BW', 'IW', 'PS', 'WH', 'VC', 'Max', 'Avg']
+
+
+def synthetic_raw_csv(rng, n_teams=24, bad_lines=0, quoted=False, latin1=False, bom=False, prefix='Team'):
+    """
+    CSV crudo con el formato de football-data.co.uk (bytes, ~100 columnas)
+
+    Args:
+        rng (np.random.Generator): Generador aleatorio (reproducible)
+        n_teams (int): Equipos (liga a doble vuelta)
+        bad_lines (int): Filas con campos de más (las que on_bad_lines='skip' descarta)
+        quoted (bool): Árbitro entre comillas y con coma ("Dean, M")
+        latin1 (bool): Codificar en latin-1 con acentos en el árbitro
+        bom (bool): Añadir BOM UTF-8 al principio
+        prefix (str): Prefijo de los nombres de equipo
+
+    Returns:
+        bytes
+    """
+    season = synthetic_season(rng, n_teams, prefix)
+    stats = ['HS', 'AS', 'HST', 'AST', 'HF', 'AF', 'HC', 'AC', 'HY', 'AY', 'HR', 'AR']
+    odds = [f'{p}{r}' for p in ODDS_PROVIDERS for r in ('H', 'D', 'A')]
+    odds += [f'{p}{r}' for p in ODDS_PROVIDERS for r in ('>2.5', '<2.5')]
+    odds += [f'{p}AH{r}' for p in ODDS_PROVIDERS for r in ('H', 'A')]
+    header = (['Div', 'Date', 'Time', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR',
+               'HTHG', 'HTAG', 'HTR', 'Referee'] + stats + odds)
+
+    referee = '"Dean, M"' if quoted else ('Mañé Ó' if latin1 else 'M Dean')
+    lines = [','.join(header)]
+    for i, row in enumerate(season.itertuples(index=False)):
+        hthg, htag = min(row.FTHG, 1), min(row.FTAG, 1)
+        htr = 'H' if hthg > htag else ('A' if htag > hthg else 'D')
+        values = (['E1', f'{1 + i % 28:02d}/08/2019', '15:00', row.HomeTeam, row.AwayTeam,
+                   str(row.FTHG), str(row.FTAG), row.FTR, str(hthg), str(htag), htr, referee]
+                  + [str(v) for v in rng.integers(0, 25, len(stats))]
+                  + [f'{v:.2f}' for v in rng.uniform(1.01, 15, len(odds))])
+        lines.append(','.join(values))
+
+    bad_rows = rng.choice(np.arange(1, len(lines)), size=min(bad_lines, len(lines) - 1), replace=False)
+    for idx in bad_rows:
+        lines[idx] += ',,extra'
+    lines.append(',' * (len(header) - 1))
+
+    text = '\r\n'.join(lines) + '\r\n'
+    raw = text.encode('latin-1' if latin1 else 'utf-8')
+    return (b'\xef\xbb\xbf' + raw) if bom else raw
+
+
+def legacy_parse_csv(text):
+    """Lectura original con reintentos (estándar → on_bad_lines='skip' → latin-1) sobre el texto"""
+    from io import StringIO
+
+    df = None
+    try:
+        df = pd.read_csv(StringIO(text), encoding='utf-8')
+    except Exception:
+        pass
+    if df is None:
+        try:
+            df = pd.read_csv(StringIO(text), encoding='utf-8', on_bad_lines='skip')
+        except Exception:
+            try:
+                df = pd.read_csv(StringIO(text), encoding='utf-8', error_bad_lines=False)
+            except Exception:
+                pass
+    if df is None:
+        try:
+            df = pd.read_csv(StringIO(text), encoding='latin-1')
+        except Exception:
+            pass
+    return df
@@ -0,0 +1,224 @@
+"""
+Línea de comandos única para los scrapers
+
+Permite elegir divisiones, rango de temporadas, política de caché, paralelismo
+y formatos de salida sin editar el código:
+
+    python cli.py scrape                                      # pirámide completa 1993-2025
+    python cli.py scrape --divisions "League Two" --start-year 2020 --end-year 2025
+    python cli.py scrape --divisions E0 E1 --backend asyncio --concurrency 16
+    python cli.py scrape --cache revalidate --formats         # solo CSV, revalidando todo
+    python cli.py refresh --divisions "National League"       # refresco incremental
+    python cli.py rebuild --offline                           # desde el almacén de partidos
+    python cli.py premier --start-year 2010 --debug-failed    # módulo Premier League
+    python cli.py premier --from-pyramid                      # Premier League sin red, desde la pirámide
+    python cli.py scrape --premier                            # pirámide + archivos de la Premier League
+
+Las divisiones se indican por nombre ('League Two'), código ('E3') o clase
+('LeagueTwoScraper'). El año final es exclusivo, como en los scrapers: 2020-2025
+son las temporadas 2020-21 a 2024-25. Con una selección parcial, `scrape` solo
+descarga esas (división, temporada) y las sustituye en el dataset existente.
+"""
+
+import argparse
+import sys
+
+import dataset_io
+from log_setup import setup_logging
+
+FORMATS = ['parquet', 'sqlite']
+CACHE_POLICIES = ['use', 'revalidate', 'off']
+
+
+def add_selection_arguments(parser):
+    """Divisiones y rango de temporadas"""
+    parser.add_argument('--divisions', nargs='+', metavar='DIV',
+                        help="Divisiones por nombre, código o clase (por defecto, todas)")
+    parser.add_argument('--start-year', type=int, help='Primer año (e.g., 2020 = temporada 2020-21)')
+    parser.add_argument('--end-year', type=int, help='Año final, exclusivo (e.g., 2025 = hasta 2024-25)')
+
+
+def add_cache_argument(parser):
+    parser.add_argument('--cache', choices=CACHE_POLICIES, default='use',
+                        help="use: temporadas cerradas desde caché (por defecto); "
+                             "revalidate: petición condicional para todas; off: sin caché")
+
+
+def add_output_arguments(parser, formats=FORMATS, pyramid=True):
+    """Formatos de salida además del CSV (y archivos opcionales de la pirámide)"""
+    parser.add_argument('--formats', nargs='*', choices=formats, default=formats,
+                        help='Salidas además del CSV (sin valores = solo CSV)')
+    if pyramid:
+        parser.add_argument('--no-wide-tracking', dest='wide_tracking', action='store_false',
+                            help='No regenerar el tracking ancho legacy (english_leagues_tracking.csv)')
+        parser.add_argument('--premier', action='store_true',
+                            help='Derivar también el dataset y el tracking de la Premier League (sin descargar E0)')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help='Descargar y procesar la pirámide (o una selección)')
+    add_selection_arguments(scrape)
+    add_cache_argument(scrape)
+    scrape.add_argument('--workers', type=int, help='Descargas simultáneas por división (backend threads)')
+    scrape.add_argument('--backend', choices=['threads', 'asyncio'], default='threads')
+    scrape.add_argument('--concurrency', type=int, help='Peticiones simultáneas en total (backend asyncio)')
+    scrape.add_argument('--processes', type=int,
+                        help='Procesos para parsear (0 = todos los núcleos; por defecto, en este proceso)')
+    scrape.add_argument('--rate', type=float, help='Peticiones por segundo y host')
+    add_output_arguments(scrape)
+
+    refresh = commands.add_parser('refresh', help='Refresco incremental de las particiones que cambiaron')
+    add_selection_arguments(refresh)
+
+    rebuild = commands.add_parser('rebuild', help='Reconstruir todo desde la caché con el cálculo por lotes '
+                                                  '(revalida en red las temporadas en curso; --offline: sin red)')
+    rebuild.add_argument('--offline', action='store_true',
+                         help='Sin red: desde el almacén de partidos, sin CSVs crudos ni revalidación')
+    rebuild.add_argument('--workers', type=int, help='Lecturas simultáneas por división')
+    add_output_arguments(rebuild)
+
+    premier = commands.add_parser('premier', help='Dataset de la Premier League (scraper_premier_league)')
+    premier.add_argument('--start-year', type=int, default=1993)
+    premier.add_argument('--end-year', type=int, default=2025)
+    premier.add_argument('--debug-failed', action='store_true', help='Diagnosticar las temporadas fallidas')
+    premier.add_argument('--from-pyramid', action='store_true',
+                         help='Sin red: proyectar el dataset existente de la pirámide (english_leagues_completo.csv)')
+    add_cache_argument(premier)
+    add_output_arguments(premier, formats=['parquet'], pyramid=False)
+
+    return parser
+
+
+def apply_cache_policy(scrapers, policy):
+    """Aplica la política de caché a cada scraper (ver --cache)"""
+    for scraper in scrapers:
+        if policy == 'off':
+            scraper.cache = None
+        elif policy == 'revalidate':
+            # Ninguna temporada se considera cerrada: todas se revalidan
+            scraper.immutable_before = 0
+
+
+def selected_scrapers(args, sel, match_store=None):
+    """
+    Scrapers de la selección de la línea de comandos (None si no hay selección)
+
+    Raises:
+        ValueError: Si una división no existe o el rango no contiene temporadas
+    """
+    if args.divisions is None and args.start_year is None and args.end_year is None:
+        return None
+    scrapers = sel.build_scrapers(match_store, args.divisions, args.start_year, args.end_year)
+    if not scrapers:
+        raise ValueError("La selección no contiene ninguna temporada")
+    return scrapers
+
+
+def validate_selection(parser, args):
+    """Errores de selección como errores de uso, antes de configurar el log o tocar la red"""
+    if not hasattr(args, 'divisions'):
+        return
+    import scraper_english_leagues as sel
+
+    try:
+        selected_scrapers(args, sel)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def run_scrape(args):
+    import scraper_english_leagues as sel
+
+    scrapers = selected_scrapers(args, sel)
+    # Sin selección se descarga la pirámide completa aunque haya que configurar sus scrapers
+    partial = scrapers is not None
+    if args.cache != 'use' or args.rate is not None:
+        scrapers = scrapers or sel.build_scrapers()
+        apply_cache_policy(scrapers, args.cache)
+        for scraper in scrapers:
+            if args.rate is not None:
+                scraper.requests_per_second = args.rate
+
+    options = {}
+    if args.workers is not None:
+        options['max_workers'] = args.workers
+    if args.concurrency is not None:
+        options['concurrency'] = args.concurrency
+    result = sel.scrape_all_divisions(
+        wide_tracking=args.wide_tracking, backend=args.backend, processes=args.processes,
+        scrapers=scrapers, database='sqlite' in args.formats, premier=args.premier, partial=partial, **options
+    )
+    return 0 if result is not None else 1
+
+
+def run_refresh(args):
+    import scraper_english_leagues as sel
+    from match_store import MatchStore
+
+    scrapers = selected_scrapers(args, sel, MatchStore())
+    # Con rango de años se revisan todas sus temporadas; sin él, la última de cada división
+    seasons = None
+    if scrapers is not None and (args.start_year is not None or args.end_year is not None):
+        seasons = sorted({season for scraper in scrapers for season in scraper.get_seasons()})
+    sel.refresh_incremental(seasons=seasons, scrapers=scrapers)
+    return 0
+
+
+def run_rebuild(args):
+    import scraper_english_leagues as sel
+
+    options = {'max_workers': args.workers} if args.workers is not None else {}
+    result = sel.rebuild_from_cache(wide_tracking=args.wide_tracking, offline=args.offline,
+                                    database='sqlite' in args.formats, premier=args.premier, **options)
+    return 0 if result is not None else 1
+
+
+def run_premier(args):
+    import scraper_premier_league as spl
+
+    if args.from_pyramid:
+        result = spl.derive_from_pyramid()
+        return 0 if result is not None else 1
+    if args.cache == 'off':
+        spl.http_cache = None
+    elif args.cache == 'revalidate':
+        spl.IMMUTABLE_BEFORE = 0
+    result = spl.scrape_all_seasons(args.start_year, args.end_year, debug_failed=args.debug_failed)
+    return 0 if result is not None else 1
+
+
+COMMANDS = {
+    'scrape': ('scraper_english_leagues', run_scrape),
+    'refresh': ('scraper_english_leagues', run_refresh),
+    'rebuild': ('scraper_english_leagues', run_rebuild),
+    'premier': ('scraper_premier_league', run_premier),
+}
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos
+
+    Args:
+        argv (list): Argumentos (None = sys.argv[1:])
+
+    Returns:
+        int: Código de salida
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    log_name, run = COMMANDS[args.command]
+
+    validate_selection(parser, args)
+
+    if hasattr(args, 'formats'):
+        dataset_io.COLUMNAR_OUTPUT = 'parquet' in args.formats
+    setup_logging(log_name)
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Lectura de los CSV de football-data.co.uk en una sola pasada sobre los bytes
+
+Sustituye la cadena de reintentos sobre response.text (lectura estándar →
+on_bad_lines='skip' → error_bad_lines → latin-1), que volvía a parsear el
+archivo entero en cada fallo y decodificaba el texto aunque luego no se usara:
+
+- El encoding se detecta una vez sobre los bytes (BOM, UTF-8 o latin-1)
+- Las filas mal formadas (más campos que la cabecera) se localizan con NumPy y
+  se saltan en la misma lectura, igual que hacía on_bad_lines='skip'
+- Solo se parsean las columnas pedidas (usecols) con tipos explícitos: texto
+  como object y el resto (goles, estadísticas, cuotas) como float64, sin que
+  pandas tenga que inferirlos en cada lectura
+
+También convierte las columnas de goles a enteros por columna completa
+(coerce_goals) en lugar de llamar a safe_int_conversion celda a celda.
+"""
+
+import csv
+import re
+import warnings
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from pandas.errors import ParserWarning
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Columnas necesarias para calcular clasificaciones
+STANDINGS_INPUT_COLUMNS = ['HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR']
+
+# Lo que safe_int_conversion elimina del texto antes de convertir (en ASCII)
+NON_GOAL_CHARS = re.compile(r'[^0-9.\n]')
+
+# Dígitos de más a partir de los que float() pierde precisión (se delegan en safe_int_conversion)
+MAX_VECTORIZED_DIGITS = 15
+
+# Columnas de texto, leídas como object
+TEXT_COLUMNS = ['Div', 'Date', 'Time', 'HomeTeam', 'AwayTeam', 'FTR', 'HTR', 'Referee']
+
+# Tipo del resto de columnas (goles, estadísticas y cuotas): float64 y no int64
+# porque las filas vacías del final de los CSV dejan NaN también en los goles
+NUMERIC_DTYPE = 'float64'
+
+
+def detect_encoding(raw):
+    """Encoding de un CSV a partir de sus bytes: utf-8-sig (BOM), utf-8 o latin-1"""
+    if raw.startswith(UTF8_BOM):
+        return 'utf-8-sig'
+    try:
+        raw.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def header_columns(raw, encoding):
+    """Nombres de columna de la cabecera (primera línea), sin parsear el resto del CSV"""
+    first_line = raw.split(b'\n', 1)[0].decode(encoding, errors='replace').rstrip('\r')
+    return next(csv.reader([first_line]), [])
+
+
+def column_dtypes(header, columns=None):
+    """
+    Tipos explícitos para read_csv: texto → object, el resto → NUMERIC_DTYPE
+
+    Args:
+        header (list): Columnas del CSV (header_columns)
+        columns (list): Columnas que se van a parsear (None = todas)
+
+    Returns:
+        dict: Columna → dtype
+    """
+    return {
+        col: object if col in TEXT_COLUMNS else NUMERIC_DTYPE
+        for col in header if col and (columns is None or col in columns)
+    }
+
+
+def find_overlong_lines(raw):
+    """
+    Líneas con más campos que la cabecera (las que on_bad_lines='skip' descartaba)
+
+    Cuenta comas por línea de forma vectorizada. Solo es válido si el CSV no usa
+    comillas (las comas dentro de un campo entrecomillado no separan campos).
+
+    Returns:
+        ndarray: Índices de línea en el archivo (0 = cabecera)
+    """
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    line_ends = np.flatnonzero(buf == ord('\n'))
+    if len(line_ends) == 0 or line_ends[-1] != len(buf) - 1:
+        line_ends = np.append(line_ends, len(buf))
+    commas = np.flatnonzero(buf == ord(','))
+    commas_before_end = np.searchsorted(commas, line_ends)
+    fields = np.diff(np.r_[0, commas_before_end]) + 1
+    return np.flatnonzero(fields > fields[0])
+
+
+def safe_int_conversion(value):
+    """Convierte a entero de forma segura"""
+    try:
+        if pd.isna(value):
+            return 0
+        if isinstance(value, str):
+            # Eliminar espacios y caracteres no numéricos
+            cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
+            if cleaned:
+                return int(float(cleaned))
+        return int(value)
+    except:
+        return 0
+
+
+def coerce_goals(values):
+    """
+    Versión vectorizada de safe_int_conversion para una columna completa
+
+    Da el mismo entero que safe_int_conversion en cada celda: nulos → 0, texto
+    limpio de caracteres que no son dígitos ni punto, decimales truncados y
+    valores ilegibles → 0. Las celdas que la vía vectorizada no reproduce con
+    exactitud (texto no ASCII, números muy largos, columnas con objetos que no
+    son texto) se convierten una a una con safe_int_conversion.
+
+    Args:
+        values (Series): Columna de goles tal como se leyó del CSV
+
+    Returns:
+        tuple: (Series de int64, Series booleana con las filas corregidas: las que
+        no se leían tal cual como ese número y se limpiaron o se pusieron a 0)
+    """
+    fallback = np.zeros(len(values), dtype=bool)
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        numbers = values.astype('float64').to_numpy()
+        # Leídos tal cual: solo se corrigen nulos, infinitos y decimales
+        as_read = numbers
+    elif pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+        text = values.to_numpy(dtype=object)
+        present = pd.notna(text)
+        cells = text[present].tolist()
+        # Una sola pasada de la regex sobre todas las celdas unidas por saltos de línea
+        joined = '\n'.join(cells)
+        if joined.count('\n') == max(len(cells) - 1, 0):
+            cleaned = NON_GOAL_CHARS.sub('', joined).split('\n')[:len(cells)]
+        else:
+            cleaned = [NON_GOAL_CHARS.sub('', cell).replace('\n', '') for cell in cells]
+
+        # float() acepta el texto limpio si tiene algún dígito y a lo sumo un punto
+        digits = np.array(cleaned, dtype=str)
+        lengths = np.char.str_len(digits)
+        dots = np.char.count(digits, '.')
+        readable = (lengths > dots) & (dots <= 1)
+        present_numbers = np.full(len(cells), np.nan)
+        present_numbers[readable] = digits[readable].astype('float64')
+        numbers = np.full(len(values), np.nan)
+        numbers[present] = present_numbers
+
+        inexact = lengths > MAX_VECTORIZED_DIGITS
+        if not joined.isascii():
+            inexact |= ~np.fromiter(map(str.isascii, cells), dtype=bool, count=len(cells))
+        fallback[present] = inexact
+
+        # Leídos tal cual: texto que ya era solo el número
+        as_read = numbers.copy()
+        as_read[present] = np.where(digits == np.array(cells, dtype=str), present_numbers, np.nan)
+    else:
+        fallback[:] = True
+        numbers = np.zeros(len(values))
+        as_read = np.full(len(values), np.nan)
+
+    # int(x) trunca hacia cero; nulos, infinitos y texto ilegible → 0
+    numbers = np.where(np.isfinite(numbers) & ~fallback, numbers, 0)
+    goals = np.trunc(numbers).astype('int64')
+    if fallback.any():
+        goals[fallback] = [safe_int_conversion(value) for value in values[fallback]]
+        as_read[fallback] = pd.to_numeric(values[fallback], errors='coerce').astype('float64')
+
+    coerced = ~(as_read == goals)
+    return pd.Series(goals, index=values.index, name=values.name), pd.Series(coerced, index=values.index)
+
+
+def read_matches_csv(raw, columns=None):
+    """
+    Lee un CSV de football-data.co.uk en una sola pasada
+
+    Args:
+        raw (bytes): Contenido del CSV tal como se descargó
+        columns (list): Columnas a parsear (None = todas)
+
+    Returns:
+        tuple: (DataFrame, filas mal formadas descartadas, encoding detectado)
+    """
+    if isinstance(raw, str):
+        raw = raw.encode('utf-8')
+    encoding = detect_encoding(raw)
+    usecols = None if columns is None else (lambda col: col in columns)
+    dtype = column_dtypes(header_columns(raw, encoding), columns)
+    # Si una celda numérica trae texto (e.g., un gol "2x"), se relee con los
+    # números inferidos y coerce_goals limpia los goles después
+    text_dtype = {col: kind for col, kind in dtype.items() if kind is object}
+
+    if b'"' not in raw:
+        skiprows = find_overlong_lines(raw).tolist() or None
+        try:
+            df = pd.read_csv(BytesIO(raw), encoding=encoding, usecols=usecols, dtype=dtype, skiprows=skiprows)
+        except ValueError:
+            df = pd.read_csv(BytesIO(raw), encoding=encoding, usecols=usecols, dtype=text_dtype, skiprows=skiprows)
+        return df, len(skiprows or []), encoding
+
+    # Con comillas no se pueden contar campos por comas: el parser salta las filas
+    # mal formadas y avisa de cada una (con usecols no las detectaría)
+    try:
+        df, skipped = _read_quoted(raw, encoding, dtype)
+    except ValueError:
+        df, skipped = _read_quoted(raw, encoding, text_dtype)
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
+    return df, skipped, encoding
+
+
+def _read_quoted(raw, encoding, dtype):
+    """read_csv de un CSV con comillas: (DataFrame, filas mal formadas saltadas)"""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', ParserWarning)
+        df = pd.read_csv(BytesIO(raw), encoding=encoding, dtype=dtype, on_bad_lines='warn')
+    skipped = sum(
+        str(warning.message).count('Skipping line')
+        for warning in caught if issubclass(warning.category, ParserWarning)
+    )
+    return df, skipped
@@ -0,0 +1,126 @@
+"""
+Salida columnar (Parquet) junto a los CSV y carga preferente de esos archivos
+
+Cada CSV generado por los scrapers se acompaña de un .parquet con tipos ya
+resueltos: Division/Equipo/Temporada como categorías, estadísticas como enteros
+pequeños y Dif como entero con signo (no el texto "+42"). Los lectores usan el
+Parquet si existe y está al día, y permiten leer solo algunas columnas.
+
+Requiere pyarrow; si no está instalado se sigue trabajando solo con CSV.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Se puede desactivar para escribir solo CSV (e.g., cli.py --formats sin parquet)
+COLUMNAR_OUTPUT = True
+
+_parquet_available = None
+
+
+def parquet_available():
+    """True si pyarrow está instalado (se comprueba una sola vez)"""
+    global _parquet_available
+    if _parquet_available is None:
+        try:
+            import pyarrow  # noqa: F401
+            _parquet_available = True
+        except ImportError:
+            _parquet_available = False
+    return _parquet_available
+
+
+def columnar_path(csv_path):
+    """Ruta del Parquet asociado a un CSV (mismo nombre, extensión .parquet)"""
+    return Path(csv_path).with_suffix('.parquet')
+
+
+def _integer_dtype(values, nullable):
+    """Entero más pequeño que admite los valores (int16/int32; int8 se queda corto al operar)"""
+    finite = values[~np.isnan(values)] if values.dtype.kind == 'f' else values
+    low, high = (finite.min(), finite.max()) if len(finite) else (0, 0)
+    for bits in (16, 32):
+        info = np.iinfo(f'int{bits}')
+        if info.min <= low and high <= info.max:
+            return f'Int{bits}' if nullable else f'int{bits}'
+    return 'Int64' if nullable else 'int64'
+
+
+def to_columnar(df):
+    """
+    Convierte una tabla de salida a tipos compactos
+
+    - Texto → category (Temporada, Division, Equipo, {temporada}_Division, ...)
+    - Dif ("+42", "-7") → entero con signo
+    - Números enteros → int16/int32, o Int* nullable si hay huecos
+    - Fechas → sin cambios
+    """
+    typed = {}
+    for col in df.columns:
+        values = df[col]
+        if col == 'Dif' and not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values.astype(str).str.replace('+', '', regex=False))
+        if pd.api.types.is_datetime64_any_dtype(values):
+            typed[col] = values
+            continue
+        if pd.api.types.is_bool_dtype(values) or not pd.api.types.is_numeric_dtype(values):
+            typed[col] = values.astype('category')
+            continue
+        array = values.to_numpy(dtype='float64')
+        finite = array[~np.isnan(array)]
+        if np.array_equal(finite, np.round(finite)):
+            has_gaps = len(finite) < len(array)
+            typed[col] = values.astype(_integer_dtype(array, nullable=has_gaps))
+        else:
+            typed[col] = values
+    return pd.DataFrame(typed, index=df.index)
+
+
+def write_columnar(df, csv_path):
+    """
+    Escribe el Parquet tipado que acompaña a un CSV
+
+    Returns:
+        Path o None si pyarrow no está disponible o la salida Parquet está desactivada
+    """
+    if not COLUMNAR_OUTPUT:
+        return None
+    if not parquet_available():
+        logger.info("pyarrow no instalado: se omite la salida Parquet")
+        return None
+    path = columnar_path(csv_path)
+    to_columnar(df).to_parquet(path, index=False)
+    logger.info(f"✓ Parquet guardado: {path}")
+    return path
+
+
+def load_table(csv_path, columns=None):
+    """
+    Carga una tabla de salida, prefiriendo su Parquet si existe y está al día
+
+    Args:
+        csv_path (str or Path): Ruta del CSV (e.g., 'english_leagues_completo.csv')
+        columns (list): Columnas a leer (None = todas). Con Parquet solo se leen esas
+
+    Returns:
+        DataFrame
+
+    Raises:
+        FileNotFoundError: Si no existe ni el Parquet ni el CSV
+    """
+    csv_path = Path(csv_path)
+    parquet = columnar_path(csv_path)
+
+    # Un CSV más reciente (e.g., editado a mano) invalida el Parquet
+    parquet_fresh = parquet.exists() and (
+        not csv_path.exists() or parquet.stat().st_mtime >= csv_path.stat().st_mtime
+    )
+    if parquet_fresh and parquet_available():
+        return pd.read_parquet(parquet, columns=columns)
+
+    return pd.read_csv(csv_path, usecols=columns, encoding='utf-8-sig')
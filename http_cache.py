@@ -0,0 +1,199 @@
+"""
+Caché HTTP persistente en disco para los CSVs de football-data.co.uk
+
+- Contenido direccionado por hash: cada cuerpo se guarda una sola vez en
+  objects/<sha256>, y un índice por URL apunta al objeto vigente
+- Guarda ETag y Last-Modified para revalidar con peticiones condicionales
+- Las temporadas cerradas se tratan como inmutables y nunca se vuelven a pedir
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from http_client import get_client
+
+DEFAULT_CACHE_DIR = Path('cache') / 'football_data'
+
+
+def default_immutable_before(today=None):
+    """
+    Año de inicio de la temporada en curso (o la última disputada)
+
+    Las temporadas que empiezan antes de este año ya terminaron y sus CSVs
+    no cambian. Se considera que una temporada arranca en julio.
+    """
+    today = today or datetime.now()
+    return today.year if today.month >= 7 else today.year - 1
+
+
+def season_start_year(season):
+    """Año inicial de una temporada con formato '1993-94'"""
+    return int(season.split('-')[0])
+
+
+class CachedResponse:
+    """Respuesta mínima compatible con el uso que hacen los scrapers de requests.Response"""
+
+    def __init__(self, url, status_code, content=b'', encoding=None, from_cache=False, changed=False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.from_cache = from_cache
+        self.changed = changed
+
+    @property
+    def text(self):
+        """Decodifica el contenido con el mismo encoding que usó requests al descargarlo"""
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class HTTPCache:
+    """Caché de respuestas HTTP en disco con revalidación condicional"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Args:
+            cache_dir (str or Path): Directorio raíz de la caché (se crea al escribir)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / 'objects'
+        self.index_dir = self.cache_dir / 'index'
+        self._lock = threading.Lock()
+
+    def _index_path(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.index_dir / f'{key}.json'
+
+    def _object_path(self, digest):
+        return self.objects_dir / digest[:2] / digest
+
+    def _write_atomic(self, path, data):
+        """Escribe a un temporal y lo renombra para no dejar ficheros a medias"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def lookup(self, url):
+        """Devuelve los metadatos guardados para una URL (o None)"""
+        path = self._index_path(url)
+        try:
+            meta = json.loads(path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return None
+        if not self._object_path(meta['sha256']).exists():
+            return None
+        return meta
+
+    def load(self, meta):
+        """Lee el contenido crudo asociado a unos metadatos"""
+        return self._object_path(meta['sha256']).read_bytes()
+
+    def store(self, url, content, encoding=None, etag=None, last_modified=None):
+        """Guarda el contenido de una URL y devuelve sus metadatos"""
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            self._write_atomic(object_path, content)
+
+        meta = {
+            'url': url,
+            'sha256': digest,
+            'size': len(content),
+            'encoding': encoding,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self._write_atomic(self._index_path(url), json.dumps(meta, indent=2).encode('utf-8'))
+        return meta
+
+    def get(self, url, immutable=False, timeout=10, throttle=None, http_get=None):
+        """
+        Obtiene una URL usando la caché
+
+        Args:
+            url (str): URL a descargar
+            immutable (bool): Si hay copia local, se usa sin tocar la red
+            timeout (int): Timeout de la petición HTTP
+            throttle (callable): Se invoca justo antes de cada petición de red
+            http_get (callable): Función compatible con requests.get (por defecto, el
+                cliente compartido de http_client, con pool y reintentos)
+
+        Returns:
+            CachedResponse
+        """
+        http_get = http_get or get_client().get
+        meta = self.lookup(url)
+
+        if meta is not None and immutable:
+            return CachedResponse(url, 200, self.load(meta), meta.get('encoding'), from_cache=True)
+
+        if throttle is not None:
+            throttle()
+        response = http_get(url, timeout=timeout, headers=self._conditional_headers(meta))
+        return self._handle_response(url, meta, response)
+
+    async def get_async(self, url, http_get, immutable=False, timeout=10):
+        """
+        Versión asíncrona de get (misma caché y mismas reglas de revalidación)
+
+        Args:
+            url (str): URL a descargar
+            http_get (callable): Corrutina compatible con requests.get (e.g., AsyncHTTPClient.get)
+            immutable (bool): Si hay copia local, se usa sin tocar la red
+            timeout (int): Timeout de la petición HTTP
+
+        Returns:
+            CachedResponse
+        """
+        meta = self.lookup(url)
+
+        if meta is not None and immutable:
+            return CachedResponse(url, 200, self.load(meta), meta.get('encoding'), from_cache=True)
+
+        response = await http_get(url, timeout=timeout, headers=self._conditional_headers(meta))
+        return self._handle_response(url, meta, response)
+
+    def _conditional_headers(self, meta):
+        """Cabeceras de revalidación (ETag / Last-Modified) de la copia guardada"""
+        headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def _handle_response(self, url, meta, response):
+        """Convierte la respuesta de red en CachedResponse y guarda el contenido nuevo"""
+        if response.status_code == 304 and meta is not None:
+            return CachedResponse(url, 200, self.load(meta), meta.get('encoding'), from_cache=True)
+
+        if response.status_code != 200:
+            return CachedResponse(url, response.status_code)
+
+        content = response.content
+        encoding = response.encoding or response.apparent_encoding
+        new_meta = self.store(
+            url,
+            content,
+            encoding=encoding,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        changed = meta is None or meta['sha256'] != new_meta['sha256']
+        return CachedResponse(url, 200, content, encoding, changed=changed)
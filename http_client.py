@@ -0,0 +1,222 @@
+"""
+Transporte HTTP compartido por todos los scrapers
+
+Antes cada descarga era un requests.get suelto: conexión TCP/TLS nueva por
+temporada, sin reintentos (un 503 o un timeout puntual dejaba la temporada como
+fallida) y sin medidas de latencia. Aquí:
+
+- HTTPClient: una requests.Session con pool de conexiones keep-alive
+  (HTTPAdapter) compartido por los hilos del pipeline
+- Reintentos con backoff exponencial y jitter ante 5xx, timeouts y errores de
+  conexión (los 4xx, e.g. 404 de una temporada inexistente, no se reintentan)
+- RequestMetrics: latencia, intentos y bytes de cada petición, con resumen
+  (p50/p95/máx) para el log
+
+get_client() devuelve el cliente compartido; HTTPClient.get es compatible con
+requests.get (url, timeout, headers) y se puede pasar como http_get a HTTPCache.
+requests se importa al crear el primer cliente (importar los scrapers no lo carga).
+"""
+
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 3
+# Espera base del primer reintento (se duplica en cada intento, hasta MAX_BACKOFF)
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 8.0
+# Conexiones keep-alive por host: debe cubrir las descargas simultáneas (hilos
+# del pipeline o concurrencia del backend asyncio); las que sobran se cierran
+DEFAULT_POOL_SIZE = 32
+
+# Respuestas que se reintentan: errores transitorios del servidor
+RETRY_STATUS = frozenset({500, 502, 503, 504})
+
+
+class RequestMetrics:
+    """Registro thread-safe de las peticiones HTTP (una entrada por petición lógica)"""
+
+    COLUMNS = ['Host', 'URL', 'Estado', 'Intentos', 'Segundos', 'Bytes', 'Error']
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(self, url, status, attempts, elapsed, size=0, error=None):
+        """
+        Registra una petición
+
+        Args:
+            url (str): URL pedida
+            status (int): Código HTTP final (None si no hubo respuesta)
+            attempts (int): Intentos realizados (1 = sin reintentos)
+            elapsed (float): Latencia de red en segundos (suma de los intentos)
+            size (int): Bytes del cuerpo recibido
+            error (str): Tipo de excepción si la petición falló sin respuesta
+        """
+        with self._lock:
+            self.records.append((urlparse(url).netloc, url, status, attempts, elapsed, size, error))
+
+    def __len__(self):
+        return len(self.records)
+
+    def to_frame(self):
+        """Peticiones como DataFrame (una fila por petición)"""
+        with self._lock:
+            records = list(self.records)
+        return pd.DataFrame(records, columns=self.COLUMNS)
+
+    def summary(self):
+        """
+        Resumen de las peticiones registradas
+
+        Returns:
+            dict: Peticiones, Reintentos, Fallidas, p50/p95/máx de latencia (ms) y MB recibidos
+        """
+        df = self.to_frame()
+        latency_ms = df['Segundos'].to_numpy(dtype='float64') * 1000
+        failed = df['Error'].notna() | (df['Estado'].fillna(0) >= 400)
+        return {
+            'Peticiones': len(df),
+            'Reintentos': int((df['Intentos'] - 1).sum()),
+            'Fallidas': int(failed.sum()),
+            'p50_ms': float(np.percentile(latency_ms, 50)) if len(df) else 0.0,
+            'p95_ms': float(np.percentile(latency_ms, 95)) if len(df) else 0.0,
+            'max_ms': float(latency_ms.max()) if len(df) else 0.0,
+            'MB': df['Bytes'].sum() / 1e6,
+        }
+
+    def log(self):
+        """Escribe el resumen en el log (nada si no hubo peticiones de red)"""
+        if not self.records:
+            return
+        s = self.summary()
+        logger.info("")
+        logger.info("="*70)
+        logger.info("PETICIONES HTTP")
+        logger.info("="*70)
+        logger.info(f"Peticiones: {s['Peticiones']} ({s['Reintentos']} reintentos, {s['Fallidas']} fallidas)")
+        logger.info(f"Latencia: p50 {s['p50_ms']:.0f}ms, p95 {s['p95_ms']:.0f}ms, máx {s['max_ms']:.0f}ms")
+        logger.info(f"Descargado: {s['MB']:.2f} MB")
+
+
+class HTTPClient:
+    """Sesión HTTP con pool keep-alive, reintentos con backoff y métricas de latencia"""
+
+    def __init__(self, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF,
+                 pool_size=DEFAULT_POOL_SIZE, headers=None, sleep=time.sleep):
+        """
+        Args:
+            retries (int): Reintentos tras el primer intento (0 = sin reintentos)
+            backoff (float): Espera base en segundos (se duplica en cada reintento)
+            max_backoff (float): Espera máxima entre intentos
+            pool_size (int): Conexiones keep-alive por host
+            headers (dict): Cabeceras comunes a todas las peticiones (e.g., User-Agent)
+            sleep (callable): Función de espera entre reintentos
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sleep = sleep
+        self.metrics = RequestMetrics()
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        # Los reintentos se hacen aquí (con métricas), no en urllib3
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    def backoff_delay(self, attempt):
+        """
+        Espera antes del reintento número attempt + 1
+
+        Backoff exponencial con jitter: la mitad fija y la otra mitad aleatoria,
+        para que los hilos que fallan a la vez no reintenten a la vez.
+        """
+        ceiling = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def get(self, url, timeout=DEFAULT_TIMEOUT, headers=None, throttle=None):
+        """
+        GET con reintentos (compatible con requests.get)
+
+        Args:
+            url (str): URL a descargar
+            timeout (float): Timeout de cada intento
+            headers (dict): Cabeceras de la petición (e.g., If-None-Match)
+            throttle (callable): Se invoca antes de cada intento (límite de tasa por host)
+
+        Returns:
+            requests.Response: Última respuesta (puede ser un 5xx si se agotan los reintentos)
+
+        Raises:
+            requests.RequestException: Si el último intento falla sin respuesta
+        """
+        import requests
+
+        # Latencia de red: suma de los intentos, sin las esperas del límite de tasa ni del backoff
+        elapsed = 0.0
+        for attempt in range(self.retries + 1):
+            if throttle is not None:
+                throttle()
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, timeout=timeout, headers=headers)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                elapsed += time.perf_counter() - start
+                if attempt == self.retries:
+                    self.metrics.record(url, None, attempt + 1, elapsed, error=type(e).__name__)
+                    raise
+                reason = type(e).__name__
+            else:
+                elapsed += time.perf_counter() - start
+                if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                    self.metrics.record(url, response.status_code, attempt + 1, elapsed,
+                                        len(response.content))
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            delay = self.backoff_delay(attempt)
+            logger.info(f"  ↻ {url}: {reason}, reintento {attempt + 1}/{self.retries} en {delay:.1f}s")
+            self.sleep(delay)
+
+    def close(self):
+        """Cierra las conexiones del pool"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Devuelve el HTTPClient compartido por todos los scrapers (se crea al primer uso)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
+
+
+def current_client():
+    """El HTTPClient compartido si ya se creó (None si no; a diferencia de get_client no lo crea)"""
+    return _client
@@ -0,0 +1,394 @@
+"""
+Base de datos SQLite local con índices sobre partidos, clasificaciones y tracking
+
+Las preguntas habituales (tabla de una temporada, historial de un equipo,
+campeones, récords) se resuelven como consultas indexadas en lugar de leer el
+CSV completo y filtrar con pandas.
+
+Tablas:
+    divisions     Division, Division_Num (1 = mejor)
+    teams         Team_ID, Equipo (nombre canónico; IDs alfabéticos al crear la base)
+    standings     Una fila por (Division, Temporada, Equipo), Dif numérico
+    team_seasons  Pertenencia equipo-temporada (el tracking largo)
+    matches       Partidos limpios (Division, Temporada, HomeTeam, AwayTeam, FTHG, FTAG, FTR)
+
+Las búsquedas por equipo usan Team_ID (Home_ID/Away_ID en matches): el nombre
+(o un alias) se resuelve una vez en teams, a los IDs de todas las grafías del club
+guardadas (team_registry.team_spellings), y el resto de la consulta compara enteros.
+"""
+
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+from team_registry import team_spellings
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = 'english_leagues.sqlite'
+
+MATCH_COLUMNS = ['Division', 'Temporada', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR']
+STANDINGS_DB_COLUMNS = ['Temporada', 'Division', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P',
+                        'Pts', 'GF', 'GC', 'Dif']
+TEAM_SEASON_COLUMNS = ['Equipo', 'Temporada', 'Division', 'Division_Num', 'Pos', 'Pts']
+
+# Columnas admitidas en records() (no se interpolan nombres arbitrarios en SQL)
+RECORD_METRICS = ['Pts', 'G', 'E', 'P', 'GF', 'GC', 'Dif']
+
+SCHEMA = """
+CREATE TABLE divisions (
+    Division TEXT PRIMARY KEY,
+    Division_Num INTEGER NOT NULL
+);
+CREATE TABLE teams (
+    Team_ID INTEGER PRIMARY KEY,
+    Equipo TEXT NOT NULL UNIQUE
+);
+CREATE TABLE standings (
+    Temporada TEXT NOT NULL,
+    Division TEXT NOT NULL,
+    Pos INTEGER NOT NULL,
+    Equipo TEXT NOT NULL,
+    PJ INTEGER, G INTEGER, E INTEGER, P INTEGER,
+    Pts INTEGER, GF INTEGER, GC INTEGER, Dif INTEGER,
+    Team_ID INTEGER NOT NULL REFERENCES teams (Team_ID)
+);
+CREATE TABLE team_seasons (
+    Equipo TEXT NOT NULL,
+    Temporada TEXT NOT NULL,
+    Division TEXT NOT NULL,
+    Division_Num INTEGER,
+    Pos INTEGER,
+    Pts INTEGER,
+    Team_ID INTEGER NOT NULL REFERENCES teams (Team_ID)
+);
+CREATE TABLE matches (
+    Division TEXT NOT NULL,
+    Temporada TEXT NOT NULL,
+    HomeTeam TEXT NOT NULL,
+    AwayTeam TEXT NOT NULL,
+    FTHG INTEGER, FTAG INTEGER,
+    FTR TEXT,
+    Home_ID INTEGER NOT NULL REFERENCES teams (Team_ID),
+    Away_ID INTEGER NOT NULL REFERENCES teams (Team_ID)
+);
+CREATE INDEX idx_standings_division_season ON standings (Division, Temporada, Pos);
+CREATE INDEX idx_standings_team ON standings (Team_ID, Temporada);
+CREATE INDEX idx_standings_pos ON standings (Pos, Division, Temporada);
+CREATE INDEX idx_standings_division_pts ON standings (Division, Pts);
+CREATE INDEX idx_team_seasons_team ON team_seasons (Team_ID, Temporada);
+CREATE INDEX idx_team_seasons_season ON team_seasons (Temporada, Division);
+CREATE INDEX idx_matches_division_season ON matches (Division, Temporada);
+CREATE INDEX idx_matches_home ON matches (Home_ID);
+CREATE INDEX idx_matches_away ON matches (Away_ID);
+"""
+
+
+def _sync_teams(conn, names):
+    """
+    Registra en teams los equipos que falten y devuelve {Equipo: Team_ID}
+
+    En una base nueva los IDs salen en orden alfabético (como TeamRegistry); los
+    equipos que aparecen después en un refresco incremental toman IDs nuevos, así
+    que los existentes no cambian.
+    """
+    team_ids = dict(conn.execute("SELECT Equipo, Team_ID FROM teams").fetchall())
+    new_teams = sorted(set(pd.unique(pd.Series(names, dtype=object).dropna())) - set(team_ids))
+    next_id = max(team_ids.values(), default=-1) + 1
+    conn.executemany(
+        "INSERT INTO teams (Team_ID, Equipo) VALUES (?, ?)",
+        [(next_id + i, name) for i, name in enumerate(new_teams)]
+    )
+    team_ids.update({name: next_id + i for i, name in enumerate(new_teams)})
+    return team_ids
+
+
+def _standings_rows(standings, team_ids):
+    """Clasificaciones con Dif numérico (el CSV lo guarda como texto '+42') y Team_ID"""
+    rows = standings[STANDINGS_DB_COLUMNS].copy()
+    if not pd.api.types.is_numeric_dtype(rows['Dif']):
+        rows['Dif'] = pd.to_numeric(rows['Dif'].astype(str).str.replace('+', '', regex=False))
+    # Las columnas de texto pueden llegar como Categorical (tipos compactos)
+    for col in ('Temporada', 'Division', 'Equipo'):
+        rows[col] = rows[col].astype(str)
+    rows['Team_ID'] = rows['Equipo'].map(team_ids)
+    return rows
+
+
+def _team_season_rows(team_seasons, team_ids):
+    """Tracking largo con Team_ID"""
+    rows = team_seasons[TEAM_SEASON_COLUMNS].copy()
+    for col in ('Equipo', 'Temporada'):
+        rows[col] = rows[col].astype(str)
+    rows['Team_ID'] = rows['Equipo'].map(team_ids)
+    return rows
+
+
+def _match_rows(matches, team_ids):
+    """Partidos con las columnas de la tabla matches"""
+    rows = matches[MATCH_COLUMNS].copy()
+    for col in ('Division', 'HomeTeam', 'AwayTeam'):
+        rows[col] = rows[col].astype(str)
+    rows['Home_ID'] = rows['HomeTeam'].map(team_ids)
+    rows['Away_ID'] = rows['AwayTeam'].map(team_ids)
+    return rows
+
+
+def _team_names(*frames):
+    """Nombres de equipo de clasificaciones, tracking y partidos (los que haya)"""
+    columns = {'Equipo', 'HomeTeam', 'AwayTeam'}
+    return pd.concat([
+        frame[col].astype(object) for frame in frames if frame is not None
+        for col in frame.columns if col in columns
+    ], ignore_index=True)
+
+
+def build_database(standings, team_seasons, matches=None, division_order=None, path=DB_FILE):
+    """
+    Genera la base de datos completa (reemplaza la anterior de forma atómica)
+
+    Args:
+        standings (DataFrame): Dataset completo (english_leagues_completo)
+        team_seasons (DataFrame): Tracking largo (TrackingStore.data)
+        matches (DataFrame): Partidos limpios con Division y Temporada (None = tabla vacía)
+        division_order (list): Jerarquía de divisiones (la primera = 1, la mejor)
+        path (str or Path): Archivo SQLite de salida
+
+    Returns:
+        Path: Ruta de la base de datos
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    if division_order is None:
+        division_order = list(pd.unique(standings['Division'].astype(str)))
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany(
+            "INSERT INTO divisions (Division, Division_Num) VALUES (?, ?)",
+            [(division, i + 1) for i, division in enumerate(division_order)]
+        )
+        team_ids = _sync_teams(conn, _team_names(standings, team_seasons, matches))
+        _standings_rows(standings, team_ids).to_sql('standings', conn, if_exists='append', index=False)
+        _team_season_rows(team_seasons, team_ids).to_sql('team_seasons', conn, if_exists='append', index=False)
+        if matches is not None:
+            _match_rows(matches, team_ids).to_sql('matches', conn, if_exists='append', index=False)
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    logger.info(f"✓ Base de datos guardada: {path}")
+    return path
+
+
+def update_partitions(partitions, team_seasons, path=DB_FILE):
+    """
+    Reemplaza solo las particiones (división, temporada) indicadas
+
+    Args:
+        partitions (dict): {(division, temporada): (clasificación, partidos o None)}
+        team_seasons (DataFrame): Tracking largo completo (se reescribe la tabla)
+        path (str or Path): Base de datos existente
+
+    Returns:
+        bool: False si la base de datos no existe o tiene un esquema anterior (no se
+        crea ni se migra aquí: la regenera la siguiente ejecución completa)
+    """
+    if not Path(path).exists():
+        return False
+
+    conn = sqlite3.connect(path)
+    try:
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'teams'").fetchone() is None:
+            logger.warning(f"✗ {path}: esquema anterior sin tabla teams (se regenera en la próxima ejecución completa)")
+            return False
+        with conn:
+            frames = [team_seasons] + [frame for pair in partitions.values() for frame in pair]
+            team_ids = _sync_teams(conn, _team_names(*frames))
+            for (division, season), (standings, matches) in partitions.items():
+                conn.execute("DELETE FROM standings WHERE Division = ? AND Temporada = ?", (division, season))
+                _standings_rows(standings, team_ids).to_sql('standings', conn, if_exists='append', index=False)
+                if matches is not None:
+                    conn.execute("DELETE FROM matches WHERE Division = ? AND Temporada = ?", (division, season))
+                    _match_rows(matches.assign(Division=division, Temporada=season), team_ids).to_sql(
+                        'matches', conn, if_exists='append', index=False
+                    )
+            conn.execute("DELETE FROM team_seasons")
+            _team_season_rows(team_seasons, team_ids).to_sql('team_seasons', conn, if_exists='append', index=False)
+    finally:
+        conn.close()
+
+    logger.info(f"✓ Base de datos actualizada: {path}")
+    return True
+
+
+class LeagueDB:
+    """Consultas frecuentes sobre la base de datos SQLite (cada una usa un índice)"""
+
+    def __init__(self, path=DB_FILE):
+        """
+        Args:
+            path (str or Path): Archivo SQLite generado por build_database
+
+        Raises:
+            FileNotFoundError: Si la base de datos no existe
+        """
+        if not Path(path).exists():
+            raise FileNotFoundError(f"No existe la base de datos: {path}")
+        self.path = Path(path)
+        self.conn = sqlite3.connect(f'{self.path.resolve().as_uri()}?mode=ro', uri=True, check_same_thread=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def query(self, sql, params=()):
+        """Ejecuta una consulta y devuelve un DataFrame"""
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def divisions(self):
+        """Divisiones en orden de la pirámide"""
+        rows = self.conn.execute("SELECT Division FROM divisions ORDER BY Division_Num").fetchall()
+        return [row[0] for row in rows]
+
+    def seasons(self, division):
+        """Temporadas disponibles de una división, en orden cronológico"""
+        rows = self.conn.execute(
+            "SELECT DISTINCT Temporada FROM standings WHERE Division = ? ORDER BY Temporada",
+            (division,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def season_table(self, division, season):
+        """
+        Clasificación de una división en una temporada
+
+        Args:
+            division (str): Nombre de la división (e.g., 'Championship')
+            season (str): Temporada (e.g., '2023-24')
+
+        Returns:
+            DataFrame: Ordenado por Pos (vacío si no existe)
+        """
+        return self.query(
+            "SELECT * FROM standings WHERE Division = ? AND Temporada = ? ORDER BY Pos",
+            (division, season)
+        )
+
+    def team_ids(self, team):
+        """Team_ID de todas las grafías del club guardadas en la base (acepta alias), la pedida primero"""
+        spellings = team_spellings(team)
+        if not spellings:
+            return []
+        rows = self.conn.execute(
+            f"SELECT Equipo, Team_ID FROM teams WHERE Equipo IN ({', '.join('?' * len(spellings))})",
+            spellings
+        ).fetchall()
+        found = dict(rows)
+        return [found[spelling] for spelling in spellings if spelling in found]
+
+    def team_id(self, team):
+        """Team_ID de un equipo (acepta alias); None si no está en la base"""
+        ids = self.team_ids(team)
+        return ids[0] if ids else None
+
+    def team_history(self, team):
+        """Todas las temporadas de un club (todas sus grafías), en orden cronológico"""
+        ids = self.team_ids(team) or [None]
+        return self.query(
+            f"SELECT * FROM standings WHERE Team_ID IN ({', '.join('?' * len(ids))}) ORDER BY Temporada",
+            ids
+        )
+
+    def team_matches(self, team):
+        """Partidos de un club (local y visitante, todas sus grafías), en orden de división y temporada"""
+        ids = self.team_ids(team) or [None]
+        marks = ', '.join('?' * len(ids))
+        return self.query(
+            "SELECT m.* FROM matches m JOIN divisions d USING (Division) "
+            f"WHERE m.Home_ID IN ({marks}) OR m.Away_ID IN ({marks}) ORDER BY m.Temporada, d.Division_Num",
+            ids + ids
+        )
+
+    def teams_in_season(self, season, division=None):
+        """Equipos de una temporada (opcionalmente de una sola división)"""
+        if division is None:
+            return self.query(
+                "SELECT * FROM team_seasons WHERE Temporada = ? ORDER BY Division_Num, Pos",
+                (season,)
+            )
+        return self.query(
+            "SELECT * FROM team_seasons WHERE Temporada = ? AND Division = ? ORDER BY Pos",
+            (season, division)
+        )
+
+    def champions(self, division=None):
+        """
+        Campeones (Pos = 1) por temporada
+
+        Args:
+            division (str): Solo esa división (None = todas)
+
+        Returns:
+            DataFrame: Temporada, Division, Equipo, Pts, ... en orden cronológico
+        """
+        if division is None:
+            return self.query(
+                "SELECT s.* FROM standings s JOIN divisions d USING (Division) "
+                "WHERE s.Pos = 1 ORDER BY d.Division_Num, s.Temporada"
+            )
+        return self.query(
+            "SELECT * FROM standings WHERE Pos = 1 AND Division = ? ORDER BY Temporada",
+            (division,)
+        )
+
+    def records(self, division=None, metric='Pts', n=1, lowest=False):
+        """
+        Mejores (o peores) temporadas según una métrica
+
+        Args:
+            division (str): Solo esa división (None = el récord de cada división)
+            metric (str): Columna de RECORD_METRICS (e.g., 'Pts', 'GF')
+            n (int): Número de filas por división
+            lowest (bool): True = valores más bajos (e.g., menos puntos)
+
+        Returns:
+            DataFrame: Filas de standings con el récord
+
+        Raises:
+            ValueError: Si la métrica no está en RECORD_METRICS
+        """
+        if metric not in RECORD_METRICS:
+            raise ValueError(f"Métrica no soportada: {metric} (usar una de {RECORD_METRICS})")
+
+        direction = 'ASC' if lowest else 'DESC'
+        sql = (f"SELECT * FROM standings WHERE Division = ? "
+               f"ORDER BY {metric} {direction}, Temporada, Pos LIMIT ?")
+
+        divisions = [division] if division is not None else self.divisions()
+        frames = [self.query(sql, (name, n)) for name in divisions]
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return self.query(sql, ('', 0))
+        return pd.concat(frames, ignore_index=True)
+
+    def matches(self, division, season):
+        """Partidos de una división en una temporada"""
+        return self.query(
+            "SELECT * FROM matches WHERE Division = ? AND Temporada = ?",
+            (division, season)
+        )
@@ -0,0 +1,74 @@
+"""
+Configuración del logging de los scripts (consola + fichero con timestamp)
+
+Importar los módulos del proyecto no toca el disco ni el logging global: cada
+módulo solo crea su logger con logging.getLogger(__name__). El directorio
+logs/, el fichero de log y los handlers se crean aquí, y solo lo llaman los
+puntos de entrada (main() de cada script). El informe JSON de cada ejecución
+(run_report) se guarda junto a su fichero de log.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+
+LOG_DIR = Path('logs')
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+def setup_logging(name, log_dir=LOG_DIR, level=logging.INFO):
+    """
+    Configura el logger raíz con consola y fichero logs/<name>_<timestamp>.log
+
+    Como logging.basicConfig, no hace nada si el logger raíz ya tiene handlers
+    (e.g., un notebook o un servicio con su propia configuración).
+
+    Args:
+        name (str): Prefijo del fichero de log (nombre del script)
+        log_dir (str or Path): Directorio de los logs (se crea si no existe)
+        level (int): Nivel del logger raíz
+
+    Returns:
+        Path: Fichero de log (None si el logging ya estaba configurado)
+    """
+    if logging.getLogger().handlers:
+        return None
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(exist_ok=True)
+    log_filename = log_dir / f'{name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(log_filename, encoding='utf-8'),
+            logging.StreamHandler()  # También mostrar en consola
+        ]
+    )
+    logging.getLogger(name).info(f"Logging iniciado - archivo: {log_filename}")
+    return log_filename
+
+
+def report_path(name, log_dir=LOG_DIR):
+    """
+    Fichero del informe JSON de la ejecución (ver run_report)
+
+    Junto al fichero de log actual, con el mismo nombre y extensión .json. Si el
+    logging no escribe a fichero (e.g., configurado por un notebook), en log_dir
+    con un timestamp nuevo.
+
+    Args:
+        name (str): Prefijo del fichero (nombre del script)
+        log_dir (str or Path): Directorio si no hay fichero de log
+
+    Returns:
+        Path
+    """
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler):
+            return Path(handler.baseFilename).with_suffix('.json')
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(exist_ok=True)
+    return log_dir / f'{name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
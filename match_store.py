@@ -0,0 +1,248 @@
+"""
+Almacén de partidos: los CSV de football-data.co.uk normalizados y tipados
+
+Antes los partidos se descartaban tras calcular la clasificación y cualquier
+métrica nueva exigía volver a descargar todo. Ahora cada temporada parseada se
+guarda una vez por scraping, particionada por división y temporada:
+
+    data/matches/<division>/<temporada>.parquet   (o .csv sin pyarrow)
+
+Columnas: Division, Temporada, Date, HomeTeam, AwayTeam, FTHG, FTAG, FTR y a
+continuación el resto de columnas del CSV original (descanso, tiros, tarjetas,
+cuotas...), que varían según la temporada.
+
+Junto a cada partición se guarda la huella (sha256) del CSV crudo del que salió
+(<temporada>.source): si el CSV en caché no cambió, la partición no se reescribe.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from dataset_io import parquet_available, to_columnar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path('data') / 'matches'
+CORE_COLUMNS = ['Division', 'Temporada', 'Date', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR']
+SOURCE_SUFFIX = '.source'
+
+
+def source_digest(raw):
+    """Huella del CSV crudo (bytes) con el que se genera una partición"""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def division_slug(division):
+    """Nombre de directorio de una división ('Premier League' → 'premier-league')"""
+    return division.lower().replace(' ', '-')
+
+
+def parse_dates(values):
+    """Fechas de football-data.co.uk: dd/mm/yy (temporadas antiguas) o dd/mm/yyyy"""
+    text = values.astype(str).str.strip()
+    dates = pd.to_datetime(text, format='%d/%m/%Y', errors='coerce')
+    short = pd.to_datetime(text, format='%d/%m/%y', errors='coerce')
+    return dates.fillna(short)
+
+
+def normalize_matches(matches, division, season):
+    """
+    Partidos limpios de una temporada con el esquema del almacén
+
+    Args:
+        matches (DataFrame): Salida de parse_matches (equipos limpios, goles enteros)
+        division (str): Nombre de la división
+        season (str): Temporada (e.g., "2024-25")
+
+    Returns:
+        DataFrame: CORE_COLUMNS + resto de columnas del CSV original
+    """
+    columns = {
+        'Division': division,
+        'Temporada': season,
+        'Date': parse_dates(matches['Date']) if 'Date' in matches.columns else pd.NaT,
+        'HomeTeam': matches['HomeTeam'].to_numpy(dtype=object),
+        'AwayTeam': matches['AwayTeam'].to_numpy(dtype=object),
+        'FTHG': matches['FTHG'].to_numpy(dtype='int64'),
+        'FTAG': matches['FTAG'].to_numpy(dtype='int64'),
+        'FTR': matches['FTR'].to_numpy(dtype=object),
+    }
+    for col in matches.columns:
+        # Div repite la división; las columnas "Unnamed" vienen de comas finales
+        if col in columns or col == 'Div' or str(col).startswith('Unnamed'):
+            continue
+        values = matches[col]
+        if values.isna().all():
+            continue
+        if not pd.api.types.is_numeric_dtype(values):
+            # Columnas numéricas con algún valor suelto como texto → número; el resto, texto
+            numeric = pd.to_numeric(values, errors='coerce')
+            if numeric.notna().sum() == values.notna().sum():
+                values = numeric
+            else:
+                values = values.astype(object).where(values.isna(), values.astype(str))
+        columns[col] = values.to_numpy()
+
+    normalized = pd.DataFrame(columns, index=range(len(matches)))
+    normalized['Date'] = pd.to_datetime(normalized['Date'])
+    return normalized
+
+
+class MatchStore:
+    """Partidos particionados por (división, temporada) en disco"""
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        """
+        Args:
+            root (str or Path): Directorio raíz del almacén (se crea al escribir)
+        """
+        self.root = Path(root)
+
+    def partition_path(self, division, season, suffix=None):
+        """Ruta de la partición (Parquet si pyarrow está disponible, si no CSV)"""
+        if suffix is None:
+            suffix = '.parquet' if parquet_available() else '.csv'
+        return self.root / division_slug(division) / f'{season}{suffix}'
+
+    def source_path(self, division, season):
+        """Ruta de la huella del CSV crudo de una partición"""
+        return self.root / division_slug(division) / f'{season}{SOURCE_SUFFIX}'
+
+    def is_current(self, division, season, digest):
+        """
+        La partición existe y se generó a partir del CSV crudo con esta huella
+
+        Args:
+            digest (str): source_digest del CSV crudo actual
+
+        Returns:
+            bool: True si no hace falta reescribirla
+        """
+        if not self.partition_path(division, season).exists():
+            return False
+        try:
+            return self.source_path(division, season).read_text(encoding='utf-8').strip() == digest
+        except OSError:
+            return False
+
+    def write_partition(self, division, season, matches, source=None):
+        """
+        Guarda (o reemplaza) los partidos de una temporada
+
+        Args:
+            matches (DataFrame): Salida de parse_matches
+            source (str): source_digest del CSV crudo (None = no registrar huella)
+
+        Returns:
+            Path: Archivo escrito
+        """
+        normalized = normalize_matches(matches, division, season)
+        path = self.partition_path(division, season)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # La huella anterior deja de valer; si la escritura falla, la partición se rehace
+        source_path = self.source_path(division, season)
+        if source_path.exists():
+            source_path.unlink()
+
+        # Escritura atómica: un lector nunca ve una partición a medias
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix=path.suffix)
+        os.close(fd)
+        try:
+            if path.suffix == '.parquet':
+                to_columnar(normalized).to_parquet(tmp, index=False)
+            else:
+                normalized.to_csv(tmp, index=False, encoding='utf-8')
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        # Una partición solo existe en un formato
+        for stale in (path.with_suffix('.csv'), path.with_suffix('.parquet')):
+            if stale != path and stale.exists():
+                stale.unlink()
+        if source is not None:
+            source_path.write_text(source, encoding='utf-8')
+        return path
+
+    def partitions(self):
+        """
+        Particiones guardadas
+
+        Returns:
+            list: Pares (slug de división, temporada), ordenados
+        """
+        if not self.root.exists():
+            return []
+        found = {
+            (path.parent.name, path.stem)
+            for path in self.root.glob('*/*')
+            if path.suffix in ('.parquet', '.csv') and not path.name.startswith('.')
+        }
+        return sorted(found)
+
+    def read_partition(self, division, season, columns=None):
+        """Partidos de una temporada (None si no está en el almacén)"""
+        return self._read_path(self.root / division_slug(division) / season, columns)
+
+    def load(self, divisions=None, seasons=None, columns=None):
+        """
+        Lee varias particiones en un único DataFrame (sin acceso a la red)
+
+        Args:
+            divisions (list): Nombres de división a incluir (None = todas), en este orden
+            seasons (list): Temporadas a incluir (None = todas)
+            columns (list): Columnas a leer (None = todas; las ausentes quedan como NaN)
+
+        Returns:
+            DataFrame: Partidos ordenados por división y temporada (None si no hay ninguno)
+        """
+        available = self.partitions()
+        if divisions is None:
+            slugs = sorted({slug for slug, _ in available})
+        else:
+            slugs = [division_slug(division) for division in divisions]
+
+        frames = []
+        for slug in slugs:
+            for partition_slug, season in available:
+                if partition_slug != slug or (seasons is not None and season not in seasons):
+                    continue
+                path = self.root / slug / season
+                frame = self._read_path(path, columns)
+                if frame is not None and len(frame):
+                    frames.append(frame)
+
+        if not frames:
+            return None
+        matches = pd.concat(frames, ignore_index=True)
+        for col in ('Division', 'Temporada', 'HomeTeam', 'AwayTeam', 'FTR'):
+            if col in matches.columns:
+                matches[col] = matches[col].astype(object)
+        return matches
+
+    def _read_path(self, path, columns):
+        """Lee una partición a partir de su ruta sin extensión"""
+        parquet = path.with_name(f'{path.name}.parquet')
+        if parquet.exists() and parquet_available():
+            if columns is None:
+                return pd.read_parquet(parquet)
+            import pyarrow.parquet as pq
+            present = [col for col in columns if col in pq.read_schema(parquet).names]
+            return pd.read_parquet(parquet, columns=present).reindex(columns=columns)
+
+        csv = path.with_name(f'{path.name}.csv')
+        if not csv.exists():
+            return None
+        usecols = (lambda col: col in columns) if columns is not None else None
+        matches = pd.read_csv(csv, usecols=usecols, encoding='utf-8')
+        if 'Date' in matches.columns:
+            matches['Date'] = pd.to_datetime(matches['Date'])
+        return matches if columns is None else matches.reindex(columns=columns)
@@ -0,0 +1,62 @@
+"""
+Informe de memoria por etapa del pipeline
+
+Cada etapa registra el DataFrame que produce (partidos, clasificaciones por
+división, dataset combinado, tracking...) con su memoria real, incluidas las
+cadenas de las columnas object (memory_usage(deep=True)). Sirve para ver el
+efecto de los tipos compactos antes de ampliar la pirámide a más ligas.
+"""
+
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def frame_memory(df):
+    """Memoria de un DataFrame en bytes (deep: incluye el texto de las columnas object)"""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+class MemoryReport:
+    """Memoria de la salida de cada etapa, en el orden en que se registran"""
+
+    def __init__(self):
+        self.stages = []
+
+    def record(self, stage, df):
+        """
+        Registra la salida de una etapa (se ignora si es None)
+
+        Args:
+            stage (str): Nombre de la etapa (e.g., 'Dataset combinado')
+            df (DataFrame): Tabla producida por la etapa
+        """
+        if df is None:
+            return
+        size = frame_memory(df)
+        megabytes = size / 1e6
+        self.stages.append({
+            'Etapa': stage,
+            'Filas': len(df),
+            'Columnas': len(df.columns),
+            'MB': round(megabytes, 3),
+            'Bytes_Fila': round(size / max(len(df), 1), 1),
+        })
+        logger.info(f"  [memoria] {stage}: {len(df):,} filas, {megabytes:.2f} MB")
+
+    def to_frame(self):
+        """Informe como DataFrame (una fila por etapa)"""
+        return pd.DataFrame(self.stages, columns=['Etapa', 'Filas', 'Columnas', 'MB', 'Bytes_Fila'])
+
+    def log(self):
+        """Escribe el informe completo en el log"""
+        if not self.stages:
+            return
+        logger.info("")
+        logger.info("="*70)
+        logger.info("MEMORIA POR ETAPA")
+        logger.info("="*70)
+        for line in self.to_frame().to_string(index=False).splitlines():
+            logger.info(line)
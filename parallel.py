@@ -0,0 +1,110 @@
+"""
+Pool de procesos para parsear temporadas y calcular clasificaciones en paralelo
+
+Con los CSV ya en caché, lo que queda de scrape_all_divisions es CPU (parseo +
+calculate_standings) y se hacía en un solo núcleo. Aquí se reparte cada
+(división, temporada) entre procesos sin serializar los datos grandes:
+
+- Los CSV crudos de una división se copian una sola vez a un bloque de memoria
+  compartida (SharedBlobs); cada trabajo recibe solo (nombre, offset, tamaño)
+- Los partidos parseados no vuelven al proceso principal: el trabajo los
+  escribe directamente en el almacén de partidos (MatchStore)
+- Solo vuelve la clasificación de la temporada (unas decenas de filas)
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+logger = logging.getLogger(__name__)
+
+
+def default_processes():
+    """Procesos por defecto: todos los núcleos disponibles"""
+    return os.cpu_count() or 1
+
+
+def process_pool(processes=None):
+    """
+    ProcessPoolExecutor con los procesos ya arrancados
+
+    Conviene crearlo antes de lanzar hilos (pipeline de descarga): con el método
+    'fork' los procesos se crean en el primer submit, y así se copian desde un
+    proceso sin otros hilos activos.
+
+    Args:
+        processes (int): Número de procesos (None = default_processes())
+    """
+    processes = processes or default_processes()
+    # Los procesos deben heredar el resource tracker del principal: si arrancan el
+    # suyo, al terminar "limpian" los bloques de SharedBlobs que han leído
+    resource_tracker.ensure_running()
+    executor = ProcessPoolExecutor(max_workers=processes)
+    # Arrancar todos los procesos ahora (un trabajo vacío por proceso)
+    list(executor.map(abs, range(processes)))
+    logger.info(f"Pool de procesos: {processes}")
+    return executor
+
+
+class BlobRef:
+    """Referencia a un tramo de un bloque de memoria compartida (se envía a los procesos)"""
+
+    __slots__ = ('name', 'offset', 'size')
+
+    def __init__(self, name, offset, size):
+        self.name = name
+        self.offset = offset
+        self.size = size
+
+    def __getstate__(self):
+        return (self.name, self.offset, self.size)
+
+    def __setstate__(self, state):
+        self.name, self.offset, self.size = state
+
+    def read(self):
+        """Copia del tramo como bytes (el bloque puede cerrarse después)"""
+        block = shared_memory.SharedMemory(name=self.name)
+        try:
+            return bytes(block.buf[self.offset:self.offset + self.size])
+        finally:
+            block.close()
+
+
+class SharedBlobs:
+    """
+    Varios bytes (o None) empaquetados en un único bloque de memoria compartida
+
+    Uso:
+        with SharedBlobs(raw_csvs) as blobs:
+            executor.map(job, blobs.refs)   # refs[i] es None si raw_csvs[i] lo era
+    """
+
+    def __init__(self, payloads):
+        payloads = list(payloads)
+        total = sum(len(p) for p in payloads if p is not None)
+        # SharedMemory no admite tamaño 0
+        self.block = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        self.refs = []
+        offset = 0
+        for payload in payloads:
+            if payload is None:
+                self.refs.append(None)
+                continue
+            self.block.buf[offset:offset + len(payload)] = payload
+            self.refs.append(BlobRef(self.block.name, offset, len(payload)))
+            offset += len(payload)
+
+    def close(self):
+        """Libera el bloque (después de que terminen los trabajos que lo leen)"""
+        if self.block is not None:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
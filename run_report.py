@@ -0,0 +1,206 @@
+"""
+Informe de ejecución del pipeline en JSON (tiempo por etapa y contadores)
+
+El log solo deja una línea por temporada (✓ Premier League 1993-94: 22 equipos).
+Este informe añade, en un formato legible por máquina:
+
+- Tiempo de pared de cada etapa global (descarga, parseo + clasificaciones,
+  validación, escritura del dataset, tracking, base de datos...)
+- Por (división, temporada): segundos de descarga, parseo, clasificación y
+  almacén, bytes, origen (caché o red), peticiones y reintentos, filas leídas
+  y filas descartadas por cada filtro (mal formadas, equipos nulos, FTR)
+
+Los contadores por temporada los acumula cada scraper en `season_stats`
+(viajan de vuelta desde el pool de procesos como skipped_rows); las peticiones
+y reintentos salen de las métricas del cliente HTTP compartido. El JSON se
+guarda junto al fichero de log (logs/<script>_<timestamp>.json) para comparar
+ejecuciones y localizar temporadas lentas.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import pandas as pd
+
+from http_client import RequestMetrics, current_client
+from log_setup import report_path
+
+logger = logging.getLogger(__name__)
+
+# Contadores por temporada que se suman en los totales del informe
+SEASON_COUNTERS = ['bytes', 'rows_read', 'rows_malformed', 'rows_dropped_teams', 'rows_dropped_ftr',
+                   'rows_coerced', 'matches', 'requests', 'retries']
+
+# Tiempos por temporada (segundos); su suma puede superar la etapa por el paralelismo
+SEASON_TIMINGS = ['fetch_s', 'parse_s', 'standings_s', 'store_s']
+
+
+class RunReport:
+    """Tiempos por etapa y contadores por temporada de una ejecución"""
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Script que se ejecuta (prefijo del fichero de log)
+        """
+        self.name = name
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+        self.stages = {}
+        self.seasons = []
+        self._lock = threading.Lock()
+        # Solo las peticiones de esta ejecución (el cliente HTTP es compartido). Se
+        # crea en la primera descarga: una ejecución sin red no lo llega a crear
+        client = current_client()
+        self._first_request = len(client.metrics) if client is not None else 0
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Mide el tiempo de pared de una etapa (se acumula si se repite)
+
+        Uso:
+            with report.stage('tracking'):
+                create_tracking(df)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stage = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0})
+                stage['seconds'] += elapsed
+                stage['calls'] += 1
+
+    def add_scrapers(self, scrapers):
+        """
+        Añade los contadores por temporada de los scrapers (season_stats)
+
+        Las peticiones, reintentos y la latencia de red se cruzan por URL con las
+        métricas del cliente HTTP registradas desde que empezó la ejecución.
+        """
+        requests = self.requests_frame()
+        by_url = requests.groupby('URL').agg(
+            requests=('Intentos', 'size'), attempts=('Intentos', 'sum'),
+            network_s=('Segundos', 'sum'), bytes_downloaded=('Bytes', 'sum'),
+        )
+        for scraper in scrapers:
+            # Orden cronológico (las descargas terminan en cualquier orden)
+            for season, stats in sorted(scraper.season_stats.items()):
+                url = scraper.get_url(season)
+                row = {'division': scraper.division_name, 'season': season, **stats}
+                if url in by_url.index:
+                    network = by_url.loc[url]
+                    row['requests'] = int(network['requests'])
+                    row['retries'] = int(network['attempts'] - network['requests'])
+                    row['network_s'] = float(network['network_s'])
+                    row['bytes_downloaded'] = int(network['bytes_downloaded'])
+                else:
+                    # Desde caché sin tocar la red (o sin descarga)
+                    row.update(requests=0, retries=0)
+                self.seasons.append(row)
+
+    def requests_frame(self):
+        """Peticiones HTTP de esta ejecución (ninguna si no se creó el cliente compartido)"""
+        client = current_client()
+        if client is None:
+            return pd.DataFrame(columns=RequestMetrics.COLUMNS)
+        return client.metrics.to_frame().iloc[self._first_request:]
+
+    def seasons_frame(self):
+        """Contadores por temporada como DataFrame (una fila por división y temporada)"""
+        return pd.DataFrame(self.seasons)
+
+    def totals(self):
+        """
+        Totales de la ejecución
+
+        Returns:
+            dict: Suma de contadores y tiempos por temporada, aciertos de caché y
+            resumen de las peticiones HTTP
+        """
+        seasons = self.seasons_frame()
+        totals = {'seasons': len(seasons)}
+        for column in SEASON_COUNTERS + SEASON_TIMINGS:
+            if column in seasons:
+                value = seasons[column].fillna(0).sum()
+                totals[column] = round(float(value), 4) if column.endswith('_s') else int(value)
+        if 'from_cache' in seasons:
+            totals['cache_hits'] = int(seasons['from_cache'].fillna(False).astype(bool).sum())
+        if 'ok' in seasons:
+            totals['failed_seasons'] = int((~seasons['ok'].fillna(False).astype(bool)).sum())
+
+        requests = self.requests_frame()
+        totals['http_requests'] = len(requests)
+        totals['http_retries'] = int((requests['Intentos'] - 1).sum())
+        totals['bytes_downloaded'] = int(requests['Bytes'].sum())
+        return totals
+
+    def to_dict(self):
+        """Informe completo (serializable en JSON)"""
+        return {
+            'script': self.name,
+            'started': self.started.isoformat(timespec='seconds'),
+            'wall_s': round(time.perf_counter() - self._start, 4),
+            'stages': [
+                {'stage': name, 'seconds': round(stage['seconds'], 4), 'calls': stage['calls']}
+                for name, stage in self.stages.items()
+            ],
+            'totals': self.totals(),
+            'seasons': [
+                {key: round(value, 4) if isinstance(value, float) else value for key, value in row.items()}
+                for row in self.seasons
+            ],
+        }
+
+    def log(self, slowest=5):
+        """Escribe en el log el tiempo por etapa, los totales y las temporadas más lentas"""
+        report = self.to_dict()
+        totals = report['totals']
+        logger.info("")
+        logger.info("="*70)
+        logger.info("TIEMPO POR ETAPA")
+        logger.info("="*70)
+        for stage in report['stages']:
+            logger.info(f"  {stage['stage']:<32} {stage['seconds']:>9.3f}s  ({stage['calls']}×)")
+        logger.info(f"  {'Total':<32} {report['wall_s']:>9.3f}s")
+        logger.info(f"Temporadas: {totals['seasons']} ({totals.get('cache_hits', 0)} desde caché, "
+                    f"{totals['http_requests']} peticiones, {totals['http_retries']} reintentos)")
+        if 'rows_read' in totals:
+            logger.info(f"Filas leídas: {totals['rows_read']:,} (descartadas: {totals.get('rows_malformed', 0)} "
+                        f"mal formadas, {totals.get('rows_dropped_teams', 0)} sin equipo, "
+                        f"{totals.get('rows_dropped_ftr', 0)} con FTR inválido)")
+
+        seasons = self.seasons_frame()
+        timings = [column for column in SEASON_TIMINGS if column in seasons]
+        if len(seasons) and timings:
+            seasons['total_s'] = seasons[timings].fillna(0).sum(axis=1)
+            logger.info("Temporadas más lentas (descarga + parseo + clasificación + almacén):")
+            for row in seasons.nlargest(slowest, 'total_s').itertuples():
+                logger.info(f"  {row.division} {row.season}: {row.total_s * 1000:.0f}ms")
+
+    def save(self, path=None):
+        """
+        Guarda el informe en JSON
+
+        Args:
+            path (str or Path): Destino (None = junto al fichero de log actual)
+
+        Returns:
+            Path: Fichero escrito
+        """
+        path = report_path(self.name) if path is None else path
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        logger.info(f"✓ Informe de ejecución: {path}")
+        return path
+
+
+def timed_stage(report, name):
+    """report.stage(name), o un contexto que no mide nada si no hay informe (report=None)"""
+    return report.stage(name) if report is not None else nullcontext()
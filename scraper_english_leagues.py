@@ -6,40 +6,114 @@ Mantiene compatibilidad total con el dataset Premier League v2.0
 Arquitectura modular con clase base y configuraciones específicas por división
 """
 
+import sys
+import asyncio
 import pandas as pd
-import requests
 import time
 import logging
-from io import StringIO
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
 from abc import ABC, abstractmethod
 import numpy as np
 from pathlib import Path
-from datetime import datetime
-
-# Configurar logging con archivo y consola
-log_dir = Path('logs')
-log_dir.mkdir(exist_ok=True)
-
-# Nombre de archivo con timestamp
-log_filename = log_dir / f'scraper_english_leagues_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename, encoding='utf-8'),
-        logging.StreamHandler()  # También mostrar en consola
-    ]
+
+from http_cache import HTTPCache, default_immutable_before, season_start_year
+from http_client import get_client
+from async_http import DEFAULT_CONCURRENCY, AsyncHTTPClient
+from standings import compact_standings, compute_all_standings, compute_standings, export_standings
+from csv_ingest import STANDINGS_INPUT_COLUMNS, coerce_goals, read_matches_csv, safe_int_conversion
+from dataset_io import load_table, write_columnar
+from league_db import DB_FILE, MATCH_COLUMNS, build_database, update_partitions
+from match_store import MatchStore, source_digest
+from memory_report import MemoryReport
+from run_report import RunReport, timed_stage
+from log_setup import setup_logging
+from team_registry import TeamRegistry, canonical_name, normalize_team_columns
+from tracking_store import (
+    SUMMARY_COLUMNS, TRACKING_LONG_FILE, TrackingStore, build_tracking_long, wide_view
 )
+
+# Sin handlers ni ficheros al importar: el log lo configura main() (log_setup)
 logger = logging.getLogger(__name__)
 
-logger.info(f"Logging iniciado - archivo: {log_filename}")
+# Límite de peticiones por host (reemplaza la pausa fija de 0.5s entre temporadas)
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_MAX_WORKERS = 4
+
+OUTPUT_FILE = 'english_leagues_completo.csv'
+TRACKING_FILE = 'english_leagues_tracking.csv'
+
+# Jerarquía de divisiones (1 = mejor)
+DIVISION_ORDER = ['Premier League', 'Championship', 'League One', 'League Two', 'National League']
+
+
+class TokenBucket:
+    """Token bucket thread-safe para limitar la tasa de peticiones a un host"""
+
+    def __init__(self, rate, capacity=1):
+        """
+        Args:
+            rate (float): Tokens repuestos por segundo (peticiones/segundo)
+            capacity (int): Ráfaga máxima permitida
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _take(self):
+        """Consume un token si hay; si no, devuelve los segundos hasta el siguiente"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Bloquea hasta que haya un token disponible"""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Como acquire, pero cede el bucle de eventos mientras espera"""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+_host_limiters = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(url, rate=DEFAULT_REQUESTS_PER_SECOND):
+    """Devuelve el TokenBucket compartido para el host de la URL"""
+    host = urlparse(url).netloc
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None or limiter.rate != rate:
+            limiter = TokenBucket(rate)
+            _host_limiters[host] = limiter
+        return limiter
 
 
 class EnglishLeagueScraper(ABC):
     """Clase base abstracta para scrapers de ligas inglesas"""
 
+    # Se puede sobrescribir para apuntar a un servidor local con CSVs de prueba
+    base_url = "https://www.football-data.co.uk/mmz4281"
+
     def __init__(self, division_name, division_code, expected_teams, start_year=1993, end_year=2025):
         """
         Args:
@@ -54,196 +128,302 @@ class EnglishLeagueScraper(ABC):
         self.expected_teams = expected_teams
         self.start_year = start_year
         self.end_year = end_year
+        self.requests_per_second = DEFAULT_REQUESTS_PER_SECOND
+        # Sesión HTTP (None = la compartida de get_client(), creada en la primera descarga)
+        self._http = None
+        # Caché en disco (None para desactivarla) y año de corte de temporadas cerradas
+        self.cache = HTTPCache()
+        self.immutable_before = default_immutable_before()
+        # Almacén de partidos (None = no se guardan los partidos)
+        self.match_store = None
+        # Filas mal formadas descartadas al parsear, por temporada
+        self.skipped_rows = {}
+        # Partidos con goles ilegibles corregidos al parsear, por temporada
+        self.coerced_rows = {}
+        # Tiempos y contadores por temporada para el informe de ejecución (run_report)
+        self.season_stats = {}
+
+    def get_seasons(self):
+        """Lista de temporadas de la división en orden cronológico"""
+        return [f"{year}-{str(year + 1)[-2:]}" for year in range(self.start_year, self.end_year)]
+
+    def is_season_closed(self, season):
+        """Temporada terminada: su CSV ya no cambia y se sirve desde caché"""
+        return season_start_year(season) < self.immutable_before
 
     def get_url(self, season):
         """Construye URL para football-data.co.uk"""
         year = int(season.split('-')[0])
         next_year_short = season.split('-')[1]
         code = f"{str(year)[-2:]}{next_year_short}"
-        url = f"https://www.football-data.co.uk/mmz4281/{code}/{self.division_code}.csv"
+        url = f"{self.base_url}/{code}/{self.division_code}.csv"
         return url
 
     def clean_team_name(self, name):
-        """Limpia nombres de equipos"""
-        if pd.isna(name):
-            return None
-        return str(name).strip()
+        """Limpia nombres de equipos (nombre canónico; ver normalize_team_columns)"""
+        return canonical_name(name)
+
+    @property
+    def http(self):
+        """HTTPClient de las descargas (pool keep-alive, reintentos con backoff, métricas)"""
+        if self._http is None:
+            self._http = get_client()
+        return self._http
+
+    @http.setter
+    def http(self, client):
+        self._http = client
+
+    def __getstate__(self):
+        """Estado que viaja a los procesos del pool: sin caché ni sesión HTTP (solo parsean)"""
+        state = self.__dict__.copy()
+        state['cache'] = None
+        state['_http'] = None
+        return state
 
     def safe_int_conversion(self, value):
-        """Convierte a entero de forma segura"""
-        try:
-            if pd.isna(value):
-                return 0
-            if isinstance(value, str):
-                cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
-                if cleaned:
-                    return int(float(cleaned))
-            return int(value)
-        except:
-            return 0
+        """Convierte a entero de forma segura (celda a celda; ver coerce_goals)"""
+        return safe_int_conversion(value)
+
+    def record_stats(self, season, **stats):
+        """Añade tiempos y contadores de una temporada a season_stats"""
+        self.season_stats.setdefault(season, {}).update(stats)
+
+    def record_fetch(self, season, start, response=None, error=None):
+        """Registra la descarga de una temporada (tiempo, bytes, caché) en season_stats"""
+        stats = {'fetch_s': time.perf_counter() - start}
+        if response is not None:
+            stats.update(status=response.status_code, bytes=len(response.content),
+                         from_cache=bool(getattr(response, 'from_cache', False)))
+        if error is not None:
+            stats['error'] = type(error).__name__
+        self.record_stats(season, **stats)
+
+    def coerce_goals(self, df):
+        """
+        Convierte FTHG y FTAG a enteros por columna completa
 
-    def download_season(self, season):
-        """Descarga y procesa una temporada con manejo robusto de errores"""
+        Misma conversión que safe_int_conversion, pero los partidos con goles que
+        hubo que limpiar o poner a 0 se registran en vez de corregirse en silencio.
+
+        Returns:
+            tuple: (DataFrame con goles enteros, máscara booleana de filas corregidas)
+        """
+        home_goals, home_coerced = coerce_goals(df['FTHG'])
+        away_goals, away_coerced = coerce_goals(df['FTAG'])
+        df = df.assign(FTHG=home_goals, FTAG=away_goals)
+        return df, home_coerced | away_coerced
+
+    def fetch_season_response(self, season, revalidate=False):
+        """
+        Descarga el CSV crudo de una temporada (None si falla)
+
+        Args:
+            season (str): Temporada (e.g., "2024-25")
+            revalidate (bool): Revalidar con el servidor aunque la temporada esté cerrada
+
+        Returns:
+            Respuesta con .content (bytes) y .changed (True si el contenido es nuevo o distinto)
+        """
         url = self.get_url(season)
+        start = time.perf_counter()
 
         try:
-            response = requests.get(url, timeout=10)
+            # El límite por host se aplica a cada intento, reintentos incluidos
+            throttle = get_host_limiter(url, self.requests_per_second).acquire
+            http_get = partial(self.http.get, throttle=throttle)
+            if self.cache is not None:
+                response = self.cache.get(
+                    url,
+                    immutable=self.is_season_closed(season) and not revalidate,
+                    http_get=http_get
+                )
+            else:
+                response = http_get(url, timeout=10)
+                response.changed = True
+            self.record_fetch(season, start, response)
 
             if response.status_code != 200:
                 logger.warning(f"  ✗ {self.division_name} {season}: HTTP {response.status_code}")
                 return None
 
-            # Intentar diferentes métodos de parsing
-            df = None
+            return response
 
-            # Método 1: Standard parsing
-            try:
-                df = pd.read_csv(StringIO(response.text), encoding='utf-8')
-            except:
-                pass
+        except Exception as e:
+            self.record_fetch(season, start, error=e)
+            logger.warning(f"  ✗ {self.division_name} {season}: Error inesperado: {str(e)}")
+            return None
 
-            # Método 2: Con error handling
-            if df is None:
-                try:
-                    df = pd.read_csv(StringIO(response.text), encoding='utf-8', on_bad_lines='skip')
-                except:
-                    try:
-                        df = pd.read_csv(StringIO(response.text), encoding='utf-8', error_bad_lines=False)
-                    except:
-                        pass
-
-            # Método 3: Con encoding diferente
-            if df is None:
-                try:
-                    df = pd.read_csv(StringIO(response.text), encoding='latin-1')
-                except:
-                    pass
+    def fetch_season(self, season):
+        """Descarga el CSV crudo de una temporada, en bytes sin decodificar (None si falla)"""
+        response = self.fetch_season_response(season)
+        return response.content if response is not None else None
 
-            if df is None:
-                logger.warning(f"  ✗ {self.division_name} {season}: No se pudo parsear el CSV")
-                return None
+    def parse_matches(self, raw, season, all_columns=None):
+        """
+        Parsea el CSV crudo de una temporada y devuelve los partidos válidos (o None)
 
-            # Limpiar el dataframe
-            df = df.dropna(subset=['HomeTeam', 'AwayTeam'], how='any')
+        Lectura en una sola pasada sobre los bytes. Solo se parsean todas las
+        columnas (tiros, tarjetas, cuotas...) si la temporada va al almacén de
+        partidos; si no, basta con las necesarias para la clasificación.
 
-            # Verificar columnas requeridas
-            required_cols = ['HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR']
-            missing_cols = [col for col in required_cols if col not in df.columns]
+        Args:
+            all_columns (bool): Parsear todas las columnas (None = si hay almacén)
+        """
+        if all_columns is None:
+            all_columns = self.match_store is not None
+        columns = None if all_columns else STANDINGS_INPUT_COLUMNS
+        start = time.perf_counter()
+        try:
+            df, skipped, _ = read_matches_csv(raw, columns)
+        except Exception:
+            self.record_stats(season, parse_s=time.perf_counter() - start)
+            logger.warning(f"  ✗ {self.division_name} {season}: No se pudo parsear el CSV")
+            return None
 
-            if missing_cols:
-                logger.warning(f"  ✗ {self.division_name} {season}: Columnas faltantes: {missing_cols}")
-                return None
+        self.skipped_rows[season] = skipped
+        if skipped:
+            logger.info(f"  ⚠ {self.division_name} {season}: {skipped} filas mal formadas descartadas")
+        rows_read = len(df)
 
-            # Limpiar nombres de equipos
-            df['HomeTeam'] = df['HomeTeam'].apply(self.clean_team_name)
-            df['AwayTeam'] = df['AwayTeam'].apply(self.clean_team_name)
+        # Limpiar el dataframe
+        df = df.dropna(subset=['HomeTeam', 'AwayTeam'], how='any')
 
-            # Eliminar filas con equipos nulos
-            df = df.dropna(subset=['HomeTeam', 'AwayTeam'])
+        # Verificar columnas requeridas
+        required_cols = ['HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR']
+        missing_cols = [col for col in required_cols if col not in df.columns]
 
-            # Convertir goles a números
-            df['FTHG'] = df['FTHG'].apply(self.safe_int_conversion)
-            df['FTAG'] = df['FTAG'].apply(self.safe_int_conversion)
+        if missing_cols:
+            self.record_stats(season, parse_s=time.perf_counter() - start, rows_read=rows_read,
+                              rows_malformed=skipped)
+            logger.warning(f"  ✗ {self.division_name} {season}: Columnas faltantes: {missing_cols}")
+            return None
 
-            # Filtrar solo partidos válidos
-            df = df[df['FTR'].isin(['H', 'D', 'A'])]
+        # Nombres canónicos de equipos (Categorical compartido por local y visitante)
+        df = normalize_team_columns(df)
 
-            if len(df) == 0:
-                logger.warning(f"  ✗ {self.division_name} {season}: Sin partidos válidos")
-                return None
+        # Eliminar filas con equipos nulos
+        df = df.dropna(subset=['HomeTeam', 'AwayTeam'])
+        rows_with_teams = len(df)
+
+        # Convertir goles a números
+        df, coerced = self.coerce_goals(df)
+
+        # Filtrar solo partidos válidos
+        valid = df['FTR'].isin(['H', 'D', 'A'])
+        df = df[valid]
+
+        coerced = coerced[valid]
+        self.coerced_rows[season] = int(coerced.sum())
+        self.record_stats(
+            season, parse_s=time.perf_counter() - start, rows_read=rows_read, rows_malformed=skipped,
+            rows_dropped_teams=rows_read - rows_with_teams, rows_dropped_ftr=rows_with_teams - len(df),
+            rows_coerced=int(coerced.sum()), matches=len(df)
+        )
+        if coerced.any():
+            examples = ', '.join(f"{row.HomeTeam}-{row.AwayTeam}" for row in df[coerced].head(3).itertuples())
+            logger.warning(f"  ⚠ {self.division_name} {season}: {int(coerced.sum())} partidos con goles corregidos ({examples})")
+
+        if len(df) == 0:
+            logger.warning(f"  ✗ {self.division_name} {season}: Sin partidos válidos")
+            return None
+
+        return df
+
+    def parse_season(self, raw, season):
+        """Parsea el CSV crudo (bytes) de una temporada y calcula su clasificación"""
+        return self.parse_season_matches(raw, season)[0]
+
+    def parse_season_matches(self, raw, season):
+        """
+        Parsea el CSV crudo (bytes) de una temporada y calcula su clasificación
+
+        Returns:
+            tuple: (clasificación o None, partidos parseados o None); los partidos
+            se devuelven también cuando la clasificación no pasa la validación
+        """
+        if raw is None:
+            return None, None
+
+        df = None
+        try:
+            source = self.partition_source(season, raw)
+            df = self.parse_matches(raw, season, all_columns=source is not None)
+            if df is None:
+                return None, None
+            if source is not None:
+                start = time.perf_counter()
+                self.store_matches(season, df, source)
+                self.record_stats(season, store_s=time.perf_counter() - start)
 
             # Calcular tabla de clasificación
+            start = time.perf_counter()
             standings_df = self.calculate_standings(df, season)
+            self.record_stats(season, standings_s=time.perf_counter() - start)
 
             if standings_df is None:
-                return None
+                return None, df
 
             # Validar número de equipos
+            self.record_stats(season, teams=len(standings_df))
             if not self.validate_team_count(len(standings_df)):
                 logger.warning(f"  ✗ {self.division_name} {season}: {len(standings_df)} equipos (esperado: {self.expected_teams})")
-                return None
+                return None, df
 
+            self.record_stats(season, ok=True)
             logger.info(f"  ✓ {self.division_name} {season}: {len(standings_df)} equipos")
-            return standings_df
+            return standings_df, df
 
         except Exception as e:
             logger.warning(f"  ✗ {self.division_name} {season}: Error inesperado: {str(e)}")
-            return None
+            return None, df
 
-    def calculate_standings(self, df, season):
-        """Calcula tabla de clasificación desde datos de partidos"""
-        teams = sorted(set(df['HomeTeam'].tolist() + df['AwayTeam'].tolist()))
+    def partition_source(self, season, raw):
+        """
+        Huella del CSV crudo si la partición de la temporada hay que (re)escribir
 
-        standings = []
-        for team in teams:
-            home = df[df['HomeTeam'] == team]
-            away = df[df['AwayTeam'] == team]
+        Returns:
+            str: source_digest de `raw`, o None si no hay almacén o la partición
+            guardada ya salió de estos mismos bytes (temporadas cerradas en caché)
+        """
+        if self.match_store is None:
+            return None
+        digest = source_digest(raw)
+        if self.match_store.is_current(self.division_name, season, digest):
+            return None
+        return digest
 
-            pj = len(home) + len(away)
+    def store_matches(self, season, matches, source=None):
+        """Guarda los partidos parseados en el almacén (si hay uno configurado)"""
+        if self.match_store is None:
+            return
+        try:
+            self.match_store.write_partition(self.division_name, season, matches, source)
+        except Exception as e:
+            logger.warning(f"  ✗ {self.division_name} {season}: No se pudieron guardar los partidos: {str(e)}")
 
-            if pj == 0:
-                continue
+    def download_season(self, season):
+        """Descarga y procesa una temporada con manejo robusto de errores"""
+        return self.parse_season(self.fetch_season(season), season)
 
-            # Victorias
-            w_home = len(home[home['FTR'] == 'H'])
-            w_away = len(away[away['FTR'] == 'A'])
-            w = w_home + w_away
-
-            # Empates
-            d_home = len(home[home['FTR'] == 'D'])
-            d_away = len(away[away['FTR'] == 'D'])
-            d = d_home + d_away
-
-            # Derrotas
-            l = pj - w - d
-
-            # Goles
-            gf = int(home['FTHG'].sum() + away['FTAG'].sum())
-            gc = int(home['FTAG'].sum() + away['FTHG'].sum())
-            gd = gf - gc
-
-            # Puntos
-            pts = 3 * w + d
-
-            standings.append({
-                'Equipo': team,
-                'PJ': pj,
-                'G': w,
-                'E': d,
-                'P': l,
-                'GF': gf,
-                'GC': gc,
-                'Dif': gd,
-                'Pts': pts
-            })
+    def calculate_standings(self, df, season):
+        """Calcula tabla de clasificación desde datos de partidos (vectorizado)"""
+        standings_df = compute_standings(df)
 
-        if not standings:
+        if len(standings_df) == 0:
             logger.warning(f"  ✗ {self.division_name} {season}: Sin datos de equipos")
             return None
 
-        # Crear DataFrame y ordenar
-        standings_df = pd.DataFrame(standings)
-        standings_df = standings_df.sort_values(
-            ['Pts', 'Dif', 'GF'],
-            ascending=[False, False, False]
-        ).reset_index(drop=True)
-
-        standings_df['Pos'] = range(1, len(standings_df) + 1)
         standings_df['Temporada'] = season
         standings_df['Division'] = self.division_name
 
-        # Formatear Dif como string con signo
-        standings_df['Dif'] = standings_df['Dif'].apply(
-            lambda x: f"+{x}" if x > 0 else str(x)
-        )
-
-        # Reordenar columnas
+        # Reordenar columnas (tipos compactos; Dif numérico hasta exportar)
         standings_df = standings_df[[
             'Temporada', 'Division', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P',
             'Pts', 'GF', 'GC', 'Dif'
         ]]
 
-        return standings_df
+        return compact_standings(standings_df)
 
     def validate_team_count(self, count):
         """Valida que el número de equipos sea el esperado"""
@@ -251,31 +431,210 @@ class EnglishLeagueScraper(ABC):
             return self.expected_teams[0] <= count <= self.expected_teams[1]
         return count == self.expected_teams
 
-    def scrape_all_seasons(self):
-        """Descarga todas las temporadas de esta división"""
-        all_data = []
-        failed = []
+    def fetch_all_seasons(self, max_workers=DEFAULT_MAX_WORKERS, backend='threads'):
+        """Descarga en paralelo los CSVs crudos de todas las temporadas
 
-        for year in range(self.start_year, self.end_year):
-            next_year = year + 1
-            season = f"{year}-{str(next_year)[-2:]}"
+        Args:
+            max_workers (int): Descargas simultáneas (hilos o peticiones asíncronas)
+            backend (str): 'threads' (ThreadPoolExecutor) o 'asyncio' (fetch_all_seasons_async)
 
-            df = self.download_season(season)
+        Returns:
+            list: Pares (temporada, bytes del CSV o None) en orden cronológico
+        """
+        if backend == 'asyncio':
+            return asyncio.run(self.fetch_all_seasons_async(concurrency=max_workers))
+        seasons = self.get_seasons()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            texts = list(executor.map(self.fetch_season, seasons))
+        return list(zip(seasons, texts))
+
+    def combine_seasons(self, seasons, results):
+        """Combina las clasificaciones por temporada y lista las fallidas"""
+        all_data = []
+        failed = []
 
+        for season, df in zip(seasons, results):
             if df is not None:
                 all_data.append(df)
             else:
                 failed.append(season)
 
-            # Pausa para no sobrecargar el servidor
-            time.sleep(0.5)
-
         if all_data:
-            combined = pd.concat(all_data, ignore_index=True)
+            # concat de categorías distintas devuelve texto: se vuelve a compactar
+            combined = compact_standings(pd.concat(all_data, ignore_index=True))
             return combined, failed
 
         return None, failed
 
+    def process_seasons(self, raw_seasons, executor=None):
+        """
+        Parsea temporadas ya descargadas (salida de fetch_all_seasons)
+
+        Args:
+            raw_seasons (list): Pares (temporada, bytes del CSV o None)
+            executor (ProcessPoolExecutor): Pool de procesos (None = en este proceso)
+        """
+        seasons = [season for season, _ in raw_seasons]
+        if executor is None:
+            results = [self.parse_season(raw, season) for season, raw in raw_seasons]
+        else:
+            results = self.parse_seasons_parallel(raw_seasons, executor)
+        return self.combine_seasons(seasons, results)
+
+    def parse_seasons_parallel(self, raw_seasons, executor):
+        """
+        parse_season de cada temporada en un pool de procesos
+
+        Los CSV crudos viajan en un bloque de memoria compartida y los partidos
+        se guardan en el almacén desde cada proceso; solo vuelve la clasificación.
+
+        Returns:
+            list: Clasificación (o None) por temporada, en el orden de raw_seasons
+        """
+        # multiprocessing se importa solo si se usa un pool de procesos
+        from parallel import SharedBlobs
+
+        with SharedBlobs(raw for _, raw in raw_seasons) as blobs:
+            futures = [
+                executor.submit(_parse_season_job, self, season, ref)
+                for (season, _), ref in zip(raw_seasons, blobs.refs)
+            ]
+            outputs = [future.result() for future in futures]
+
+        results = []
+        for (season, _), (standings_df, skipped, coerced, stats) in zip(raw_seasons, outputs):
+            if skipped is not None:
+                self.skipped_rows[season] = skipped
+            if coerced is not None:
+                self.coerced_rows[season] = coerced
+            if stats is not None:
+                self.record_stats(season, **stats)
+            results.append(standings_df)
+        return results
+
+    def scrape_all_seasons(self, max_workers=DEFAULT_MAX_WORKERS, requests_per_second=None, backend='threads'):
+        """
+        Descarga todas las temporadas de esta división en paralelo
+
+        Args:
+            max_workers (int): Número máximo de descargas simultáneas
+            requests_per_second (float): Límite de peticiones por host (None = valor actual)
+            backend (str): 'threads' o 'asyncio' (envoltorio de scrape_all_seasons_async)
+
+        Returns:
+            tuple: (DataFrame combinado o None, lista de temporadas fallidas),
+            siempre en orden cronológico de temporadas
+        """
+        if backend == 'asyncio':
+            return asyncio.run(self.scrape_all_seasons_async(
+                concurrency=max_workers, requests_per_second=requests_per_second
+            ))
+
+        if requests_per_second is not None:
+            self.requests_per_second = requests_per_second
+
+        seasons = self.get_seasons()
+
+        # map() conserva el orden de entrada: el resultado es determinista
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(self.download_season, seasons))
+
+        return self.combine_seasons(seasons, results)
+
+    # --- Backend asíncrono -------------------------------------------------
+    # Mismas descargas que los métodos síncronos, desde un bucle de eventos.
+    # `http` es un AsyncHTTPClient abierto; si se comparte entre divisiones, su
+    # semáforo limita las peticiones simultáneas de toda la pirámide.
+
+    async def fetch_season_response_async(self, http, season, revalidate=False):
+        """Versión asíncrona de fetch_season_response"""
+        url = self.get_url(season)
+        start = time.perf_counter()
+
+        try:
+            limiter = get_host_limiter(url, self.requests_per_second)
+            http_get = partial(http.get, limiter=limiter)
+            if self.cache is not None:
+                response = await self.cache.get_async(
+                    url,
+                    http_get,
+                    immutable=self.is_season_closed(season) and not revalidate
+                )
+            else:
+                response = await http_get(url, timeout=10)
+                response.changed = True
+            self.record_fetch(season, start, response)
+
+            if response.status_code != 200:
+                logger.warning(f"  ✗ {self.division_name} {season}: HTTP {response.status_code}")
+                return None
+
+            return response
+
+        except Exception as e:
+            self.record_fetch(season, start, error=e)
+            logger.warning(f"  ✗ {self.division_name} {season}: Error inesperado: {str(e)}")
+            return None
+
+    async def fetch_season_async(self, http, season):
+        """Versión asíncrona de fetch_season (bytes del CSV o None)"""
+        response = await self.fetch_season_response_async(http, season)
+        return response.content if response is not None else None
+
+    async def fetch_all_seasons_async(self, http=None, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Descarga todas las temporadas a la vez (limitadas por el semáforo de `http`)
+
+        Args:
+            http (AsyncHTTPClient): Cliente abierto (None = uno propio con `concurrency`)
+            concurrency (int): Peticiones simultáneas si se crea el cliente
+
+        Returns:
+            list: Pares (temporada, bytes del CSV o None) en orden cronológico
+        """
+        if http is None:
+            async with AsyncHTTPClient(concurrency) as http:
+                return await self.fetch_all_seasons_async(http)
+        seasons = self.get_seasons()
+        # gather conserva el orden de entrada
+        texts = await asyncio.gather(*(self.fetch_season_async(http, season) for season in seasons))
+        return list(zip(seasons, texts))
+
+    async def download_season_async(self, season, http=None):
+        """Versión asíncrona de download_season"""
+        if http is None:
+            async with AsyncHTTPClient(1) as http:
+                return await self.download_season_async(season, http)
+        return self.parse_season(await self.fetch_season_async(http, season), season)
+
+    async def scrape_all_seasons_async(self, http=None, concurrency=DEFAULT_CONCURRENCY, requests_per_second=None):
+        """
+        Versión asíncrona de scrape_all_seasons
+
+        Descarga todas las temporadas en paralelo y después las parsea (el parseo
+        es CPU y bloquearía el bucle de eventos si se intercalara con la red).
+
+        Returns:
+            tuple: (DataFrame combinado o None, lista de temporadas fallidas)
+        """
+        if requests_per_second is not None:
+            self.requests_per_second = requests_per_second
+        raw_seasons = await self.fetch_all_seasons_async(http, concurrency)
+        return self.process_seasons(raw_seasons)
+
+
+def _parse_season_job(scraper, season, ref):
+    """
+    Trabajo de un proceso del pool: parse_season sobre el CSV en memoria compartida
+
+    Returns:
+        tuple: (clasificación o None, filas mal formadas, partidos con goles corregidos,
+        tiempos y contadores del parseo)
+    """
+    standings_df = scraper.parse_season(ref.read() if ref is not None else None, season)
+    return (standings_df, scraper.skipped_rows.get(season), scraper.coerced_rows.get(season),
+            scraper.season_stats.get(season))
+
 
 class PremierLeagueScraper(EnglishLeagueScraper):
     """Scraper para Premier League (Nivel 1)"""
@@ -358,8 +717,240 @@ class NationalLeagueScraper(EnglishLeagueScraper):
         )
 
 
-def scrape_all_divisions():
-    """Ejecuta el scraping de todas las divisiones con datos históricos completos (1993-2025)"""
+def _division_key(name):
+    """Clave para comparar nombres de división: 'League Two', 'league-two', 'LeagueTwoScraper'"""
+    key = ''.join(ch for ch in str(name).lower() if ch.isalnum())
+    return key[:-len('scraper')] if key.endswith('scraper') else key
+
+
+def select_divisions(scrapers, divisions):
+    """
+    Filtra los scrapers por nombre de división, código o clase (mantiene el orden)
+
+    Args:
+        scrapers (list): Scrapers disponibles
+        divisions (list): e.g., ['League Two'], ['E3'] o ['LeagueTwoScraper']
+
+    Raises:
+        ValueError: Si alguna división no corresponde a ningún scraper
+    """
+    aliases = {}
+    for scraper in scrapers:
+        for name in (scraper.division_name, scraper.division_code, type(scraper).__name__):
+            aliases[_division_key(name)] = scraper
+
+    selected = set()
+    for name in divisions:
+        scraper = aliases.get(_division_key(name))
+        if scraper is None:
+            available = ', '.join(f"{s.division_name} ({s.division_code})" for s in scrapers)
+            raise ValueError(f"División desconocida: {name!r}. Disponibles: {available}")
+        selected.add(id(scraper))
+    return [scraper for scraper in scrapers if id(scraper) in selected]
+
+
+def build_scrapers(match_store=None, divisions=None, start_year=None, end_year=None):
+    """
+    Scrapers de las cinco divisiones, en orden de la pirámide
+
+    Args:
+        match_store (MatchStore): Almacén donde guardar los partidos parseados (None = no guardar)
+        divisions (list): Solo estas divisiones, por nombre, código o clase (None = todas)
+        start_year (int): Primer año a descargar (se recorta al rango de cada división)
+        end_year (int): Año final, exclusivo como en EnglishLeagueScraper (None = 2025)
+
+    Returns:
+        list: Scrapers con al menos una temporada en el rango pedido
+    """
+    # Definir scrapers para cada división - AHORA CON 32 TEMPORADAS COMPLETAS
+    scrapers = [
+        PremierLeagueScraper(1993, 2025),      # 32 temporadas
+        ChampionshipScraper(1993, 2025),       # 32 temporadas (antes First Division)
+        LeagueOneScraper(1993, 2025),          # 32 temporadas (antes Second Division)
+        LeagueTwoScraper(1993, 2025),          # 32 temporadas (antes Third Division)
+        NationalLeagueScraper(2005, 2025)      # 20 temporadas (datos desde 2005)
+    ]
+    if divisions is not None:
+        scrapers = select_divisions(scrapers, divisions)
+    for scraper in scrapers:
+        if start_year is not None:
+            scraper.start_year = max(scraper.start_year, start_year)
+        if end_year is not None:
+            scraper.end_year = min(scraper.end_year, end_year)
+        scraper.match_store = match_store
+    return [scraper for scraper in scrapers if scraper.start_year < scraper.end_year]
+
+
+async def fetch_pyramid_async(scrapers, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Descarga todas las temporadas de todas las divisiones desde un único bucle de eventos
+
+    Un solo AsyncHTTPClient: su semáforo limita las peticiones simultáneas de
+    toda la pirámide y cada host conserva su TokenBucket.
+
+    Returns:
+        list: Salida de fetch_all_seasons por cada scraper, en el orden de `scrapers`
+    """
+    async with AsyncHTTPClient(concurrency) as http:
+        return await asyncio.gather(*(scraper.fetch_all_seasons_async(http) for scraper in scrapers))
+
+
+_PIPELINE_DONE = object()
+# Cada cuánto revisa una etapa bloqueada en una cola si el consumidor se detuvo (s)
+_PIPELINE_POLL = 0.1
+
+
+def _pipeline_put(q, item, stop):
+    """q.put que se rinde si el consumidor del pipeline se detuvo (True si se encoló)"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_PIPELINE_POLL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _pipeline_get(q, stop):
+    """q.get que devuelve _PIPELINE_DONE si el consumidor del pipeline se detuvo"""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=_PIPELINE_POLL)
+        except queue.Empty:
+            continue
+    return _PIPELINE_DONE
+
+
+def run_division_pipeline(scrapers, max_workers=DEFAULT_MAX_WORKERS, queue_size=2, backend='threads',
+                          concurrency=DEFAULT_CONCURRENCY, processes=None, report=None):
+    """
+    Pipeline de tres etapas solapadas entre divisiones
+
+    1. Descarga (hilo propio): fetch_all_seasons de cada división
+    2. Parseo + calculate_standings (hilo propio): process_seasons
+    3. Validación + resumen: la hace quien consume este generador
+
+    Las etapas se comunican con colas acotadas, de modo que el cálculo de
+    clasificaciones de una división se solapa con la descarga de la siguiente.
+    Con backend='asyncio' la etapa de descarga pide la pirámide completa a la
+    vez (fetch_pyramid_async, `concurrency` peticiones simultáneas). Con
+    `processes` (0 = todos los núcleos) la etapa de parseo reparte las
+    temporadas de cada división entre un pool de procesos. Con `report`
+    (RunReport) se mide el tiempo de pared de las etapas 1 y 2.
+
+    Si el consumidor se detiene antes de tiempo (break, excepción o close()),
+    las etapas terminan la división en curso y salen sin bloquearse en las colas.
+
+    Yields:
+        tuple: (scraper, DataFrame o None, temporadas fallidas) en el orden de `scrapers`
+    """
+    raw_queue = queue.Queue(maxsize=queue_size)
+    parsed_queue = queue.Queue(maxsize=queue_size)
+    errors = []
+    # Lo activa el consumidor al terminar: las etapas dejan de producir
+    stop = threading.Event()
+    # El pool se crea antes que los hilos del pipeline (ver parallel.process_pool)
+    executor = None
+    if processes not in (None, 1):
+        from parallel import process_pool
+        executor = process_pool(processes or None)
+
+    def download_stage():
+        try:
+            if backend == 'asyncio':
+                logger.info(f"Descargando: {len(scrapers)} divisiones (asyncio, {concurrency} simultáneas)")
+                with timed_stage(report, 'descarga'):
+                    pyramid = asyncio.run(fetch_pyramid_async(scrapers, concurrency))
+                for scraper, raw_seasons in zip(scrapers, pyramid):
+                    if not _pipeline_put(raw_queue, (scraper, raw_seasons), stop):
+                        return
+                return
+            for scraper in scrapers:
+                if stop.is_set():
+                    return
+                logger.info(f"Descargando: {scraper.division_name}")
+                with timed_stage(report, 'descarga'):
+                    raw_seasons = scraper.fetch_all_seasons(max_workers)
+                if not _pipeline_put(raw_queue, (scraper, raw_seasons), stop):
+                    return
+        except Exception as e:
+            errors.append(e)
+        finally:
+            _pipeline_put(raw_queue, _PIPELINE_DONE, stop)
+
+    def parse_stage():
+        try:
+            while True:
+                item = _pipeline_get(raw_queue, stop)
+                if item is _PIPELINE_DONE:
+                    break
+                scraper, raw_seasons = item
+                with timed_stage(report, 'parseo + clasificaciones'):
+                    data, failed = scraper.process_seasons(raw_seasons, executor)
+                if not _pipeline_put(parsed_queue, (scraper, data, failed), stop):
+                    break
+        except Exception as e:
+            errors.append(e)
+            # Vaciar la cola para no bloquear la etapa de descarga
+            while _pipeline_get(raw_queue, stop) is not _PIPELINE_DONE:
+                pass
+        finally:
+            _pipeline_put(parsed_queue, _PIPELINE_DONE, stop)
+
+    threads = [
+        threading.Thread(target=download_stage, name='pipeline-download', daemon=True),
+        threading.Thread(target=parse_stage, name='pipeline-parse', daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = parsed_queue.get()
+            if item is _PIPELINE_DONE:
+                break
+            yield item
+    finally:
+        # También si el consumidor se detuvo antes de tiempo: ninguna etapa queda
+        # bloqueada en una cola llena ni esperando una división que no llegará
+        stop.set()
+        for thread in threads:
+            thread.join()
+        for q in (raw_queue, parsed_queue):
+            while not q.empty():
+                q.get_nowait()
+        if executor is not None:
+            executor.shutdown()
+
+    if errors:
+        raise errors[0]
+
+
+def scrape_all_divisions(max_workers=DEFAULT_MAX_WORKERS, queue_size=2, wide_tracking=True, backend='threads',
+                         concurrency=DEFAULT_CONCURRENCY, processes=None, scrapers=None, database=True,
+                         premier=False, partial=None):
+    """
+    Ejecuta el scraping de todas las divisiones con datos históricos completos (1993-2025)
+
+    Con `scrapers` (e.g., build_scrapers(divisions=['League Two'], start_year=2020))
+    solo se descargan esas (división, temporada) y sus filas sustituyen a las del
+    dataset existente; el resto de particiones se conserva sin volver a pedirlas.
+
+    Args:
+        max_workers (int): Descargas simultáneas por división (backend='threads')
+        queue_size (int): Capacidad de las colas entre etapas del pipeline
+        wide_tracking (bool): Generar también el tracking ancho legacy (english_leagues_tracking.csv)
+        backend (str): 'threads' (una división tras otra) o 'asyncio' (toda la pirámide a la vez)
+        concurrency (int): Peticiones simultáneas en toda la pirámide (backend='asyncio')
+        processes (int): Procesos para parsear y calcular clasificaciones (None o 1 = en
+            este proceso; 0 = todos los núcleos)
+        scrapers (list): Divisiones y temporadas a descargar (None = la pirámide completa)
+        database (bool): Generar también la base de datos SQLite
+        premier (bool): Derivar también los archivos de scraper_premier_league del
+            dataset combinado (sin descargar E0 otra vez)
+        partial (bool): Fusionar lo descargado con el dataset existente (None = solo si
+            se pasan `scrapers`; False para la pirámide completa con scrapers configurados)
+    """
 
     logger.info("="*70)
     logger.info("ENGLISH FOOTBALL PYRAMID - FULL HISTORICAL DATA (1993-2025)")
@@ -372,34 +963,41 @@ def scrape_all_divisions():
     logger.info("  - E3: Third Division (1993-2004) → League Two (2004-presente)")
     logger.info("")
 
-    # Definir scrapers para cada división - AHORA CON 32 TEMPORADAS COMPLETAS
-    scrapers = [
-        PremierLeagueScraper(1993, 2025),      # 32 temporadas
-        ChampionshipScraper(1993, 2025),       # 32 temporadas (antes First Division)
-        LeagueOneScraper(1993, 2025),          # 32 temporadas (antes Second Division)
-        LeagueTwoScraper(1993, 2025),          # 32 temporadas (antes Third Division)
-        NationalLeagueScraper(2005, 2025)      # 20 temporadas (datos desde 2005)
-    ]
+    match_store = MatchStore()
+    if partial is None:
+        partial = scrapers is not None
+    if scrapers is None:
+        scrapers = build_scrapers(match_store)
+    for scraper in scrapers:
+        scraper.match_store = match_store
+    if partial:
+        for scraper in scrapers:
+            logger.info(f"Selección: {scraper.division_name} {scraper.get_seasons()[0]} → "
+                        f"{scraper.get_seasons()[-1]}")
+        logger.info("")
 
     all_results = []
     summary = []
+    memory = MemoryReport()
+    report = RunReport('scraper_english_leagues')
 
-    for scraper in scrapers:
+    for scraper, data, failed in run_division_pipeline(scrapers, max_workers, queue_size, backend, concurrency,
+                                                       processes, report):
         logger.info(f"\n{'='*70}")
         logger.info(f"PROCESANDO: {scraper.division_name.upper()}")
         logger.info(f"{'='*70}")
 
-        data, failed = scraper.scrape_all_seasons()
-
         if data is not None:
             all_results.append(data)
+            memory.record(f"Clasificaciones {scraper.division_name}", data)
 
             # Validar datos
-            data['Suma'] = data['G'] + data['E'] + data['P']
-            data['Pts_Calc'] = 3 * data['G'] + data['E']
+            with report.stage('validación'):
+                data['Suma'] = data['G'] + data['E'] + data['P']
+                data['Pts_Calc'] = 3 * data['G'] + data['E']
 
-            problemas_pj = (data['Suma'] != data['PJ']).sum()
-            problemas_pts = (data['Pts_Calc'] != data['Pts']).sum()
+                problemas_pj = (data['Suma'] != data['PJ']).sum()
+                problemas_pts = (data['Pts_Calc'] != data['Pts']).sum()
 
             summary.append({
                 'Division': scraper.division_name,
@@ -408,7 +1006,9 @@ def scrape_all_divisions():
                 'Registros': len(data),
                 'Errores_PJ': problemas_pj,
                 'Errores_Pts': problemas_pts,
-                'Temporadas_Fallidas': len(failed)
+                'Temporadas_Fallidas': len(failed),
+                'Filas_Descartadas': sum(scraper.skipped_rows.values()),
+                'Goles_Corregidos': sum(scraper.coerced_rows.values())
             })
 
             logger.info(f"\n✓ {scraper.division_name} completado:")
@@ -418,6 +1018,8 @@ def scrape_all_divisions():
             logger.info(f"  Equipos únicos: {data['Equipo'].nunique()}")
             logger.info(f"  Errores G+E+P != PJ: {problemas_pj}")
             logger.info(f"  Errores Pts != 3*G+E: {problemas_pts}")
+            logger.info(f"  Filas mal formadas descartadas: {sum(scraper.skipped_rows.values())}")
+            logger.info(f"  Partidos con goles corregidos: {sum(scraper.coerced_rows.values())}")
 
             if failed:
                 logger.info(f"  Temporadas fallidas: {', '.join(failed[:5])}")
@@ -429,20 +1031,28 @@ def scrape_all_divisions():
                 'Registros': 0,
                 'Errores_PJ': 0,
                 'Errores_Pts': 0,
-                'Temporadas_Fallidas': scraper.end_year - scraper.start_year
+                'Temporadas_Fallidas': scraper.end_year - scraper.start_year,
+                'Filas_Descartadas': sum(scraper.skipped_rows.values()),
+                'Goles_Corregidos': sum(scraper.coerced_rows.values())
             })
 
     # Combinar todos los datos
     if all_results:
         combined = pd.concat(all_results, ignore_index=True)
 
-        # Guardar CSV unificado
-        output_file = 'english_leagues_completo.csv'
-        combined_clean = combined[[
-            'Temporada', 'Division', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P',
-            'Pts', 'GF', 'GC', 'Dif'
-        ]]
-        combined_clean.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # Guardar CSV unificado (Dif se formatea solo al exportar)
+        output_file = OUTPUT_FILE
+        with report.stage('escritura del dataset'):
+            combined_clean = compact_standings(combined[[
+                'Temporada', 'Division', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P',
+                'Pts', 'GF', 'GC', 'Dif'
+            ]])
+            if partial and Path(output_file).exists():
+                combined_clean = merge_partitions(load_table(output_file), combined_clean)
+                logger.info(f"✓ Particiones descargadas fusionadas con {output_file}")
+            export_standings(combined_clean).to_csv(output_file, index=False, encoding='utf-8-sig')
+            write_columnar(combined_clean, output_file)
+        memory.record("Dataset combinado", combined_clean)
 
         # Resumen general
         logger.info("\n" + "="*70)
@@ -459,97 +1069,512 @@ def scrape_all_divisions():
         logger.info(f"Equipos únicos: {combined_clean['Equipo'].nunique()}")
 
         # Crear tracking
-        create_tracking(combined_clean)
+        with report.stage('tracking'):
+            store = create_tracking(combined_clean, wide=wide_tracking)
+        memory.record("Tracking largo", store.data)
+
+        # Base de datos local para consultas indexadas (partidos desde el almacén)
+        if database:
+            with report.stage('base de datos'):
+                matches = match_store.load(divisions=DIVISION_ORDER, columns=MATCH_COLUMNS)
+                build_database(combined_clean, store.data, matches, division_order=DIVISION_ORDER, path=DB_FILE)
+            memory.record("Partidos (almacén)", matches)
+        logger.info(f"✓ Partidos guardados: {match_store.root} ({len(match_store.partitions())} particiones)")
+        if premier:
+            with report.stage('premier derivada'):
+                derive_premier(combined_clean)
+        get_client().metrics.log()
+        memory.log()
+        report.add_scrapers(scrapers)
+        report.log()
+        report.save()
 
         return combined_clean
 
+    report.add_scrapers(scrapers)
+    report.save()
     return None
 
 
-def create_tracking(df):
-    """Crea base de datos de tracking longitudinal por división (con codificación numérica)"""
+def derive_premier(combined):
+    """
+    Archivos de scraper_premier_league como proyección del dataset de la pirámide
+
+    Args:
+        combined (DataFrame): Dataset completo recién generado
+    """
+    # Importación diferida: scraper_premier_league importa este módulo
+    import scraper_premier_league
+
+    scraper_premier_league.derive_from_pyramid(combined)
+
+
+def build_tracking(df, division_order=DIVISION_ORDER):
+    """
+    Construye la tabla ancha de tracking (legacy) a partir del dataset completo
+
+    Pasa por el formato largo del TrackingStore y materializa la vista ancha.
+
+    Args:
+        df (DataFrame): Dataset completo (Temporada, Division, Pos, Equipo, Pts, ...)
+        division_order (list): Jerarquía de divisiones (la primera = 1, la mejor)
+
+    Returns:
+        DataFrame: Tracking ordenado por Total_Temporadas (descendente) y Equipo
+    """
+    return wide_view(build_tracking_long(df, division_order))
+
+
+def create_tracking(df, wide=False):
+    """
+    Crea el tracking longitudinal por división (con codificación numérica)
+
+    Guarda el formato largo (una fila por equipo y temporada). La tabla ancha
+    english_leagues_tracking.csv solo se genera si se pide con wide=True (los
+    scrapers lo piden por defecto mientras quede algún consumidor de ese archivo).
+
+    Args:
+        df (DataFrame): Dataset completo
+        wide (bool): Generar también la vista ancha legacy
+
+    Returns:
+        TrackingStore
+    """
     logger.info("")
     logger.info("="*70)
     logger.info("CREANDO TRACKING LONGITUDINAL")
     logger.info("="*70)
 
-    all_teams = sorted(df['Equipo'].unique())
-    all_seasons = sorted(df['Temporada'].unique())
+    store = TrackingStore.from_dataset(df, DIVISION_ORDER)
+    store.save(TRACKING_LONG_FILE)
+    summary = store.summary()
+
+    logger.info(f"✓ Tracking guardado: {TRACKING_LONG_FILE}")
+    logger.info(f"  {len(summary)} equipos únicos rastreados ({len(store):,} equipo-temporadas)")
+
+    if wide:
+        tracking_df = store.wide()
+        tracking_df.to_csv(TRACKING_FILE, index=False, encoding='utf-8-sig')
+        write_columnar(tracking_df, TRACKING_FILE)
+        logger.info(f"✓ Vista ancha guardada: {TRACKING_FILE}")
+
+    logger.info("")
+    logger.info("Top 15 equipos por temporadas jugadas:")
+    display_cols = ['Equipo', 'Total_Temporadas', 'Divisiones_Jugadas', 'Mejor_Division']
+    print(summary[display_cols].head(15).to_string(index=False))
+
+    logger.info("")
+    logger.info("="*70)
+    logger.info("✅ EXPANSIÓN FASE 3 COMPLETADA")
+    logger.info("="*70)
+
+    return store
+
+
+def merge_partitions(existing, updated, division_order=DIVISION_ORDER):
+    """
+    Sustituye en el dataset existente las particiones (división, temporada) de `updated`
+
+    Las particiones que no están en `updated` se conservan tal cual; el resultado
+    queda en el orden de un scraping completo (división → temporada).
+
+    Args:
+        existing (DataFrame): Dataset completo (e.g., load_table(OUTPUT_FILE))
+        updated (DataFrame): Clasificaciones recién calculadas
+
+    Returns:
+        DataFrame: Dataset combinado con tipos compactos
+    """
+    def partition_keys(df):
+        return pd.MultiIndex.from_arrays([df['Division'].astype(str), df['Temporada'].astype(str)])
 
-    # Definir jerarquía de divisiones (1 = mejor)
-    all_divisions = ['Premier League', 'Championship', 'League One', 'League Two', 'National League']
-    division_map = {d: i + 1 for i, d in enumerate(all_divisions)}
+    kept = existing[~partition_keys(existing).isin(partition_keys(updated).unique())]
+    merged = pd.concat([kept.astype({'Division': str, 'Temporada': str, 'Equipo': str}),
+                        updated.astype({'Division': str, 'Temporada': str, 'Equipo': str})],
+                       ignore_index=True)
+    division_rank = merged['Division'].map({d: i for i, d in enumerate(division_order)})
+    merged = merged.assign(_div=division_rank).sort_values(
+        ['_div', 'Temporada'], kind='stable'
+    ).drop(columns='_div').reset_index(drop=True)
+    return compact_standings(merged[existing.columns])
+
+
+def _csv_number(value):
+    """Formatea un valor numérico igual que to_csv en una columna float con nulos"""
+    return '' if pd.isna(value) else str(float(value))
+
+
+def update_tracking(tracking, combined, partitions):
+    """
+    Actualiza el tracking (leído como texto) solo para las particiones cambiadas
 
-    # Crear variable numérica de división en el dataframe original
-    df = df.copy()
+    Reescribe las columnas {temporada}_* de las temporadas afectadas y las métricas
+    agregadas de los equipos afectados. El resto de celdas se conserva tal cual.
+
+    Args:
+        tracking (DataFrame): english_leagues_tracking.csv leído con dtype=str
+        combined (DataFrame): Dataset completo ya actualizado (numérico)
+        partitions (dict): {(division, temporada): equipos antes del cambio}
+
+    Returns:
+        DataFrame: Tracking actualizado, ordenado como lo genera create_tracking
+    """
+    division_map = {d: i + 1 for i, d in enumerate(DIVISION_ORDER)}
+    inv_map = {v: k for k, v in division_map.items()}
+
+    df = combined.copy()
     df['Division_Num'] = df['Division'].map(division_map)
 
-    tracking = []
-    for team in all_teams:
-        row = {'Equipo': team}
-
-        # Para cada temporada, registrar división y posición
-        for season in all_seasons:
-            data = df[(df['Equipo'] == team) & (df['Temporada'] == season)]
-            if len(data) > 0:
-                division = data.iloc[0]['Division']
-                division_num = data.iloc[0]['Division_Num']
-                row[f'{season}_Division'] = division
-                row[f'{season}_Division_Num'] = division_num
-                row[f'{season}_Pos'] = data.iloc[0]['Pos']
-                row[f'{season}_Pts'] = data.iloc[0]['Pts']
-            else:
-                row[f'{season}_Division'] = None
-                row[f'{season}_Division_Num'] = None
-                row[f'{season}_Pos'] = None
-                row[f'{season}_Pts'] = None
+    affected_seasons = sorted({season for _, season in partitions})
+    affected_teams = set()
+    for (division, season), old_teams in partitions.items():
+        affected_teams.update(old_teams)
+        new_rows = df[(df['Division'] == division) & (df['Temporada'] == season)]
+        affected_teams.update(new_rows['Equipo'])
 
-        # Métricas agregadas
+    # Equipos nuevos: fila vacía
+    tracking = tracking.set_index('Equipo')
+    for team in sorted(affected_teams - set(tracking.index)):
+        tracking.loc[team] = ''
+
+    # Columnas de temporada: insertar las temporadas nuevas en orden cronológico
+    all_seasons = sorted(df['Temporada'].unique())
+    season_cols = [f'{season}_{suffix}' for season in all_seasons
+                   for suffix in ('Division', 'Division_Num', 'Pos', 'Pts')]
+    for col in season_cols:
+        if col not in tracking.columns:
+            tracking[col] = ''
+    tracking = tracking[season_cols + SUMMARY_COLUMNS]
+
+    for season in affected_seasons:
+        rows = df[df['Temporada'] == season].drop_duplicates('Equipo').set_index('Equipo')
+        tracking[f'{season}_Division'] = rows['Division'].reindex(tracking.index).fillna('')
+        for suffix in ('Division_Num', 'Pos', 'Pts'):
+            tracking[f'{season}_{suffix}'] = rows[suffix].reindex(tracking.index).map(_csv_number)
+
+    # Métricas agregadas de los equipos afectados
+    for team in affected_teams:
         team_data = df[df['Equipo'] == team]
-        row['Total_Temporadas'] = len(team_data)
-        row['Divisiones_Jugadas'] = team_data['Division'].nunique()
-
-        # Mejor división (numérica: menor = mejor)
-        if len(team_data) > 0:
-            row['Mejor_Division_Num'] = team_data['Division_Num'].min()
-            # Convertir de nuevo a texto (opcional)
-            inv_map = {v: k for k, v in division_map.items()}
-            row['Mejor_Division'] = inv_map.get(row['Mejor_Division_Num'], None)
-        else:
-            row['Mejor_Division_Num'] = None
-            row['Mejor_Division'] = None
-
-        # Mejor posición global
-        if len(team_data) > 0:
-            team_data = team_data.assign(
-                Global_Score=team_data['Division_Num'] * 100 + team_data['Pos']
-            )
-            row['Mejor_Posicion_Global'] = team_data['Global_Score'].min()
-        else:
-            row['Mejor_Posicion_Global'] = None
+        if len(team_data) == 0:
+            tracking = tracking.drop(index=team)
+            continue
+        best_num = team_data['Division_Num'].min()
+        tracking.loc[team, 'Total_Temporadas'] = str(len(team_data))
+        tracking.loc[team, 'Divisiones_Jugadas'] = str(team_data['Division'].nunique())
+        tracking.loc[team, 'Mejor_Division_Num'] = str(best_num)
+        tracking.loc[team, 'Mejor_Division'] = inv_map.get(best_num, '')
+        tracking.loc[team, 'Mejor_Posicion_Global'] = str(
+            (team_data['Division_Num'] * 100 + team_data['Pos']).min()
+        )
 
-        tracking.append(row)
+    # Mismo orden que create_tracking: alfabético y luego por temporadas jugadas
+    tracking = tracking.sort_index().reset_index()
+    order_key = tracking['Total_Temporadas'].astype(int)
+    return tracking.loc[order_key.sort_values(ascending=False, kind='stable').index]
 
-    tracking_df = pd.DataFrame(tracking)
-    tracking_df = tracking_df.sort_values('Total_Temporadas', ascending=False)
 
-    output = 'english_leagues_tracking.csv'
-    tracking_df.to_csv(output, index=False, encoding='utf-8-sig')
+def refresh_incremental(seasons=None, scrapers=None, output_file=OUTPUT_FILE, tracking_file=TRACKING_FILE,
+                        tracking_long_file=TRACKING_LONG_FILE, db_file=DB_FILE):
+    """
+    Refresco incremental: recalcula solo las particiones (división, temporada) que cambiaron
+
+    Revalida contra el servidor las temporadas indicadas (por defecto, la última de
+    cada división). Si el CSV de origen no cambió (HTTP 304 o mismo contenido) no se
+    recalcula nada; si cambió, se recalcula su clasificación, se reemplazan sus filas
+    en el dataset y se regenera el tracking largo. Si existe el tracking ancho, se
+    actualizan solo sus columnas afectadas.
+
+    Args:
+        seasons (list): Temporadas a revisar (None = última temporada de cada división)
+        scrapers (list): Scrapers a revisar (None = todas las divisiones)
+        output_file (str): Dataset completo existente
+        tracking_file (str): Tracking ancho existente (se ignora si no existe)
+        tracking_long_file (str): Tracking largo a regenerar
+        db_file (str): Base de datos SQLite (se actualizan sus particiones si existe)
+
+    Returns:
+        list: Particiones (división, temporada) actualizadas
+    """
+    scrapers = scrapers or build_scrapers(MatchStore())
 
+    logger.info("="*70)
+    logger.info("REFRESCO INCREMENTAL")
+    logger.info("="*70)
 
-    logger.info(f"✓ Tracking guardado: {output}")
-    logger.info(f"  {len(tracking_df)} equipos únicos rastreados")
+    # Leer como texto para reescribir sin alterar las filas no afectadas
+    existing = pd.read_csv(output_file, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+    report = RunReport('scraper_english_leagues')
+    changed = {}
+    raw_matches = {}
+    with report.stage('revalidación + parseo'):
+        for scraper in scrapers:
+            targets = seasons or scraper.get_seasons()[-1:]
+            for season in targets:
+                if season not in scraper.get_seasons():
+                    continue
+                mask = (existing['Division'] == scraper.division_name) & (existing['Temporada'] == season)
+                response = scraper.fetch_season_response(season, revalidate=True)
+                if response is None:
+                    continue
+                if not response.changed and mask.any():
+                    logger.info(f"  = {scraper.division_name} {season}: sin cambios")
+                    continue
+                # Un solo parseo: la clasificación y los partidos de la base de datos
+                standings_df, matches = scraper.parse_season_matches(response.content, season)
+                if standings_df is None:
+                    continue
+                changed[(scraper.division_name, season)] = (set(existing.loc[mask, 'Equipo']), standings_df)
+                raw_matches[(scraper.division_name, season)] = matches
+    get_client().metrics.log()
+    report.add_scrapers(scrapers)
+
+    if not changed:
+        logger.info("✓ Sin particiones modificadas")
+        report.save()
+        return []
+
+    # Sustituir las filas de cada partición cambiada y mantener el orden división → temporada
+    with report.stage('escritura del dataset'):
+        combined_text = existing
+        for (division, season), (_, standings_df) in changed.items():
+            keep = ~((combined_text['Division'] == division) & (combined_text['Temporada'] == season))
+            combined_text = pd.concat([combined_text[keep], export_standings(standings_df).astype(str)],
+                                      ignore_index=True)
+
+        division_rank = combined_text['Division'].map({d: i for i, d in enumerate(DIVISION_ORDER)})
+        combined_text = combined_text.assign(_div=division_rank).sort_values(
+            ['_div', 'Temporada'], kind='stable'
+        ).drop(columns='_div').reset_index(drop=True)
+        combined_text.to_csv(output_file, index=False, encoding='utf-8-sig')
+
+        combined = combined_text.copy()
+        for col in ['Pos', 'PJ', 'G', 'E', 'P', 'Pts', 'GF', 'GC']:
+            combined[col] = combined[col].astype(int)
+
+        write_columnar(combined, output_file)
+
+    # El tracking largo es barato de regenerar entero
+    with report.stage('tracking'):
+        store = TrackingStore.from_dataset(combined, DIVISION_ORDER)
+        store.save(tracking_long_file)
+    updated_files = [output_file, tracking_long_file]
+
+    db_partitions = {key: (standings_df, raw_matches[key]) for key, (_, standings_df) in changed.items()}
+    with report.stage('base de datos'):
+        if update_partitions(db_partitions, store.data, path=db_file):
+            updated_files.append(db_file)
+
+    if Path(tracking_file).exists():
+        with report.stage('tracking ancho'):
+            tracking = pd.read_csv(tracking_file, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+            partitions = {key: old_teams for key, (old_teams, _) in changed.items()}
+            tracking = update_tracking(tracking, combined, partitions)
+            tracking.to_csv(tracking_file, index=False, encoding='utf-8-sig')
+            write_columnar(pd.read_csv(tracking_file, encoding='utf-8-sig'), tracking_file)
+        updated_files.append(tracking_file)
+
+    for division, season in changed:
+        logger.info(f"  ↻ {division} {season}: actualizada")
+    logger.info(f"✅ Datos actualizados: {', '.join(updated_files)}")
+    report.log()
+    report.save()
+
+    return list(changed)
+
+
+def load_all_matches(scrapers=None, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Partidos limpios de todas las divisiones y temporadas en un único DataFrame
 
-    logger.info("")
-    logger.info("Top 15 equipos por temporadas jugadas:")
-    display_cols = ['Equipo', 'Total_Temporadas', 'Divisiones_Jugadas', 'Mejor_Division']
-    print(tracking_df[display_cols].head(15).to_string(index=False))
+    Usa la caché en disco, así que tras la primera ejecución las temporadas
+    cerradas no generan tráfico de red. Si los scrapers tienen almacén de
+    partidos, cada temporada parseada se guarda también ahí (salvo si su
+    partición ya salió del mismo CSV).
 
-    logger.info("")
+    Returns:
+        DataFrame: Partidos con columnas Division y Temporada añadidas (o None)
+    """
+    scrapers = scrapers or build_scrapers()
+    frames = []
+
+    for scraper in scrapers:
+        for season, raw in scraper.fetch_all_seasons(max_workers):
+            if raw is None:
+                continue
+            try:
+                source = scraper.partition_source(season, raw)
+                matches = scraper.parse_matches(raw, season, all_columns=source is not None)
+            except Exception as e:
+                logger.warning(f"  ✗ {scraper.division_name} {season}: Error inesperado: {str(e)}")
+                continue
+            if matches is None:
+                continue
+            if source is not None:
+                scraper.store_matches(season, matches, source)
+            frames.append(pd.DataFrame({
+                'Division': scraper.division_name,
+                'Temporada': season,
+                'HomeTeam': matches['HomeTeam'].to_numpy(),
+                'AwayTeam': matches['AwayTeam'].to_numpy(),
+                'FTHG': matches['FTHG'].to_numpy(),
+                'FTAG': matches['FTAG'].to_numpy(),
+                'FTR': matches['FTR'].to_numpy(),
+            }))
+
+    if not frames:
+        return None
+
+    all_matches = pd.concat(frames, ignore_index=True)
+    # Orden de la pirámide (no alfabético) para las tablas resultantes
+    all_matches['Division'] = pd.Categorical(
+        all_matches['Division'],
+        categories=[scraper.division_name for scraper in scrapers]
+    )
+    return encode_teams(all_matches)
+
+
+def encode_teams(all_matches):
+    """Equipos como Categorical del registro: el cálculo por lotes usa sus IDs enteros"""
+    registry = TeamRegistry.from_matches(all_matches)
+    for col in ('HomeTeam', 'AwayTeam'):
+        all_matches[col] = registry.categorical(all_matches[col])
+    return all_matches
+
+
+def load_stored_matches(match_store, scrapers=None):
+    """
+    Partidos de todas las divisiones leídos del almacén (sin red ni caché HTTP)
+
+    Returns:
+        DataFrame: Mismo formato que load_all_matches (o None si el almacén está vacío)
+    """
+    scrapers = scrapers or build_scrapers()
+    divisions = [scraper.division_name for scraper in scrapers]
+
+    all_matches = match_store.load(divisions=divisions, columns=MATCH_COLUMNS)
+    if all_matches is None:
+        return None
+    all_matches['Division'] = pd.Categorical(all_matches['Division'], categories=divisions)
+    return encode_teams(all_matches)
+
+
+def build_standings_batch(all_matches, scrapers=None):
+    """
+    Calcula todas las clasificaciones de la pirámide en una sola operación
+
+    Equivale a llamar calculate_standings por cada (división, temporada) y aplicar
+    validate_team_count, pero agrupando por (Division, Temporada, Equipo) de una vez.
+
+    Returns:
+        DataFrame: Mismo formato y orden que english_leagues_completo.csv
+    """
+    scrapers = scrapers or build_scrapers()
+    by_division = {scraper.division_name: scraper for scraper in scrapers}
+
+    standings = compute_all_standings(all_matches, keys=('Division', 'Temporada'))
+    standings['Division'] = standings['Division'].astype(object)
+
+    # Validar número de equipos por partición
+    team_counts = standings.groupby(['Division', 'Temporada'], sort=False).size()
+    invalid = [
+        (division, season) for (division, season), count in team_counts.items()
+        if not by_division[division].validate_team_count(count)
+    ]
+    for division, season in invalid:
+        count = team_counts[(division, season)]
+        expected = by_division[division].expected_teams
+        logger.warning(f"  ✗ {division} {season}: {count} equipos (esperado: {expected})")
+    if invalid:
+        bad = pd.MultiIndex.from_tuples(invalid)
+        keep = ~pd.MultiIndex.from_frame(standings[['Division', 'Temporada']]).isin(bad)
+        standings = standings[keep].reset_index(drop=True)
+
+    return compact_standings(standings[[
+        'Temporada', 'Division', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P',
+        'Pts', 'GF', 'GC', 'Dif'
+    ]])
+
+
+def rebuild_from_cache(output_file=OUTPUT_FILE, max_workers=DEFAULT_MAX_WORKERS, wide_tracking=True,
+                       offline=False, database=True, premier=False):
+    """
+    Reconstruye el dataset completo y el tracking con el cálculo por lotes
+
+    Args:
+        output_file (str): Dataset completo a generar
+        max_workers (int): Lecturas simultáneas por división
+        wide_tracking (bool): Generar también el tracking ancho legacy (english_leagues_tracking.csv)
+        offline (bool): Leer los partidos del almacén en lugar de la caché HTTP
+        database (bool): Generar también la base de datos SQLite
+        premier (bool): Derivar también los archivos de scraper_premier_league
+    """
+    source = "almacén de partidos" if offline else "CSVs crudos en caché"
     logger.info("="*70)
-    logger.info("✅ EXPANSIÓN FASE 3 COMPLETADA")
+    logger.info(f"RECONSTRUCCIÓN POR LOTES ({source})")
     logger.info("="*70)
 
+    report = RunReport('scraper_english_leagues')
+    match_store = MatchStore()
+    with report.stage('carga de partidos'):
+        if offline:
+            scrapers = build_scrapers()
+            all_matches = load_stored_matches(match_store, scrapers)
+        else:
+            scrapers = build_scrapers(match_store)
+            all_matches = load_all_matches(scrapers, max_workers)
+    report.add_scrapers(scrapers)
+    if all_matches is None:
+        logger.warning("✗ No hay partidos disponibles")
+        report.save()
+        return None
+
+    memory = MemoryReport()
+    memory.record("Partidos", all_matches)
+
+    with report.stage('clasificaciones (lotes)'):
+        combined_clean = build_standings_batch(all_matches, scrapers)
+    memory.record("Dataset combinado", combined_clean)
+    with report.stage('escritura del dataset'):
+        export_standings(combined_clean).to_csv(output_file, index=False, encoding='utf-8-sig')
+        write_columnar(combined_clean, output_file)
+
+    logger.info(f"\n✅ DATOS GUARDADOS: {output_file}")
+    logger.info(f"Total registros: {len(combined_clean):,}")
+    logger.info(f"Partidos procesados: {len(all_matches):,}")
+
+    with report.stage('tracking'):
+        store = create_tracking(combined_clean, wide=wide_tracking)
+    memory.record("Tracking largo", store.data)
+    if database:
+        with report.stage('base de datos'):
+            build_database(combined_clean, store.data, all_matches, division_order=DIVISION_ORDER, path=DB_FILE)
+    if premier:
+        with report.stage('premier derivada'):
+            derive_premier(combined_clean)
+    memory.log()
+    report.log()
+    report.save()
+    return combined_clean
+
+
+def main():
+    """Punto de entrada del script (python scraper_english_leagues.py [opciones])"""
+    setup_logging('scraper_english_leagues')
+    wide_tracking = '--no-wide-tracking' not in sys.argv
+    premier = '--premier' in sys.argv
+    if '--incremental' in sys.argv:
+        refresh_incremental()
+    elif '--batch' in sys.argv:
+        rebuild_from_cache(wide_tracking=wide_tracking, offline='--offline' in sys.argv, premier=premier)
+    else:
+        scrape_all_divisions(
+            wide_tracking=wide_tracking,
+            backend='asyncio' if '--async' in sys.argv else 'threads',
+            processes=0 if '--processes' in sys.argv else None,
+            premier=premier
+        )
+
 
 if __name__ == "__main__":
-    scrape_all_divisions()
+    main()
@@ -1,222 +1,75 @@
 """
 Premier League Scraper - MEJORADO para football-data.co.uk
 Maneja diferentes formatos de CSV según la temporada
+
+Usa el motor de scraper_english_leagues (PremierLeagueScraper): este módulo
+solo selecciona las columnas de la Premier League y genera sus archivos.
+Si ya se ha ejecutado la pirámide, `--from-pyramid` (o derive_from_pyramid)
+genera los mismos archivos a partir de su dataset, sin descargar nada.
 """
 
 import pandas as pd
-import requests
-import time
 import logging
+import sys
 from io import StringIO
 import numpy as np
-from pathlib import Path
-from datetime import datetime
-
-# Configurar logging con archivo y consola
-log_dir = Path('logs')
-log_dir.mkdir(exist_ok=True)
-
-# Nombre de archivo con timestamp
-log_filename = log_dir / f'scraper_premier_league_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename, encoding='utf-8'),
-        logging.StreamHandler()  # También mostrar en consola
-    ]
-)
+
+from http_cache import HTTPCache, default_immutable_before
+from http_client import get_client
+from scraper_english_leagues import OUTPUT_FILE as PYRAMID_FILE, PremierLeagueScraper
+from standings import compact_standings, export_standings
+from dataset_io import load_table, write_columnar
+from memory_report import MemoryReport
+from run_report import RunReport, timed_stage
+from log_setup import setup_logging
+
+# Sin handlers ni ficheros al importar: el log lo configura main() (log_setup)
 logger = logging.getLogger(__name__)
 
-logger.info(f"Logging iniciado - archivo: {log_filename}")
+# Se puede sobrescribir para apuntar a un servidor local con CSVs de prueba
+FOOTBALL_DATA_BASE_URL = "https://www.football-data.co.uk/mmz4281"
 
+# Caché en disco compartida con scraper_english_leagues (None para desactivarla)
+http_cache = HTTPCache()
 
-def get_football_data_url(season):
-    """Construye URL para football-data.co.uk"""
-    year = int(season.split('-')[0])
-    next_year_short = season.split('-')[1]
-    
-    # Formato: 9900.csv, 0001.csv, 0102.csv, etc.
-    code = f"{str(year)[-2:]}{next_year_short}"
-    
-    # E0 = Premier League (England Division 0)
-    url = f"https://www.football-data.co.uk/mmz4281/{code}/E0.csv"
-    return url
+# Temporadas que empiezan antes de este año se consideran cerradas (nunca se re-descargan)
+IMMUTABLE_BEFORE = default_immutable_before()
 
+# Columnas del dataset de la Premier League (el de la pirámide añade Division)
+PREMIER_COLUMNS = ['Temporada', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P', 'Pts', 'GF', 'GC', 'Dif']
 
-def clean_team_name(name):
-    """Limpia nombres de equipos"""
-    if pd.isna(name):
-        return None
-    return str(name).strip()
+OUTPUT_FILE = 'premier_league_COMPLETO_football_data.csv'
+TRACKING_FILE = 'premier_league_tracking_COMPLETO.csv'
 
 
-def safe_int_conversion(value):
-    """Convierte a entero de forma segura"""
-    try:
-        if pd.isna(value):
-            return 0
-        if isinstance(value, str):
-            # Eliminar espacios y caracteres no numéricos
-            cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
-            if cleaned:
-                return int(float(cleaned))
-        return int(value)
-    except:
-        return 0
+def build_scraper(start_year=1993, end_year=2025):
+    """
+    PremierLeagueScraper del motor común con la configuración de este módulo
+
+    Descarga, parseo y clasificaciones son los de EnglishLeagueScraper (mismas
+    URLs y misma caché en disco que la pirámide: E0 no se descarga dos veces).
+    """
+    scraper = PremierLeagueScraper(start_year, end_year)
+    scraper.base_url = FOOTBALL_DATA_BASE_URL
+    scraper.cache = http_cache
+    scraper.immutable_before = IMMUTABLE_BEFORE
+    return scraper
+
+
+def premier_view(standings_df):
+    """Clasificaciones del motor común con las columnas del dataset de la Premier League"""
+    return compact_standings(standings_df[PREMIER_COLUMNS])
+
+
+def get_football_data_url(season):
+    """Construye URL para football-data.co.uk"""
+    return build_scraper().get_url(season)
 
 
 def download_season(season):
     """Descarga y procesa una temporada con manejo robusto de errores"""
-    url = get_football_data_url(season)
-    
-    try:
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code != 200:
-            logger.warning(f"  ✗ {season}: HTTP {response.status_code}")
-            return None
-        
-        # Intentar diferentes métodos de parsing
-        df = None
-        
-        # Método 1: Standard parsing
-        try:
-            df = pd.read_csv(StringIO(response.text), encoding='utf-8')
-        except:
-            pass
-        
-        # Método 2: Con error_bad_lines=False (para versiones antiguas de pandas)
-        if df is None:
-            try:
-                df = pd.read_csv(StringIO(response.text), encoding='utf-8', 
-                               on_bad_lines='skip')  # Nueva sintaxis
-            except:
-                try:
-                    df = pd.read_csv(StringIO(response.text), encoding='utf-8', 
-                                   error_bad_lines=False)  # Sintaxis antigua
-                except:
-                    pass
-        
-        # Método 3: Con encoding diferente
-        if df is None:
-            try:
-                df = pd.read_csv(StringIO(response.text), encoding='latin-1')
-            except:
-                pass
-        
-        if df is None:
-            logger.warning(f"  ✗ {season}: No se pudo parsear el CSV")
-            return None
-        
-        # Limpiar el dataframe
-        df = df.dropna(subset=['HomeTeam', 'AwayTeam'], how='any')
-        
-        # Verificar columnas requeridas
-        required_cols = ['HomeTeam', 'AwayTeam', 'FTHG', 'FTAG', 'FTR']
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        
-        if missing_cols:
-            logger.warning(f"  ✗ {season}: Columnas faltantes: {missing_cols}")
-            return None
-        
-        # Limpiar nombres de equipos
-        df['HomeTeam'] = df['HomeTeam'].apply(clean_team_name)
-        df['AwayTeam'] = df['AwayTeam'].apply(clean_team_name)
-        
-        # Eliminar filas con equipos nulos después de limpieza
-        df = df.dropna(subset=['HomeTeam', 'AwayTeam'])
-        
-        # Convertir goles a números de forma segura
-        df['FTHG'] = df['FTHG'].apply(safe_int_conversion)
-        df['FTAG'] = df['FTAG'].apply(safe_int_conversion)
-        
-        # Filtrar solo partidos válidos (con resultado)
-        df = df[df['FTR'].isin(['H', 'D', 'A'])]
-        
-        if len(df) == 0:
-            logger.warning(f"  ✗ {season}: Sin partidos válidos")
-            return None
-        
-        # Calcular tabla de clasificación
-        teams = sorted(set(df['HomeTeam'].tolist() + df['AwayTeam'].tolist()))
-        
-        standings = []
-        for team in teams:
-            home = df[df['HomeTeam'] == team]
-            away = df[df['AwayTeam'] == team]
-            
-            pj = len(home) + len(away)
-            
-            if pj == 0:
-                continue
-            
-            # Victorias
-            w_home = len(home[home['FTR'] == 'H'])
-            w_away = len(away[away['FTR'] == 'A'])
-            w = w_home + w_away
-            
-            # Empates
-            d_home = len(home[home['FTR'] == 'D'])
-            d_away = len(away[away['FTR'] == 'D'])
-            d = d_home + d_away
-            
-            # Derrotas
-            l = pj - w - d
-            
-            # Goles (usando conversión segura)
-            gf = int(home['FTHG'].sum() + away['FTAG'].sum())
-            gc = int(home['FTAG'].sum() + away['FTHG'].sum())
-            gd = gf - gc
-            
-            # Puntos
-            pts = 3 * w + d
-            
-            standings.append({
-                'Equipo': team,
-                'PJ': pj,
-                'G': w,
-                'E': d,
-                'P': l,
-                'GF': gf,
-                'GC': gc,
-                'Dif': gd,
-                'Pts': pts
-            })
-        
-        if not standings:
-            logger.warning(f"  ✗ {season}: Sin datos de equipos")
-            return None
-        
-        # Crear DataFrame y ordenar
-        standings_df = pd.DataFrame(standings)
-        standings_df = standings_df.sort_values(
-            ['Pts', 'Dif', 'GF'], 
-            ascending=[False, False, False]
-        ).reset_index(drop=True)
-        
-        standings_df['Pos'] = range(1, len(standings_df) + 1)
-        standings_df['Temporada'] = season
-        
-        # Formatear Dif como string con signo
-        standings_df['Dif'] = standings_df['Dif'].apply(
-            lambda x: f"+{x}" if x > 0 else str(x)
-        )
-        
-        # Reordenar columnas
-        standings_df = standings_df[[
-            'Temporada', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P', 
-            'Pts', 'GF', 'GC', 'Dif'
-        ]]
-        
-        logger.info(f"  ✓ {season}: {len(standings_df)} equipos")
-        return standings_df
-        
-    except Exception as e:
-        logger.warning(f"  ✗ {season}: Error inesperado: {str(e)}")
-        return None
+    standings_df = build_scraper().download_season(season)
+    return premier_view(standings_df) if standings_df is not None else None
 
 
 def debug_season(season):
@@ -227,7 +80,7 @@ def debug_season(season):
     logger.info(f"URL: {url}")
     
     try:
-        response = requests.get(url, timeout=10)
+        response = get_client().get(url, timeout=10)
         logger.info(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -262,22 +115,12 @@ def scrape_all_seasons(start_year=1993, end_year=2025, debug_failed=False):
     logger.info("="*70)
     logger.info("")
     
-    all_data = []
-    failed = []
-    
-    for year in range(start_year, end_year):
-        next_year = year + 1
-        season = f"{year}-{str(next_year)[-2:]}"
-        
-        df = download_season(season)
-        
-        if df is not None:
-            all_data.append(df)
-        else:
-            failed.append(season)
-        
-        # Pausa para no sobrecargar el servidor
-        time.sleep(0.5)
+    # Descargas en paralelo con el límite de peticiones por host del motor común
+    report = RunReport('scraper_premier_league')
+    scraper = build_scraper(start_year, end_year)
+    with report.stage('descarga + parseo'):
+        combined, failed = scraper.scrape_all_seasons()
+    n_seasons = combined['Temporada'].nunique() if combined is not None else 0
     
     # Debug de temporadas fallidas si se solicita
     if debug_failed and failed:
@@ -291,21 +134,40 @@ def scrape_all_seasons(start_year=1993, end_year=2025, debug_failed=False):
     logger.info("="*70)
     logger.info("RESUMEN")
     logger.info("="*70)
-    logger.info(f"✓ Temporadas exitosas: {len(all_data)}")
+    logger.info(f"✓ Temporadas exitosas: {n_seasons}")
     logger.info(f"✗ Temporadas fallidas: {len(failed)}")
     
     if failed:
         logger.info(f"\nTemporadas fallidas: {', '.join(failed)}")
     
-    if all_data:
-        combined = pd.concat(all_data, ignore_index=True)
-        
-        # Validar datos
-        logger.info("")
-        logger.info("="*70)
-        logger.info("VALIDACIÓN")
-        logger.info("="*70)
-        
+    get_client().metrics.log()
+    
+    combined_clean = save_dataset(premier_view(combined), report) if combined is not None else None
+    
+    report.add_scrapers([scraper])
+    report.log()
+    report.save()
+    return combined_clean
+
+
+def save_dataset(combined, report=None):
+    """
+    Valida y guarda el dataset de la Premier League y crea su tracking
+
+    Args:
+        combined (DataFrame): Clasificaciones con las columnas de PREMIER_COLUMNS
+        report (RunReport): Informe de ejecución donde medir cada etapa (opcional)
+
+    Returns:
+        DataFrame: Dataset guardado
+    """
+    # Validar datos
+    logger.info("")
+    logger.info("="*70)
+    logger.info("VALIDACIÓN")
+    logger.info("="*70)
+    
+    with timed_stage(report, 'validación'):
         # Verificar G + E + P = PJ
         combined['Suma'] = combined['G'] + combined['E'] + combined['P']
         problemas_pj = (combined['Suma'] != combined['PJ']).sum()
@@ -313,69 +175,132 @@ def scrape_all_seasons(start_year=1993, end_year=2025, debug_failed=False):
         # Verificar Pts = 3*G + E
         combined['Pts_Calc'] = 3 * combined['G'] + combined['E']
         problemas_pts = (combined['Pts_Calc'] != combined['Pts']).sum()
-        
-        logger.info(f"Registros con G+E+P != PJ: {problemas_pj}")
-        logger.info(f"Registros con Pts != 3*G+E: {problemas_pts}")
-        
-        if problemas_pj == 0 and problemas_pts == 0:
-            logger.info("\n✅ TODOS LOS DATOS SON 100% CONSISTENTES!")
-        
-        # Guardar
-        output = 'premier_league_COMPLETO_football_data.csv'
-        combined_clean = combined[[
-            'Temporada', 'Pos', 'Equipo', 'PJ', 'G', 'E', 'P', 
-            'Pts', 'GF', 'GC', 'Dif'
-        ]]
-        combined_clean.to_csv(output, index=False, encoding='utf-8-sig')
-        
-        logger.info("")
-        logger.info("="*70)
-        logger.info("DATOS GUARDADOS")
-        logger.info("="*70)
-        logger.info(f"Archivo: {output}")
-        logger.info(f"Total registros: {len(combined_clean):,}")
-        logger.info(f"Temporadas: {combined_clean['Temporada'].nunique()}")
-        logger.info(f"Equipos únicos: {combined_clean['Equipo'].nunique()}")
-        
-        # Crear tracking
-        create_tracking(combined_clean)
-        
-        return combined_clean
     
-    return None
+    logger.info(f"Registros con G+E+P != PJ: {problemas_pj}")
+    logger.info(f"Registros con Pts != 3*G+E: {problemas_pts}")
+    
+    if problemas_pj == 0 and problemas_pts == 0:
+        logger.info("\n✅ TODOS LOS DATOS SON 100% CONSISTENTES!")
+    
+    # Guardar
+    output = OUTPUT_FILE
+    with timed_stage(report, 'escritura del dataset'):
+        combined_clean = compact_standings(combined[PREMIER_COLUMNS])
+        export_standings(combined_clean).to_csv(output, index=False, encoding='utf-8-sig')
+        write_columnar(combined_clean, output)
+    
+    logger.info("")
+    logger.info("="*70)
+    logger.info("DATOS GUARDADOS")
+    logger.info("="*70)
+    logger.info(f"Archivo: {output}")
+    logger.info(f"Total registros: {len(combined_clean):,}")
+    logger.info(f"Temporadas: {combined_clean['Temporada'].nunique()}")
+    logger.info(f"Equipos únicos: {combined_clean['Equipo'].nunique()}")
+    
+    # Crear tracking
+    with timed_stage(report, 'tracking'):
+        tracking_df = create_tracking(combined_clean)
+    
+    memory = MemoryReport()
+    memory.record("Dataset combinado", combined_clean)
+    memory.record("Tracking", tracking_df)
+    memory.log()
+    
+    return combined_clean
 
 
-def create_tracking(df):
-    """Crea base de datos de tracking"""
+def derive_from_pyramid(pyramid_df=None, pyramid_file=PYRAMID_FILE):
+    """
+    Genera el dataset y el tracking de la Premier League a partir de la pirámide
+
+    Las filas de la Premier League del dataset de scraper_english_leagues son
+    exactamente las de este módulo (mismo motor, mismas temporadas): basta con
+    proyectarlas, sin volver a descargar E0 ni recalcular clasificaciones.
+
+    Args:
+        pyramid_df (DataFrame): Dataset de la pirámide ya en memoria (None = leer pyramid_file)
+        pyramid_file (str): Dataset de la pirámide en disco (su Parquet si está al día)
+
+    Returns:
+        DataFrame: Dataset de la Premier League (None si la pirámide no la contiene)
+    """
     logger.info("")
-    logger.info("Creando tracking de equipos...")
-    
+    logger.info("="*70)
+    logger.info("PREMIER LEAGUE - DERIVADA DEL DATASET DE LA PIRÁMIDE (sin descargas)")
+    logger.info("="*70)
+
+    if pyramid_df is None:
+        try:
+            pyramid_df = load_table(pyramid_file)
+        except FileNotFoundError:
+            logger.warning(f"✗ No existe {pyramid_file}: ejecuta antes scraper_english_leagues.py")
+            return None
+        logger.info(f"Origen: {pyramid_file}")
+
+    premier = pyramid_df[pyramid_df['Division'] == 'Premier League']
+    if premier.empty:
+        logger.warning("✗ El dataset de la pirámide no contiene la Premier League")
+        return None
+
+    # Sin las categorías (equipos, temporadas) del resto de divisiones
+    premier = premier.reset_index(drop=True).apply(
+        lambda col: col.cat.remove_unused_categories() if isinstance(col.dtype, pd.CategoricalDtype) else col
+    )
+    logger.info(f"✓ Temporadas: {premier['Temporada'].nunique()}")
+    return save_dataset(premier_view(premier))
+
+
+def build_tracking(df):
+    """
+    Construye la tabla de tracking (vectorizado)
+
+    Un único pivot de Pos/Pts por equipo × temporada; Total_Temporadas,
+    Mejor_Posicion y Peor_Posicion se agregan directamente sobre el formato largo.
+    """
     all_teams = sorted(df['Equipo'].unique())
     all_seasons = sorted(df['Temporada'].unique())
+
+    first = df.drop_duplicates(['Equipo', 'Temporada'], keep='first')
+    pivots = {
+        field: first.pivot(index='Equipo', columns='Temporada', values=field)
+                    .reindex(index=all_teams, columns=all_seasons)
+                    .to_numpy(dtype='float64')
+        for field in ['Pos', 'Pts']
+    }
+    gaps = {field: np.isnan(values).any(axis=0) for field, values in pivots.items()}
+
+    columns = {'Equipo': all_teams}
+    for j, season in enumerate(all_seasons):
+        for field in ['Pos', 'Pts']:
+            values = pivots[field][:, j]
+            # Como en DataFrame(list of dicts): entero sin huecos, float con None → NaN
+            columns[f'{season}_{field}'] = values if gaps[field][j] else values.astype('int64')
+
+    grouped = first.groupby('Equipo')['Pos']
+    best = grouped.min().reindex(all_teams)
+    worst = grouped.max().reindex(all_teams)
+    dtype = 'float64' if gaps['Pos'].any() else 'int64'
+
+    columns['Total_Temporadas'] = grouped.size().reindex(all_teams).to_numpy()
+    columns['Mejor_Posicion'] = best.astype(dtype).to_numpy()
+    columns['Peor_Posicion'] = worst.astype(dtype).to_numpy()
+
+    tracking_df = pd.DataFrame(columns)
+    # Orden estable: los empates en Total_Temporadas quedan por Equipo (orden de all_teams)
+    return tracking_df.sort_values('Total_Temporadas', ascending=False, kind='stable')
+
+
+def create_tracking(df):
+    """Crea base de datos de tracking (devuelve la tabla)"""
+    logger.info("")
+    logger.info("Creando tracking de equipos...")
     
-    tracking = []
-    for team in all_teams:
-        row = {'Equipo': team}
-        
-        for season in all_seasons:
-            data = df[(df['Equipo'] == team) & (df['Temporada'] == season)]
-            if len(data) > 0:
-                row[f'{season}_Pos'] = data.iloc[0]['Pos']
-                row[f'{season}_Pts'] = data.iloc[0]['Pts']
-            else:
-                row[f'{season}_Pos'] = None
-                row[f'{season}_Pts'] = None
-        
-        tracking.append(row)
-    
-    tracking_df = pd.DataFrame(tracking)
-    tracking_df['Total_Temporadas'] = tracking_df.filter(regex='_Pos').notna().sum(axis=1)
-    tracking_df['Mejor_Posicion'] = tracking_df.filter(regex='_Pos').min(axis=1)
-    tracking_df['Peor_Posicion'] = tracking_df.filter(regex='_Pos').max(axis=1)
-    tracking_df = tracking_df.sort_values('Total_Temporadas', ascending=False)
+    tracking_df = build_tracking(df)
     
-    output = 'premier_league_tracking_COMPLETO.csv'
+    output = TRACKING_FILE
     tracking_df.to_csv(output, index=False, encoding='utf-8-sig')
+    write_columnar(tracking_df, output)
     
     logger.info(f"✓ Tracking guardado: {output}")
     logger.info(f"  {len(tracking_df)} equipos únicos")
@@ -389,7 +314,19 @@ def create_tracking(df):
     logger.info("✅ PROCESO COMPLETADO")
     logger.info("="*70)
 
+    return tracking_df
+
+
+def main():
+    """Punto de entrada del script (python scraper_premier_league.py [--from-pyramid])"""
+    setup_logging('scraper_premier_league')
+    if '--from-pyramid' in sys.argv:
+        # Sin red: a partir de english_leagues_completo.csv de scraper_english_leagues
+        derive_from_pyramid()
+    else:
+        # Ejecutar con debug para las temporadas fallidas
+        scrape_all_seasons(1993, 2025, debug_failed=True)
+
 
 if __name__ == "__main__":
-    # Ejecutar con debug para las temporadas fallidas
-    scrape_all_seasons(1993, 2025, debug_failed=True)
+    main()
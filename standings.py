@@ -0,0 +1,207 @@
+"""
+Motor vectorizado de clasificaciones
+
+Sustituye el bucle por equipo (df[df['HomeTeam'] == team] + filtros de FTR) por
+una sola pasada: cada equipo se codifica como entero (factorize) y PJ/G/E/GF/GC
+se acumulan para todos los equipos a la vez con np.bincount sobre los partidos
+"fundidos" en formato largo (una entrada local y otra visitante por partido).
+Si HomeTeam/AwayTeam ya llegan como Categorical con las categorías del registro
+de equipos (team_registry), se usan sus códigos enteros directamente.
+"""
+
+import numpy as np
+import pandas as pd
+
+STANDINGS_COLUMNS = ['Equipo', 'PJ', 'G', 'E', 'P', 'GF', 'GC', 'Dif', 'Pts']
+
+# Tipos en memoria de una clasificación: texto repetido como category y contadores
+# como int16 (int8 se desborda al operar, e.g. 3 * G en temporadas de 46 partidos).
+# Dif se queda como entero con signo hasta exportar a CSV (export_standings)
+STANDINGS_DTYPES = {
+    'Temporada': 'category', 'Division': 'category', 'Equipo': 'category',
+    'Pos': 'int16', 'PJ': 'int16', 'G': 'int16', 'E': 'int16', 'P': 'int16',
+    'Pts': 'int16', 'GF': 'int16', 'GC': 'int16', 'Dif': 'int16',
+}
+
+
+def tally_standings(home_codes, away_codes, n_groups, matches):
+    """
+    Acumula estadísticas por código de grupo (equipo o división/temporada/equipo)
+
+    Args:
+        home_codes (ndarray): Código del grupo local de cada partido
+        away_codes (ndarray): Código del grupo visitante de cada partido
+        n_groups (int): Número total de grupos
+        matches (DataFrame): Partidos con FTHG, FTAG (enteros) y FTR (H/D/A)
+
+    Returns:
+        dict: Arrays int64 PJ, G, E, P, GF, GC, Dif, Pts indexados por código
+    """
+    ftr = matches['FTR'].to_numpy()
+    fthg = matches['FTHG'].to_numpy(dtype='int64')
+    ftag = matches['FTAG'].to_numpy(dtype='int64')
+    draw = ftr == 'D'
+
+    def count(home_weights, away_weights):
+        total = (np.bincount(home_codes, weights=home_weights, minlength=n_groups)
+                 + np.bincount(away_codes, weights=away_weights, minlength=n_groups))
+        return total.astype('int64')
+
+    pj = (np.bincount(home_codes, minlength=n_groups)
+          + np.bincount(away_codes, minlength=n_groups)).astype('int64')
+    g = count(ftr == 'H', ftr == 'A')
+    e = count(draw, draw)
+    gf = count(fthg, ftag)
+    gc = count(ftag, fthg)
+
+    return {
+        'PJ': pj,
+        'G': g,
+        'E': e,
+        'P': pj - g - e,
+        'GF': gf,
+        'GC': gc,
+        'Dif': gf - gc,
+        'Pts': 3 * g + e,
+    }
+
+
+def compute_standings(matches):
+    """
+    Clasificación de una temporada a partir de sus partidos
+
+    Ordena por Pts, Dif y GF (descendente); los empates totales mantienen el
+    orden alfabético, igual que el cálculo original.
+
+    Args:
+        matches (DataFrame): Partidos limpios (HomeTeam, AwayTeam, FTHG, FTAG, FTR)
+
+    Returns:
+        DataFrame: Columnas STANDINGS_COLUMNS + Pos, con Dif numérico (vacío si no hay partidos)
+    """
+    n_matches = len(matches)
+    codes, uniques = team_codes(matches)
+
+    stats = tally_standings(codes[:n_matches], codes[n_matches:], len(uniques), matches)
+    order = sort_order(stats)
+    # Equipos del registro que no juegan en estos partidos
+    order = order[stats['PJ'][order] > 0]
+
+    columns = {'Equipo': np.asarray(uniques, dtype=object)[order]}
+    columns.update({col: stats[col][order] for col in STANDINGS_COLUMNS[1:]})
+    columns['Pos'] = np.arange(1, len(order) + 1)
+    return pd.DataFrame(columns)
+
+
+def team_codes(matches):
+    """
+    Códigos enteros de los equipos, en orden alfabético
+
+    Returns:
+        tuple: (códigos de local y visitante concatenados, nombres por código)
+    """
+    home, away = matches['HomeTeam'], matches['AwayTeam']
+    if (isinstance(home.dtype, pd.CategoricalDtype) and isinstance(away.dtype, pd.CategoricalDtype)
+            and home.cat.categories.equals(away.cat.categories)
+            and home.cat.categories.is_monotonic_increasing):
+        codes = np.concatenate([home.cat.codes.to_numpy(), away.cat.codes.to_numpy()])
+        return codes.astype('int64'), home.cat.categories.to_numpy(dtype=object)
+
+    # sort=True: códigos en orden alfabético, como sorted(set(equipos))
+    return pd.factorize(
+        np.concatenate([home.to_numpy(dtype=object), away.to_numpy(dtype=object)]),
+        sort=True
+    )
+
+
+def sort_order(stats, group_codes=None):
+    """
+    Orden de clasificación: Pts, Dif y GF descendentes
+
+    np.lexsort es estable, así que los empates totales conservan el orden de los
+    códigos (alfabético), igual que sort_values en el cálculo original. Si se pasan
+    group_codes, se ordena primero por grupo (e.g., división/temporada).
+    """
+    keys = [-stats['GF'], -stats['Dif'], -stats['Pts']]
+    if group_codes is not None:
+        keys.append(group_codes)
+    return np.lexsort(keys)
+
+
+def _key_codes(column):
+    """Códigos ordenados de una columna clave (respeta el orden de categorías si es Categorical)"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy(dtype='int64'), len(column.cat.categories)
+    codes, uniques = pd.factorize(column, sort=True)
+    return codes.astype('int64'), len(uniques)
+
+
+def compute_all_standings(matches, keys=('Division', 'Temporada')):
+    """
+    Todas las clasificaciones de una vez, agrupadas por (keys..., Equipo)
+
+    Recibe los partidos concatenados de todas las divisiones y temporadas y
+    calcula cada tabla en una única operación vectorizada, incluido el orden
+    Pts/Dif/GF y la asignación de Pos dentro de cada grupo.
+
+    Args:
+        matches (DataFrame): Partidos limpios con las columnas de `keys`
+        keys (tuple): Columnas que identifican cada tabla. Los grupos salen en
+            orden de categorías (si son Categorical) o en orden ascendente
+
+    Returns:
+        DataFrame: keys + Pos + STANDINGS_COLUMNS, con Dif numérico
+    """
+    keys = list(keys)
+    n_matches = len(matches)
+
+    # Código de grupo (división, temporada, ...) por partido
+    group_codes = np.zeros(n_matches, dtype='int64')
+    for key in keys:
+        codes, n_values = _key_codes(matches[key])
+        group_codes = group_codes * n_values + codes
+
+    codes, teams = team_codes(matches)
+    n_teams = len(teams)
+
+    # Clave compacta (grupo, equipo): orden por grupo y alfabético dentro del grupo
+    pair = np.concatenate([group_codes, group_codes]) * n_teams + codes
+    pair_codes, pairs = pd.factorize(pair, sort=True)
+
+    stats = tally_standings(pair_codes[:n_matches], pair_codes[n_matches:], len(pairs), matches)
+    pair_group = pairs // n_teams
+    order = sort_order(stats, pair_group)
+
+    # Pos dentro de cada grupo
+    sorted_groups = pair_group[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+    pos = np.arange(len(order)) - np.repeat(starts, sizes) + 1
+
+    # Recuperar los valores de las claves desde el primer partido de cada grupo
+    first_match = pd.Series(np.arange(n_matches)).groupby(group_codes).first()
+    group_rows = first_match.reindex(sorted_groups).to_numpy()
+
+    columns = {key: matches[key].to_numpy()[group_rows] for key in keys}
+    columns['Pos'] = pos
+    columns['Equipo'] = np.asarray(teams, dtype=object)[pairs[order] % n_teams]
+    columns.update({col: stats[col][order] for col in STANDINGS_COLUMNS[1:]})
+    return pd.DataFrame(columns)[keys + ['Pos'] + STANDINGS_COLUMNS]
+
+
+def compact_standings(df):
+    """Clasificación con los tipos compactos de STANDINGS_DTYPES (las columnas presentes)"""
+    return df.astype({col: dtype for col, dtype in STANDINGS_DTYPES.items() if col in df.columns})
+
+
+def export_standings(df):
+    """Clasificación lista para CSV: Dif como texto con signo ('+42'), igual que el formato histórico"""
+    if pd.api.types.is_numeric_dtype(df['Dif']):
+        df = df.assign(Dif=format_dif(df['Dif']))
+    return df
+
+
+def format_dif(dif):
+    """Formatea la diferencia de goles como texto con signo ('+42', '0', '-7')"""
+    values = dif.to_numpy(dtype='int64').tolist()
+    return pd.Series([f"+{x}" if x > 0 else str(x) for x in values], index=dif.index, dtype=object)
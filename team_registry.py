@@ -0,0 +1,176 @@
+"""
+Registro canónico de equipos: grafía de football-data.co.uk → nombre → ID entero
+
+football-data.co.uk no siempre escribe igual el mismo club (espacios sobrantes,
+abreviaturas distintas según la temporada o la división). Antes los nombres se
+limpiaban celda a celda con clean_team_name y viajaban como texto libre por
+todas las uniones. Aquí:
+
+- canonical_name / normalize_team_names: strip (y alias, si MERGE_ALIASES) →
+  nombre canónico. La versión vectorizada solo trabaja sobre los nombres distintos (factorize) y
+  devuelve un Categorical (normalize_team_columns: local y visitante juntos)
+- TeamRegistry: IDs enteros compactos en orden alfabético, de modo que ordenar
+  por ID equivale a ordenar por nombre (desempates de clasificación, tracking)
+
+Los alias solo unen grafías distintas del mismo club y no se aplican por
+defecto: el dataset guardado, la base de datos y el tracking usan la grafía de
+football-data.co.uk de cada temporada. Las búsquedas por nombre sí los resuelven
+siempre (team_spellings): pedir 'Boston Utd' encuentra también las temporadas
+guardadas como 'Boston'. Los cambios de nombre (e.g., Gravesend → Ebbsfleet)
+conservan siempre el nombre de cada época.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Grafía alternativa → nombre canónico (la grafía más reciente de football-data.co.uk)
+TEAM_ALIASES = {
+    'AFC Telford United': 'Telford United',
+    'Boston': 'Boston Utd',
+}
+
+# Aplicar TEAM_ALIASES al normalizar. Cambia Equipo en las salidas (e.g., las
+# temporadas 2002-07 de Boston pasan a "Boston Utd"): hay que regenerar los
+# datasets guardados para que sus consultas por nombre sigan encontrando las filas
+MERGE_ALIASES = False
+
+
+def canonical_name(name):
+    """Nombre canónico de un equipo (None si es nulo)"""
+    if pd.isna(name):
+        return None
+    name = str(name).strip()
+    return TEAM_ALIASES.get(name, name) if MERGE_ALIASES else name
+
+
+def team_spellings(name):
+    """
+    Grafías del mismo club según TEAM_ALIASES, se apliquen o no al normalizar
+
+    Returns:
+        list: Nombres (ya canonicalizados) con los que el club puede estar
+        guardado, empezando por el pedido (vacía si es nulo)
+    """
+    if pd.isna(name):
+        return []
+    name = str(name).strip()
+    club = TEAM_ALIASES.get(name, name)
+    spellings = [name, club] + sorted(alias for alias, canonical in TEAM_ALIASES.items() if canonical == club)
+    return list(dict.fromkeys(canonical_name(spelling) for spelling in spellings))
+
+
+def _canonical_codes(values):
+    """
+    Códigos de categoría (alfabéticos) de un array de nombres
+
+    Solo se canonicaliza cada nombre distinto una vez (factorize); el resto es
+    indexar arrays.
+
+    Returns:
+        tuple: (códigos int64 con -1 para nulos, CategoricalDtype con los nombres canónicos)
+    """
+    codes, uniques = pd.factorize(values)
+    canonical = [canonical_name(name) for name in uniques]
+    categories = sorted(set(canonical))
+    position = {name: i for i, name in enumerate(categories)}
+    # Código de cada nombre distinto en las categorías canónicas (el último, -1 = nulo)
+    mapping = np.array([position[name] for name in canonical] + [-1], dtype='int64')
+    return mapping[codes], pd.CategoricalDtype(categories)
+
+
+def normalize_team_names(values):
+    """
+    Versión vectorizada de canonical_name para una columna completa
+
+    Args:
+        values (Series): Nombres tal como vienen en el CSV
+
+    Returns:
+        Series: Categorical con los nombres canónicos (categorías en orden alfabético;
+        nulos como NaN)
+    """
+    codes, dtype = _canonical_codes(values.to_numpy(dtype=object))
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=dtype), index=values.index, name=values.name)
+
+
+def normalize_team_columns(matches, columns=('HomeTeam', 'AwayTeam')):
+    """
+    Normaliza local y visitante de una vez, con las mismas categorías
+
+    Al compartir categorías (alfabéticas), compute_standings usa los códigos
+    del Categorical sin volver a factorizar los nombres.
+
+    Returns:
+        DataFrame: Copia de matches con las columnas normalizadas
+    """
+    columns = list(columns)
+    n_rows = len(matches)
+    codes, dtype = _canonical_codes(np.concatenate([matches[col].to_numpy(dtype=object) for col in columns]))
+    matches = matches.copy()
+    for i, col in enumerate(columns):
+        matches[col] = pd.Categorical.from_codes(codes[i * n_rows:(i + 1) * n_rows], dtype=dtype)
+    return matches
+
+
+class TeamRegistry:
+    """
+    Equipos con ID entero: el ID es la posición del nombre canónico en orden alfabético
+
+    Los IDs son estables para un mismo conjunto de equipos (se derivan de los
+    nombres, no del orden en que aparecen).
+    """
+
+    def __init__(self, names):
+        """
+        Args:
+            names (iterable): Nombres de equipos (se canonicalizan; se ignoran nulos y repetidos)
+        """
+        if not isinstance(names, (pd.Series, np.ndarray)):
+            names = list(names)
+        unique = pd.unique(pd.Series(names, dtype=object))
+        self.names = sorted({canonical_name(raw) for raw in unique} - {None})
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_matches(cls, matches):
+        """Registro con los equipos locales y visitantes de unos partidos"""
+        return cls(np.concatenate([
+            matches['HomeTeam'].to_numpy(dtype=object),
+            matches['AwayTeam'].to_numpy(dtype=object),
+        ]))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return self.team_id(name) is not None
+
+    def team_id(self, name):
+        """ID de un equipo (acepta alias: la grafía pedida o, si no está, otra del club); None si no está"""
+        for spelling in team_spellings(name):
+            if spelling in self.ids:
+                return self.ids[spelling]
+        return None
+
+    def encode(self, values):
+        """
+        IDs de una columna de nombres (acepta alias)
+
+        Args:
+            values (Series or array): Nombres de equipos
+
+        Returns:
+            ndarray: IDs int32 (-1 para nulos y equipos no registrados)
+        """
+        codes, uniques = pd.factorize(pd.Series(np.asarray(values, dtype=object)))
+        ids = [self.team_id(name) for name in uniques]
+        mapping = np.array([-1 if team_id is None else team_id for team_id in ids] + [-1], dtype='int32')
+        return mapping[codes]
+
+    def decode(self, ids):
+        """Nombres canónicos a partir de IDs"""
+        return np.asarray(self.names, dtype=object)[np.asarray(ids)]
+
+    def categorical(self, values):
+        """Columna Categorical con las categorías del registro (códigos = IDs)"""
+        return pd.Categorical.from_codes(self.encode(values), categories=self.names)
@@ -0,0 +1,195 @@
+"""
+Tracking longitudinal en formato largo: una fila por (equipo, temporada)
+
+La tabla ancha english_leagues_tracking.csv añade cuatro columnas por temporada
+({temporada}_Division/_Division_Num/_Pos/_Pts), casi todas vacías para los
+equipos de divisiones inferiores, y obliga a leerla entera. Aquí se guarda solo
+lo que existe: Equipo, Temporada, Division, Division_Num, Pos y Pts, ordenado por
+equipo y temporada. La vista ancha se materializa solo cuando se pide (wide_view).
+"""
+
+import numpy as np
+import pandas as pd
+
+from dataset_io import load_table, write_columnar
+from team_registry import team_spellings
+
+TRACKING_LONG_FILE = 'english_leagues_tracking_long.csv'
+TRACKING_LONG_COLUMNS = ['Equipo', 'Temporada', 'Division', 'Division_Num', 'Pos', 'Pts']
+TRACKING_FIELDS = ['Division', 'Division_Num', 'Pos', 'Pts']
+SUMMARY_COLUMNS = ['Total_Temporadas', 'Divisiones_Jugadas', 'Mejor_Division_Num',
+                   'Mejor_Division', 'Mejor_Posicion_Global']
+
+
+def build_tracking_long(df, division_order):
+    """
+    Tracking largo a partir del dataset completo
+
+    Args:
+        df (DataFrame): Dataset completo (Temporada, Division, Pos, Equipo, Pts, ...)
+        division_order (list): Jerarquía de divisiones (la primera = 1, la mejor)
+
+    Returns:
+        DataFrame: TRACKING_LONG_COLUMNS ordenado por Equipo y Temporada (orden
+        estable: si un equipo aparece dos veces en una temporada, se conserva el
+        orden del dataset)
+    """
+    division_map = {d: i + 1 for i, d in enumerate(division_order)}
+    # Orden por código entero de equipo (alfabético) y temporada, sin comparar cadenas
+    team_codes, _ = pd.factorize(df['Equipo'], sort=True)
+    season_codes, _ = pd.factorize(df['Temporada'], sort=True)
+    order = np.lexsort((season_codes, team_codes))
+    long_df = pd.DataFrame({
+        'Equipo': df['Equipo'].to_numpy(dtype=object),
+        'Temporada': df['Temporada'].to_numpy(dtype=object),
+        'Division': df['Division'].to_numpy(dtype=object),
+        'Division_Num': df['Division'].map(division_map).to_numpy(),
+        'Pos': df['Pos'].to_numpy(),
+        'Pts': df['Pts'].to_numpy(),
+    })
+    return long_df.iloc[order].reset_index(drop=True)
+
+
+def _summary_columns(long_df, all_teams):
+    """Métricas agregadas por equipo (Total_Temporadas, Mejor_Division, ...) en orden all_teams"""
+    inv_map = dict(zip(long_df['Division_Num'], long_df['Division']))
+    grouped = long_df.groupby('Equipo')
+    best_num = grouped['Division_Num'].min().reindex(all_teams)
+    global_score = long_df['Division_Num'] * 100 + long_df['Pos']
+    return {
+        'Total_Temporadas': grouped.size().reindex(all_teams).to_numpy(),
+        'Divisiones_Jugadas': grouped['Division'].nunique().reindex(all_teams).to_numpy(),
+        # Mejor división (numérica: menor = mejor)
+        'Mejor_Division_Num': best_num.to_numpy(),
+        'Mejor_Division': best_num.map(inv_map).to_numpy(),
+        # Mejor posición global
+        'Mejor_Posicion_Global': global_score.groupby(long_df['Equipo']).min().reindex(all_teams).to_numpy(),
+    }
+
+
+def wide_view(long_df):
+    """
+    Materializa la tabla ancha legacy (english_leagues_tracking.csv) desde el formato largo
+
+    Una fila por equipo con {temporada}_Division/_Division_Num/_Pos/_Pts y métricas
+    agregadas. Mismas columnas, tipos y orden que el tracking original: enteros en
+    las temporadas sin huecos, float con NaN en las demás.
+
+    Returns:
+        DataFrame: Tracking ordenado por Total_Temporadas (descendente) y Equipo
+    """
+    all_teams = sorted(long_df['Equipo'].unique())
+    all_seasons = sorted(long_df['Temporada'].unique())
+
+    # Un registro por (equipo, temporada): el primero, como hacía data.iloc[0]
+    first = long_df.drop_duplicates(['Equipo', 'Temporada'], keep='first')
+
+    pivots = {
+        field: first.pivot(index='Equipo', columns='Temporada', values=field)
+                    .reindex(index=all_teams, columns=all_seasons)
+        for field in TRACKING_FIELDS
+    }
+    arrays = {'Division': pivots['Division'].to_numpy(dtype=object)}
+    gaps = {}
+    for field in TRACKING_FIELDS[1:]:
+        arrays[field] = pivots[field].to_numpy(dtype='float64')
+        gaps[field] = np.isnan(arrays[field]).any(axis=0)
+
+    columns = {'Equipo': all_teams}
+    for j, season in enumerate(all_seasons):
+        columns[f'{season}_Division'] = arrays['Division'][:, j]
+        for field in TRACKING_FIELDS[1:]:
+            values = arrays[field][:, j]
+            # Como en DataFrame(list of dicts): entero sin huecos, float con None → NaN
+            columns[f'{season}_{field}'] = values if gaps[field][j] else values.astype('int64')
+
+    columns.update(_summary_columns(long_df, all_teams))
+
+    tracking_df = pd.DataFrame(columns)
+    # Orden estable: los empates en Total_Temporadas quedan por Equipo (orden de all_teams)
+    return tracking_df.sort_values('Total_Temporadas', ascending=False, kind='stable')
+
+
+class TrackingStore:
+    """
+    Tracking largo con índice por equipo
+
+    Las filas están ordenadas por equipo, así que el historial de un equipo es un
+    rango contiguo: team_history() lo recorta sin filtrar el resto de la tabla.
+    """
+
+    def __init__(self, data):
+        """
+        Args:
+            data (DataFrame): Tracking largo (TRACKING_LONG_COLUMNS)
+        """
+        data = data[TRACKING_LONG_COLUMNS]
+        teams = data['Equipo'].to_numpy(dtype=object)
+        if len(teams) and not (teams[:-1] <= teams[1:]).all():
+            data = data.sort_values(['Equipo', 'Temporada'], kind='stable')
+        self.data = data.reset_index(drop=True)
+
+        # Índice por equipo: {equipo: (primera fila, última fila + 1)}
+        teams = self.data['Equipo'].to_numpy(dtype=object)
+        unique, starts = np.unique(teams, return_index=True)
+        stops = np.r_[starts[1:], len(teams)]
+        self._index = dict(zip(unique, zip(starts.tolist(), stops.tolist())))
+
+    @classmethod
+    def from_dataset(cls, df, division_order):
+        """Construye el store a partir del dataset completo (english_leagues_completo)"""
+        return cls(build_tracking_long(df, division_order))
+
+    @classmethod
+    def load(cls, path=TRACKING_LONG_FILE):
+        """Carga el store guardado (Parquet si está disponible, si no CSV)"""
+        data = load_table(path)
+        for col in ('Equipo', 'Temporada', 'Division'):
+            data[col] = data[col].astype(object)
+        return cls(data)
+
+    def save(self, path=TRACKING_LONG_FILE):
+        """Guarda el store como CSV (y Parquet si pyarrow está disponible)"""
+        self.data.to_csv(path, index=False, encoding='utf-8-sig')
+        write_columnar(self.data, path)
+        return path
+
+    @property
+    def teams(self):
+        """Equipos del store en orden alfabético"""
+        return list(self._index)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, team):
+        return any(spelling in self._index for spelling in team_spellings(team))
+
+    def team_history(self, team):
+        """
+        Trayectoria de un equipo, temporada a temporada
+
+        Args:
+            team (str): Nombre del equipo o un alias (e.g., 'Leicester', 'Boston')
+
+        Returns:
+            DataFrame: Filas del club (todas sus grafías) ordenadas por Temporada
+            (vacío si no existe)
+        """
+        ranges = [self._index[spelling] for spelling in team_spellings(team) if spelling in self._index]
+        if len(ranges) > 1:
+            history = pd.concat([self.data.iloc[start:stop] for start, stop in ranges])
+            return history.sort_values('Temporada', kind='stable')
+        start, stop = ranges[0] if ranges else (0, 0)
+        return self.data.iloc[start:stop]
+
+    def summary(self):
+        """Métricas agregadas por equipo (las columnas no temporales del tracking ancho)"""
+        all_teams = self.teams
+        columns = {'Equipo': all_teams}
+        columns.update(_summary_columns(self.data, all_teams))
+        return pd.DataFrame(columns).sort_values('Total_Temporadas', ascending=False, kind='stable')
+
+    def wide(self):
+        """Vista ancha legacy, materializada bajo demanda"""
+        return wide_view(self.data)